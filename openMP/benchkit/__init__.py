@@ -0,0 +1,16 @@
+"""
+Shared analysis helpers for the OpenMP tasks
+
+Task scripts add the openMP/ directory to sys.path and import from here:
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from benchkit import Schema, summarize
+"""
+
+from .online import OnlineAggregator, OnlineStats, P2Quantile
+from .stats import STATISTICS, Schema, aggregate, add_speedup, add_speedup_records, summarize
+
+__all__ = [
+    'STATISTICS', 'Schema', 'aggregate', 'add_speedup', 'add_speedup_records', 'summarize',
+    'OnlineAggregator', 'OnlineStats', 'P2Quantile',
+]
@@ -0,0 +1,96 @@
+"""
+Import-time benchmark for the analysis scripts
+
+Loads every openMP/task*/analysis/*.py in a fresh interpreter (without
+running main), takes the median wall time over several repetitions and
+lists the heavy modules that were imported on the way. Scripts are
+expected to load pandas, numpy and matplotlib lazily, so import alone
+should pull in none of them.
+
+    python3 -m benchkit.importtime
+    python3 -m benchkit.importtime --repeat 10 --check
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+OPENMP_ROOT = Path(__file__).resolve().parents[1]
+HEAVY = ('pandas', 'numpy', 'matplotlib', 'seaborn', 'scipy')
+
+_PROBE = '''
+import importlib.util, json, sys, time
+path = sys.argv[1]
+sys.path.insert(0, sys.argv[2])
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location('_probe', path)
+spec.loader.exec_module(importlib.util.module_from_spec(spec))
+elapsed = (time.perf_counter() - start) * 1000.0
+heavy = sorted(m for m in sys.argv[3].split(',') if m in sys.modules)
+print(json.dumps({'ms': elapsed, 'heavy': heavy}))
+'''
+
+
+def scripts(root=OPENMP_ROOT):
+    return sorted(root.glob('task*/analysis/*.py'))
+
+
+def probe(path):
+    """Import time (ms) and heavy modules loaded for one script"""
+    out = subprocess.run(
+        [sys.executable, '-c', _PROBE, str(path), str(path.parent), ','.join(HEAVY)],
+        capture_output=True, text=True, check=True, cwd=path.parent,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def interpreter_ms():
+    """Start-up time of a bare interpreter, for reference"""
+    import time
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', 'pass'], check=True)
+    return (time.perf_counter() - start) * 1000.0
+
+
+def measure(paths, repeat):
+    results = []
+    for path in paths:
+        runs = [probe(path) for _ in range(repeat)]
+        results.append({
+            'script': str(path.relative_to(OPENMP_ROOT)),
+            'import_ms': statistics.median(run['ms'] for run in runs),
+            'heavy': runs[-1]['heavy'],
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import time of the analysis scripts")
+    parser.add_argument('scripts', nargs='*', help="scripts to measure (default: all)")
+    parser.add_argument('--repeat', type=int, default=5, help="runs per script (default: 5)")
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    parser.add_argument('--check', action='store_true',
+                        help="exit with status 1 if any script imports a heavy module")
+    args = parser.parse_args()
+
+    paths = [Path(p).resolve() for p in args.scripts] or scripts()
+    results = measure(paths, max(1, args.repeat))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"Interpreter start-up: {interpreter_ms():.1f} ms\n")
+        print(f"{'Script':<50} {'Import (ms)':>12}  Heavy modules")
+        print('-' * 80)
+        for row in results:
+            print(f"{row['script']:<50} {row['import_ms']:>12.1f}  {', '.join(row['heavy']) or '-'}")
+
+    if args.check and any(row['heavy'] for row in results):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
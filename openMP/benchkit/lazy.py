@@ -0,0 +1,57 @@
+"""
+Deferred imports for the analysis scripts
+
+pandas, numpy and matplotlib take most of a script's start-up time, yet
+usage errors, text summaries, tables and fully cached plot runs never need
+some of them. Scripts bind them with lazy_import() instead:
+
+    plt = lazy_import('matplotlib.pyplot', setup=set_style)
+
+The module is imported on the first attribute access, `setup` then runs
+once (e.g. to apply the plot style) followed by the hooks registered with
+on_import().
+"""
+
+import importlib
+
+_hooks = []
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first use"""
+
+    def __init__(self, name, setup=None):
+        self.__dict__.update(_name=name, _setup=setup, _module=None)
+
+    def _load(self):
+        module = self.__dict__['_module']
+        if module is None:
+            module = importlib.import_module(self.__dict__['_name'])
+            self.__dict__['_module'] = module
+            if self.__dict__['_setup'] is not None:
+                self.__dict__['_setup'](module)
+            for hook in _hooks:
+                hook()
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = 'loaded' if self.__dict__['_module'] is not None else 'not loaded'
+        return f"<lazy module '{self.__dict__['_name']}' ({state})>"
+
+
+def lazy_import(name, setup=None):
+    return LazyModule(name, setup)
+
+
+def on_import(hook):
+    """Call hook() after every lazy module is loaded"""
+    _hooks.append(hook)
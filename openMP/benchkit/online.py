@@ -0,0 +1,146 @@
+"""
+Constant-memory online statistics for streamed benchmark records
+
+OnlineStats keeps count, Welford mean/variance, min/max and a P-square
+median estimate for one configuration; OnlineAggregator keeps one
+OnlineStats per configuration key. Memory depends only on the number of
+configurations, never on the number of runs.
+"""
+
+import math
+
+
+class P2Quantile:
+    """P-square streaming quantile estimator (Jain & Chlamtac, 1985)
+
+    Tracks five markers instead of the samples; exact for the first five
+    observations, then an O(1)-per-update approximation.
+    """
+
+    def __init__(self, p=0.5):
+        self.p = p
+        self.n = 0
+        self.q = []
+        self.pos = [1, 2, 3, 4, 5]
+        self.desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self.step = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, x):
+        self.n += 1
+        if self.n <= 5:
+            self.q.append(x)
+            self.q.sort()
+            return
+
+        q, pos = self.q, self.pos
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            pos[i] += 1
+        for i in range(5):
+            self.desired[i] += self.step[i]
+
+        for i in range(1, 4):
+            d = self.desired[i] - pos[i]
+            if (d >= 1 and pos[i + 1] - pos[i] > 1) or (d <= -1 and pos[i - 1] - pos[i] < -1):
+                d = 1 if d > 0 else -1
+                candidate = self._parabolic(i, d)
+                if not q[i - 1] < candidate < q[i + 1]:
+                    candidate = q[i] + d * (q[i + d] - q[i]) / (pos[i + d] - pos[i])
+                q[i] = candidate
+                pos[i] += d
+
+    def _parabolic(self, i, d):
+        q, n = self.q, self.pos
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+
+    def value(self):
+        if self.n == 0:
+            return math.nan
+        if self.n <= 5:
+            # Exact quantile with linear interpolation, as numpy/pandas do
+            idx = self.p * (self.n - 1)
+            lo = int(math.floor(idx))
+            hi = min(lo + 1, self.n - 1)
+            return self.q[lo] + (self.q[hi] - self.q[lo]) * (idx - lo)
+        return self.q[2]
+
+
+class OnlineStats:
+    """Welford mean/variance, min/max and streaming median of one series"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.median = P2Quantile(0.5)
+
+    def add(self, x):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+        self.median.add(x)
+
+    def std(self, ddof=1):
+        """Standard deviation; ddof=1 is the sample std, like pandas"""
+        if self.count <= ddof:
+            return math.nan
+        return math.sqrt(self.m2 / (self.count - ddof))
+
+    def summary(self, ddof=1):
+        return {
+            'mean': self.mean,
+            'median': self.median.value(),
+            'std': self.std(ddof),
+            'min': self.min,
+            'max': self.max,
+            'count': self.count,
+        }
+
+
+class OnlineAggregator:
+    """OnlineStats per configuration key, fed one record at a time"""
+
+    def __init__(self, keys, value, ddof=1):
+        self.keys = list(keys)
+        self.value = value
+        self.ddof = ddof
+        self.groups = {}
+        self.records = 0
+
+    def add(self, record):
+        key = tuple(record[k] for k in self.keys)
+        stats = self.groups.get(key)
+        if stats is None:
+            stats = self.groups[key] = OnlineStats()
+        stats.add(float(record[self.value]))
+        self.records += 1
+
+    def rows(self, names=None):
+        """One dict per configuration with statistics renamed via names"""
+        names = names or {}
+        rows = []
+        for key in sorted(self.groups):
+            row = dict(zip(self.keys, key))
+            for stat, value in self.groups[key].summary(self.ddof).items():
+                row[names.get(stat, stat)] = value
+            rows.append(row)
+        return rows
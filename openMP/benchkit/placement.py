@@ -0,0 +1,102 @@
+"""
+Speedup curves split by placement policy
+
+Every binary records the policy it ran under in a 'placement' column,
+"<memory>/<bind>/<places>" (e.g. "interleave/spread/cores", see
+common/bench_numa.h). Schema groups by it, so each policy's speedup is
+relative to its own single-thread run; the helpers here put the policies
+side by side, summarizing all configurations of a task at each thread
+count by their median and best speedup.
+"""
+
+import math
+import os
+
+from .lazy import lazy_import
+
+plt = lazy_import('matplotlib.pyplot')
+
+PLACEMENT = 'placement'
+UNRECORDED = 'unrecorded'
+
+
+def _records(stats):
+    if hasattr(stats, 'loc'):
+        return stats.to_dict('records')
+    return list(stats)
+
+
+def speedup_curves(stats, threads, speedup='speedup'):
+    """{placement: [(threads, median speedup, best speedup, configurations)]}"""
+    samples = {}
+    for row in _records(stats):
+        value = row.get(speedup)
+        count = row.get(threads)
+        if value is None or count is None or isinstance(value, float) and math.isnan(value):
+            continue
+        placement = row.get(PLACEMENT) or UNRECORDED
+        samples.setdefault(placement, {}).setdefault(int(count), []).append(float(value))
+
+    curves = {}
+    for placement, by_threads in sorted(samples.items()):
+        curve = []
+        for count, values in sorted(by_threads.items()):
+            values.sort()
+            mid = len(values) // 2
+            median = values[mid] if len(values) % 2 else (values[mid - 1] + values[mid]) / 2
+            curve.append((count, median, values[-1], len(values)))
+        curves[placement] = curve
+    return curves
+
+
+def recorded(curves):
+    """True if any result carries a placement label"""
+    return any(placement != UNRECORDED for placement in curves)
+
+
+def print_placement_summary(stats, threads, speedup='speedup'):
+    """Median/best speedup per thread count for every placement policy"""
+    curves = speedup_curves(stats, threads, speedup)
+    if not recorded(curves):
+        return
+
+    print("\n" + "=" * 80)
+    print("SPEEDUP BY PLACEMENT POLICY (over all configurations)")
+    print("=" * 80)
+    for placement, curve in curves.items():
+        print(f"\n  {placement}:")
+        print(f"    {'Threads':<10} {'Median':<12} {'Best':<12} {'Configs':<8}")
+        print(f"    {'-'*10} {'-'*12} {'-'*12} {'-'*8}")
+        for count, median, best, configs in curve:
+            print(f"    {count:<10} {median:<12.2f} {best:<12.2f} {configs:<8}")
+
+
+def plot_placement_speedup(stats, output_dir, threads, speedup='speedup'):
+    """placement_speedup.png: one median (and best) speedup curve per policy"""
+    curves = speedup_curves(stats, threads, speedup)
+    if not recorded(curves):
+        return
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    max_threads = max(count for curve in curves.values() for count, *_ in curve)
+    ax.plot([1, max_threads], [1, max_threads], 'k--', linewidth=2,
+            label='Ideal Speedup', alpha=0.5)
+
+    for placement, curve in curves.items():
+        counts = [point[0] for point in curve]
+        line, = ax.plot(counts, [point[1] for point in curve], marker='o',
+                        linewidth=2, markersize=8, label=f'{placement} (median)')
+        ax.plot(counts, [point[2] for point in curve], linestyle=':', marker='^',
+                color=line.get_color(), alpha=0.7, label=f'{placement} (best)')
+
+    ax.set_xlabel('Number of Threads', fontsize=12)
+    ax.set_ylabel('Speedup', fontsize=12)
+    ax.set_title('Speedup by Placement Policy', fontsize=14, fontweight='bold')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    output_file = os.path.join(output_dir, 'placement_speedup.png')
+    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    print(f"✓ Saved: {output_file}")
+    plt.close()
@@ -0,0 +1,106 @@
+"""
+Content-hashed cache of rendered figures
+
+Every Job is fingerprinted by the code of its plot function, its arguments
+and the exact statistics slice it draws. The code part covers the whole
+plot module, the sibling modules it imported (e.g. analyze.py) and benchkit
+itself, so an edit to a helper or a module constant also redraws. graphs/.plot_manifest.json maps
+each job to that fingerprint and to the files it saved; on the next run a
+job whose fingerprint is unchanged and whose files still exist is skipped.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+MANIFEST = '.plot_manifest.json'
+
+
+def _data_bytes(data):
+    if hasattr(data, 'loc'):
+        import pandas as pd
+        columns = ','.join(map(str, data.columns)).encode()
+        rows = pd.util.hash_pandas_object(data, index=False).values.tobytes()
+        return columns + b'\0' + rows
+    return json.dumps(data, sort_keys=True, default=str).encode()
+
+
+def _source(func):
+    import inspect
+    try:
+        return inspect.getsource(func)
+    except (OSError, TypeError):
+        return func.__qualname__
+
+
+def _read(path):
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return b''
+
+
+@functools.lru_cache(maxsize=None)
+def _code_stamp(module_file):
+    """Hash of a plot module, the loaded modules next to it and benchkit"""
+    package = Path(__file__).resolve().parent
+    files = set(package.glob('*.py'))
+    if module_file:
+        home = Path(module_file).resolve().parent
+        files.add(Path(module_file).resolve())
+        for module in list(sys.modules.values()):
+            path = getattr(module, '__file__', None)
+            if path and path.endswith('.py') and Path(path).resolve().parent == home:
+                files.add(Path(path).resolve())
+    digest = hashlib.sha256()
+    for path in sorted(files):
+        digest.update(str(path.name).encode() + b'\0' + _read(path) + b'\0')
+    return digest.hexdigest()
+
+
+def fingerprint(job, data):
+    """Hash of the plot code, its arguments and its statistics slice"""
+    module = sys.modules.get(getattr(job.func, '__module__', None))
+    digest = hashlib.sha256()
+    digest.update(_source(job.func).encode())
+    digest.update(_code_stamp(getattr(module, '__file__', None)).encode())
+    digest.update(repr([str(arg) for arg in job.args]).encode())
+    digest.update(_data_bytes(data))
+    return digest.hexdigest()
+
+
+class Manifest:
+    """Job name -> {hash, outputs} for one graphs directory"""
+
+    def __init__(self, directory):
+        self.path = Path(directory) / MANIFEST
+        try:
+            with open(self.path, 'r') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+        self.updated = {}
+
+    def fresh(self, name, digest):
+        """Outputs of an unchanged job, or None if it must be redrawn"""
+        entry = self.entries.get(name)
+        if not entry or entry.get('hash') != digest or not entry.get('outputs'):
+            return None
+        if not all(os.path.exists(path) for path in entry['outputs']):
+            return None
+        return entry['outputs']
+
+    def record(self, name, digest, outputs):
+        self.updated[name] = {'hash': digest, 'outputs': sorted(set(outputs))}
+
+    def save(self):
+        """Write entries of this run only, so removed figures drop out"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(self.updated, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
@@ -0,0 +1,246 @@
+"""
+Concurrent figure rendering for the plot_graphs.py scripts
+
+A report is a list of Jobs, each calling one plot function as
+func(data, *args). Jobs run in a process pool; the statistics are handed
+to every worker once through the pool initializer (inherited on fork,
+pickled once per worker on spawn) instead of once per figure. Output of
+each job is captured and printed in submission order, so the log is the
+same for any number of workers.
+
+Jobs can select a slice of the statistics with `where`, e.g. one job per
+problem size for functions that draw one figure per size. per_placement()
+repeats a set of jobs for every placement policy, each into its own
+subdirectory.
+
+Given a graphs directory, render() skips jobs whose code, arguments and
+statistics slice are unchanged since the last run (see plotcache);
+--force redraws everything.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+
+from pathlib import Path
+
+from .lazy import on_import
+from .placement import PLACEMENT
+from .plotcache import Manifest, fingerprint
+
+_shared = None
+_saved = []
+
+
+class Job:
+    """One plot function call: func(select(data, where), *args)"""
+
+    def __init__(self, func, *args, where=None, title=None):
+        self.func = func
+        self.args = args
+        self.where = dict(where or {})
+        self.title = title
+
+    @property
+    def name(self):
+        parts = [self.func.__name__]
+        parts += [f'{k}={v}' for k, v in sorted(self.where.items())]
+        return ' '.join(parts)
+
+
+def select(data, where):
+    """Rows of a DataFrame or list of dicts matching all where items"""
+    if not where:
+        return data
+    if hasattr(data, 'loc'):
+        mask = True
+        for column, value in where.items():
+            mask = mask & (data[column] == value)
+        return data[mask]
+    return [row for row in data if all(row[k] == v for k, v in where.items())]
+
+
+def combinations(data, columns):
+    """Sorted distinct value tuples of the given columns"""
+    if hasattr(data, 'loc'):
+        rows = data[list(columns)].drop_duplicates().itertuples(index=False, name=None)
+    else:
+        rows = (tuple(row[c] for c in columns) for row in data)
+    return sorted(set(rows))
+
+
+def split(data, func, columns, *args, title=None, where=None):
+    """One job per distinct value of columns (e.g. one figure per size)
+
+    where fixes further columns for every job (e.g. one placement policy).
+    """
+    if isinstance(columns, str):
+        columns = (columns,)
+    base = dict(where or {})
+    jobs = [Job(func, *args, where={**base, **dict(zip(columns, combo))})
+            for combo in combinations(select(data, base), columns)]
+    if jobs:
+        jobs[0].title = title
+    return jobs
+
+
+def per_placement(data, output_dir, build):
+    """Jobs of build(directory, where) for every placement policy in data
+
+    With at most one policy recorded, build is called once with output_dir
+    and no filter. With several, each policy gets its own subdirectory
+    (named after the policy) and a where filter. Lines of per-method figures
+    then never join points from different policies. Cross-policy figures
+    (plot_placement_speedup) are added outside.
+    """
+    policies = sorted(value for (value,) in combinations(data, [PLACEMENT])) \
+        if _has_column(data, PLACEMENT) else []
+    if len(policies) <= 1:
+        return list(build(output_dir, {}))
+    jobs = []
+    for policy in policies:
+        directory = Path(output_dir) / policy.replace('/', '_')
+        directory.mkdir(parents=True, exist_ok=True)
+        group = list(build(directory, {PLACEMENT: policy}))
+        if group:
+            header = f"\nPlacement {policy} -> {directory}"
+            title = (group[0].title or '').lstrip('\n')
+            group[0].title = f"{header}\n{title}" if title else header
+        jobs += group
+    return jobs
+
+
+def _has_column(data, column):
+    if hasattr(data, 'loc'):
+        return column in data.columns
+    return any(column in row for row in data)
+
+
+def default_jobs():
+    return os.cpu_count() or 1
+
+
+def parse_options(argv=None):
+    """Take -j/--jobs N and --force out of the command line
+
+    Returns the parsed options; sys.argv keeps the remaining arguments so
+    existing sys.argv[1] handling in the scripts is unaffected.
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('-j', '--jobs', type=int, default=default_jobs())
+    parser.add_argument('--force', action='store_true')
+    options, rest = parser.parse_known_args(sys.argv[1:] if argv is None else argv)
+    if argv is None:
+        sys.argv[1:] = rest
+    options.jobs = max(1, options.jobs)
+    return options
+
+
+def _init_worker(data):
+    global _shared
+    if 'matplotlib' in sys.modules:
+        sys.modules['matplotlib'].use('Agg')
+    else:
+        os.environ['MPLBACKEND'] = 'Agg'
+    _shared = data
+
+
+def _track_saves():
+    """Record the files saved by Figure.savefig once matplotlib is loaded
+
+    Scripts import pyplot lazily, so jobs that only write tables (and
+    runs where every figure is cached) never load matplotlib at all.
+    """
+    figure = sys.modules.get('matplotlib.figure')
+    if figure is None or hasattr(figure.Figure.savefig, '_benchkit'):
+        return
+    savefig = figure.Figure.savefig
+
+    def recording(self, fname, *args, **kwargs):
+        if isinstance(fname, (str, os.PathLike)):
+            _saved.append(os.path.abspath(fname))
+        return savefig(self, fname, *args, **kwargs)
+
+    recording._benchkit = True
+    figure.Figure.savefig = recording
+
+
+on_import(_track_saves)
+
+
+def _run(job):
+    """Call the job, returning its printed output and the files it saved"""
+    del _saved[:]
+    _track_saves()
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        job.func(select(_shared, job.where), *job.args)
+    return buffer.getvalue(), list(_saved)
+
+
+def _print(job, output):
+    if job.title:
+        print(job.title)
+    sys.stdout.write(output)
+    sys.stdout.flush()
+
+
+def render(jobs, data, options=None, cache=None):
+    """Run all jobs, concurrently when options.jobs > 1; output in job order
+
+    With a cache directory, jobs whose fingerprint matches the manifest
+    there are reused instead of redrawn. Jobs that save no figure (text
+    summaries) always run. Job names key the manifest, so they must be unique.
+    """
+    jobs = list(jobs)
+    names = [job.name for job in jobs]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    assert not duplicates, f"Job names key the plot cache and must be unique: {duplicates}"
+    workers = options.jobs if options else default_jobs()
+    force = options.force if options else False
+
+    manifest = Manifest(cache) if cache is not None else None
+    digests = {}
+    reused = {}
+    if manifest is not None:
+        for job in jobs:
+            digests[job.name] = fingerprint(job, select(data, job.where))
+            outputs = None if force else manifest.fresh(job.name, digests[job.name])
+            if outputs is not None:
+                reused[job.name] = outputs
+    pending = [job for job in jobs if job.name not in reused]
+    workers = min(workers, len(pending))
+
+    redrawn = 0
+    with contextlib.ExitStack() as stack:
+        if workers <= 1:
+            _init_worker(data)
+            results = (_run(job) for job in pending)
+        else:
+            import multiprocessing
+            # Leaving the block terminates the workers, also when a job raises
+            pool = stack.enter_context(
+                multiprocessing.Pool(workers, initializer=_init_worker, initargs=(data,)))
+            results = pool.imap(_run, pending)
+
+        for job in jobs:
+            if job.name in reused:
+                if job.title:
+                    print(job.title)
+                for path in reused[job.name]:
+                    print(f"↺ Reused: {os.path.relpath(path)}")
+                if manifest is not None:
+                    manifest.record(job.name, digests[job.name], reused[job.name])
+                continue
+            output, saved = next(results)
+            _print(job, output)
+            redrawn += len(set(saved))
+            if manifest is not None and saved:
+                manifest.record(job.name, digests[job.name], saved)
+
+    if manifest is not None:
+        manifest.save()
+        count = sum(len(outputs) for outputs in reused.values())
+        print(f"Figures: {redrawn} redrawn, {count} reused")
@@ -0,0 +1,185 @@
+"""
+Vectorized statistics engine shared by the per-task analyze.py scripts
+
+Every task describes its results with a Schema (configuration columns,
+time column, baseline rule); summarize() then computes the run statistics
+with a single groupby and attaches speedup/efficiency with a single merge
+against the baseline frame, so the cost grows linearly with the row count.
+"""
+
+import math
+
+from .lazy import lazy_import
+
+pd = lazy_import('pandas')
+
+STATISTICS = ('mean', 'median', 'std', 'min', 'max', 'count')
+
+# Columns every binary records that older result files lack: grouped by
+# when present, filled with the default otherwise
+OPTIONAL_KEYS = {'placement': 'unrecorded'}
+
+
+class Schema:
+    """Description of one task's benchmark table
+
+    keys         - configuration columns a run is grouped by (incl. threads)
+    time         - column holding the measured time of one run
+    threads      - thread count column used for efficiency
+    baseline     - {column: value} selecting the baseline configurations
+                   (default: the single-thread run of every configuration)
+    baseline_on  - columns a configuration shares with its baseline
+                   (default: all keys except the threads column)
+    speedup_from - statistic the speedup is computed from ('mean'/'median')
+    names        - {statistic: output column} renames, e.g. {'mean': 'time_mean'}
+    extra        - {output column: (input column, aggfunc)} extra aggregations
+    keep_baseline   - keep baseline rows in the result
+    fill_missing    - speedup/efficiency for rows without a baseline
+                      (None drops those rows)
+    baseline_column - keep the baseline time under this column name
+    efficiency_scale - 1.0 for fractions, 100.0 for percent
+    optional     - {column: default} keys that older results may lack; they
+                   are appended to keys and baseline_on, so e.g. every
+                   placement policy gets its own baseline
+    ddof         - delta degrees of freedom of the std: 1 (sample std, the
+                   pandas default) or 0 (population std, like np.std)
+    """
+
+    def __init__(self, keys, time='execution_time_ms', threads='num_threads',
+                 baseline=None, baseline_on=None, speedup_from='mean',
+                 names=None, extra=None, keep_baseline=True, fill_missing=None,
+                 baseline_column=None, efficiency_scale=1.0, optional=None, ddof=1):
+        self.optional = dict(OPTIONAL_KEYS if optional is None else optional)
+        self.keys = list(keys) + [k for k in self.optional if k not in keys]
+        self.time = time
+        self.threads = threads
+        self.baseline = dict(baseline) if baseline else {threads: 1}
+        if baseline_on is None:
+            baseline_on = [k for k in self.keys if k != threads]
+        self.baseline_on = list(baseline_on) + [
+            k for k in self.optional if k not in baseline_on and k not in self.baseline]
+        self.speedup_from = speedup_from
+        self.names = dict(names or {})
+        self.extra = dict(extra or {})
+        self.keep_baseline = keep_baseline
+        self.fill_missing = fill_missing
+        self.baseline_column = baseline_column
+        self.efficiency_scale = efficiency_scale
+        self.ddof = ddof
+
+    def column(self, statistic):
+        """Output column name of a time statistic"""
+        return self.names.get(statistic, statistic)
+
+    def fill(self, df):
+        """Frame with the optional key columns present and without gaps"""
+        missing = {k: v for k, v in self.optional.items() if k not in df.columns}
+        if missing:
+            df = df.assign(**missing)
+        gaps = {k: v for k, v in self.optional.items() if df[k].isna().any()}
+        return df.fillna(gaps) if gaps else df
+
+    def fill_record(self, record):
+        """fill() for one record dict (streaming paths)"""
+        for column, default in self.optional.items():
+            if record.get(column) in (None, ''):
+                record[column] = default
+        return record
+
+
+def aggregate(df, schema):
+    """Per-configuration run statistics with one groupby"""
+    named = {schema.column(s): (schema.time, s) for s in STATISTICS}
+    named.update(schema.extra)
+    df = schema.fill(df)
+    stats = df.groupby(schema.keys, sort=True).agg(**named).reset_index()
+    if schema.ddof != 1:
+        # Rescale the sample std instead of a per-group Python callable;
+        # a single run has population std 0 (pandas gives NaN for ddof=1)
+        std = schema.column('std')
+        n = stats[schema.column('count')]
+        scale = ((n - 1) / (n - schema.ddof)).where(n > schema.ddof)
+        stats[std] = stats[std].fillna(0.0) * scale ** 0.5
+    return stats
+
+
+def _baseline_mask(stats, schema):
+    mask = pd.Series(True, index=stats.index)
+    for column, value in schema.baseline.items():
+        mask &= stats[column] == value
+    return mask
+
+
+def add_speedup(stats, schema):
+    """Attach speedup/efficiency by merging against the baseline frame"""
+    time_col = schema.column(schema.speedup_from)
+    on = schema.baseline_on
+
+    base = stats.loc[_baseline_mask(stats, schema), on + [time_col]]
+    base = base.drop_duplicates(on).rename(columns={time_col: '_baseline'})
+
+    how = 'inner' if schema.fill_missing is None else 'left'
+    out = stats.merge(base, on=on, how=how)
+
+    out['speedup'] = out['_baseline'] / out[time_col]
+    threads = out[schema.threads].where(out[schema.threads] > 0)
+    out['efficiency'] = (out['speedup'] / threads).fillna(0.0) * schema.efficiency_scale
+
+    if schema.fill_missing is not None:
+        missing = out['_baseline'].isna() | (out['_baseline'] <= 0)
+        out.loc[missing, ['speedup', 'efficiency']] = schema.fill_missing
+
+    if not schema.keep_baseline:
+        out = out[~_baseline_mask(out, schema)]
+
+    if schema.baseline_column:
+        out = out.rename(columns={'_baseline': schema.baseline_column})
+    else:
+        out = out.drop(columns='_baseline')
+
+    return out.reset_index(drop=True)
+
+
+def add_speedup_records(rows, schema):
+    """add_speedup for a list of dicts, for summary paths without pandas"""
+    time_col = schema.column(schema.speedup_from)
+
+    def is_baseline(row):
+        return all(row[column] == value for column, value in schema.baseline.items())
+
+    def config(row):
+        return tuple(row[column] for column in schema.baseline_on)
+
+    base = {}
+    for row in rows:
+        if is_baseline(row):
+            base.setdefault(config(row), row[time_col])
+
+    out = []
+    for row in rows:
+        baseline = base.get(config(row))
+        if baseline is None and schema.fill_missing is None:
+            continue
+        if not schema.keep_baseline and is_baseline(row):
+            continue
+
+        row = dict(row)
+        if baseline is None:
+            speedup = math.nan
+        else:
+            speedup = baseline / row[time_col] if row[time_col] else math.inf
+        threads = row[schema.threads]
+        efficiency = speedup / threads if threads > 0 and not math.isnan(speedup) else 0.0
+        row['speedup'] = speedup
+        row['efficiency'] = efficiency * schema.efficiency_scale
+        if schema.fill_missing is not None and (baseline is None or not baseline > 0):
+            row['speedup'] = row['efficiency'] = schema.fill_missing
+        if schema.baseline_column:
+            row[schema.baseline_column] = math.nan if baseline is None else baseline
+        out.append(row)
+    return out
+
+
+def summarize(df, schema):
+    """Statistics plus speedup/efficiency for a raw results frame"""
+    return add_speedup(aggregate(df, schema), schema)
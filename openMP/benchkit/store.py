@@ -0,0 +1,290 @@
+"""
+Columnar, memory-mapped store for all benchmark results
+
+`ingest` converts openMP/*/results/benchmark_*.json|csv and
+openMPI/task*/data*.csv into one directory of .npy columns with a
+normalized schema:
+
+    task, kernel, method, schedule,
+    placement, source                        category codes (int32)
+    size, threads, chunk, run                integers (-1 / 0 when absent)
+    time_ms, result                          float64 (NaN when absent)
+
+String columns are stored as codes into sorted category dictionaries
+(categories.json). Rows are sorted by the index key
+(task, kernel, method, size, threads, placement), so a lookup by any prefix of that
+key is a chain of binary searches over the memory-mapped columns.
+
+    python3 -m benchkit.store ingest
+    python3 -m benchkit.store query task=openMP/task1_min_max kernel=min
+"""
+
+import argparse
+import csv
+import json
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from .placement import PLACEMENT, UNRECORDED
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_STORE = REPO_ROOT / 'openMP' / 'store'
+
+INDEX = ('task', 'kernel', 'method', 'size', 'threads', PLACEMENT)
+CATEGORICAL = ('task', 'kernel', 'method', 'schedule', PLACEMENT, 'source')
+INTEGER = {'size': np.int64, 'threads': np.int32, 'chunk': np.int32, 'run': np.int32}
+FLOAT = ('time_ms', 'result')
+COLUMNS = CATEGORICAL + tuple(INTEGER) + FLOAT
+
+# Source column names for each normalized column, first match wins
+ALIASES = {
+    'kernel': ['operation', 'function', 'matrix_type', 'Operation', 'Algorithm', 'Mode', 'Label'],
+    'method': ['method', 'Method'],
+    'schedule': ['schedule'],
+    'size': ['size', 'vector_size', 'N', 'array_size', 'num_iterations',
+             'Elements', 'MatrixSize', 'DataSize', 'Bytes'],
+    'threads': ['threads', 'num_threads', 'Processes', 'Procs'],
+    'chunk': ['chunk_size'],
+    'run': ['run', 'iteration'],
+    'time_ms': ['time_ms', 'execution_time_ms', 'total_time_ms'],
+    'result': ['result', 'result_value', 'Result', 'GlobalMin'],
+}
+
+# openMPI time columns are in seconds
+SECONDS = ['Time']
+
+# openMPI tables that report two methods side by side in one row
+WIDE_TIMES = {
+    'BlockingTime': 'blocking',
+    'NonBlockingTime': 'nonblocking',
+    'CustomTime': 'custom',
+    'MPITime': 'mpi',
+}
+
+MISSING_INT = {'size': -1, 'threads': -1, 'chunk': 0, 'run': -1}
+
+
+def _first(record, names):
+    for name in names:
+        value = record.get(name)
+        if value not in (None, ''):
+            return value
+    return None
+
+
+def _number(value, kind, default):
+    if value is None:
+        return default
+    try:
+        return kind(float(value)) if kind is int else kind(value)
+    except (ValueError, OverflowError):
+        return default
+
+
+def normalize(record, task, source):
+    """Map one raw record onto the store schema (may yield several rows)"""
+    row = {'task': task, 'source': source}
+    for column in ('kernel', 'method', 'schedule'):
+        row[column] = str(_first(record, ALIASES[column]) or '')
+    # Results from before placement was recorded (and openMPI) share one policy
+    row[PLACEMENT] = str(record.get(PLACEMENT) or UNRECORDED)
+    for column in INTEGER:
+        row[column] = _number(_first(record, ALIASES[column]), int, MISSING_INT[column])
+    row['result'] = _number(_first(record, ALIASES['result']), float, math.nan)
+
+    time_ms = _first(record, ALIASES['time_ms'])
+    if time_ms is not None:
+        row['time_ms'] = float(time_ms)
+    else:
+        seconds = _first(record, SECONDS)
+        row['time_ms'] = float(seconds) * 1000.0 if seconds is not None else math.nan
+
+    wide = [(col, name) for col, name in WIDE_TIMES.items() if record.get(col) not in (None, '')]
+    if not wide:
+        return [row]
+
+    rows = []
+    for col, name in wide:
+        split = dict(row)
+        split['method'] = name
+        split['time_ms'] = float(record[col]) * 1000.0
+        rows.append(split)
+    return rows
+
+
+def read_json_records(path):
+    """task1 writes one JSON object per line inside a [ ... ] array"""
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line in ['[', ']', ',']:
+                continue
+            try:
+                yield json.loads(line.rstrip(','))
+            except json.JSONDecodeError:
+                continue
+
+
+def read_csv_records(path):
+    with open(path, 'r', newline='') as f:
+        header = f.readline()
+        delimiter = ';' if header.count(';') > header.count(',') else ','
+        f.seek(0)
+        yield from csv.DictReader(f, delimiter=delimiter)
+
+
+def discover(root=REPO_ROOT):
+    """(task, path) for every raw results file in the repository"""
+    found = []
+    for task_dir in sorted((root / 'openMP').glob('task*')):
+        for path in sorted((task_dir / 'results').glob('benchmark_*')):
+            if path.suffix in ('.json', '.csv') and '_processed' not in path.stem:
+                found.append((f'openMP/{task_dir.name}', path))
+    for task_dir in sorted((root / 'openMPI').glob('task*')):
+        for path in sorted(task_dir.glob('data*.csv')):
+            found.append((f'openMPI/{task_dir.name}', path))
+    return found
+
+
+def ingest(out_dir=DEFAULT_STORE, root=REPO_ROOT, files=None):
+    """Parse every results file once and write the columnar store"""
+    out_dir = Path(out_dir)
+    files = discover(root) if files is None else files
+
+    columns = {name: [] for name in COLUMNS}
+    for task, path in files:
+        reader = read_json_records if path.suffix == '.json' else read_csv_records
+        try:
+            source = str(path.relative_to(root))
+        except ValueError:
+            source = str(path)
+        for record in reader(path):
+            for row in normalize(record, task, source):
+                for name in COLUMNS:
+                    columns[name].append(row[name])
+
+    categories = {}
+    arrays = {}
+    for name in CATEGORICAL:
+        values = columns[name]
+        categories[name] = sorted(set(values))
+        lookup = {value: code for code, value in enumerate(categories[name])}
+        arrays[name] = np.fromiter((lookup[v] for v in values), dtype=np.int32, count=len(values))
+    for name, dtype in INTEGER.items():
+        arrays[name] = np.asarray(columns[name], dtype=dtype)
+    for name in FLOAT:
+        arrays[name] = np.asarray(columns[name], dtype=np.float64)
+
+    # Category codes follow sorted string order, so sorting by code sorts by value
+    order = np.lexsort([arrays[name] for name in reversed(INDEX)])
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for name, values in arrays.items():
+        np.save(out_dir / f'{name}.npy', values[order])
+    with open(out_dir / 'categories.json', 'w') as f:
+        json.dump(categories, f, indent=2)
+    with open(out_dir / 'meta.json', 'w') as f:
+        json.dump({'rows': int(len(order)), 'index': list(INDEX),
+                   'sources': categories['source']}, f, indent=2)
+    return len(order)
+
+
+class ResultStore:
+    """Read-only view over an ingested store; columns are memory-mapped"""
+
+    def __init__(self, path=DEFAULT_STORE):
+        self.path = Path(path)
+        with open(self.path / 'meta.json', 'r') as f:
+            self.meta = json.load(f)
+        with open(self.path / 'categories.json', 'r') as f:
+            self.categories = json.load(f)
+        self._codes = {name: {value: code for code, value in enumerate(values)}
+                       for name, values in self.categories.items()}
+        self._columns = {}
+
+    def __len__(self):
+        return self.meta['rows']
+
+    def column(self, name):
+        if name not in self._columns:
+            self._columns[name] = np.load(self.path / f'{name}.npy', mmap_mode='r')
+        return self._columns[name]
+
+    def encode(self, name, value):
+        """Category code of a string value (-1 if it never occurs)"""
+        return self._codes[name].get(value, -1)
+
+    def lookup(self, **prefix):
+        """Row slice matching a prefix of (task, kernel, method, size, threads, placement)
+
+        Each key narrows the current range with two binary searches, so the
+        cost is O(len(prefix) * log n) and nothing is parsed or scanned.
+        """
+        unknown = set(prefix) - set(INDEX)
+        if unknown:
+            raise ValueError(f"Not an index column: {', '.join(sorted(unknown))}")
+        depth = len(prefix)
+        if set(prefix) != set(INDEX[:depth]):
+            raise ValueError(f"Lookup keys must be a prefix of {INDEX}")
+
+        lo, hi = 0, len(self)
+        for name in INDEX[:depth]:
+            value = prefix[name]
+            if name in CATEGORICAL:
+                value = self.encode(name, value)
+            values = self.column(name)[lo:hi]
+            start = int(np.searchsorted(values, value, side='left'))
+            stop = int(np.searchsorted(values, value, side='right'))
+            lo, hi = lo + start, lo + stop
+            if lo == hi:
+                break
+        return slice(lo, hi)
+
+    def rows(self, selection=slice(None)):
+        """Decoded columns for a slice (or index array) as a dict of arrays"""
+        out = {}
+        for name in COLUMNS:
+            values = np.asarray(self.column(name)[selection])
+            if name in CATEGORICAL:
+                values = np.asarray(self.categories[name], dtype=object)[values]
+            out[name] = values
+        return out
+
+    def frame(self, selection=slice(None)):
+        import pandas as pd
+        return pd.DataFrame(self.rows(selection), columns=list(COLUMNS))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Columnar results store")
+    parser.add_argument('--store', default=str(DEFAULT_STORE), help="store directory")
+    sub = parser.add_subparsers(dest='command')
+    sub.add_parser('ingest', help="convert all results files into the store")
+    query = sub.add_parser('query', help="print rows for an index prefix")
+    query.add_argument('prefix', nargs='*', help="key=value for task, kernel, method, size, threads, placement")
+    args = parser.parse_args()
+
+    if args.command == 'ingest':
+        rows = ingest(args.store)
+        print(f"✓ Ingested {rows} rows into {args.store}")
+    elif args.command == 'query':
+        prefix = {}
+        for item in args.prefix:
+            key, _, value = item.partition('=')
+            prefix[key] = int(value) if key in INTEGER else value
+        store = ResultStore(args.store)
+        selection = store.lookup(**prefix)
+        rows = store.rows(selection)
+        print('\t'.join(COLUMNS))
+        for i in range(selection.stop - selection.start):
+            print('\t'.join(str(rows[name][i]) for name in COLUMNS))
+    else:
+        parser.print_help()
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+/*
+ * Memory and thread placement shared by the benchmark binaries (C and C++)
+ *
+ * BENCH_NUMA selects where benchmark data is placed:
+ *   first-touch  (default) a page lands on the NUMA node of the thread that
+ *                first writes it; the generators in bench_rng.h fill data in
+ *                parallel with the kernels' static partition
+ *   interleave   pages are spread round-robin over all allowed nodes
+ *                (set_mempolicy(MPOL_INTERLEAVE), Linux only)
+ *
+ * Threads are placed by OMP_PROC_BIND / OMP_PLACES. The OpenMP runtime
+ * reads them once at startup, so run_benchmarks.sh exports them rather
+ * than the binaries setting them.
+ *
+ *     if (numa_setup() != 0) { usage error }      first thing in main()
+ *     numa_placement() -> "placement" column, e.g. "interleave/spread/cores"
+ *
+ * The label records the policy that is actually in effect: if interleaving
+ * is unavailable the binary warns and records first-touch.
+ */
+
+#ifndef BENCH_NUMA_H
+#define BENCH_NUMA_H
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <omp.h>
+
+#ifdef __linux__
+#include <unistd.h>
+#include <sys/syscall.h>
+#endif
+
+#define NUMA_MPOL_INTERLEAVE 3
+#define NUMA_MPOL_F_MEMS_ALLOWED (1 << 2)
+#define NUMA_MAX_NODES 1024
+
+static inline char *numa_label(void) {
+    static char label[64] = "first-touch/unbound/default";
+    return label;
+}
+
+/* Placement label of this process: "<memory>/<bind>/<places>" */
+static inline const char *numa_placement(void) {
+    return numa_label();
+}
+
+/* Interleave all future allocations over the allowed nodes; 0 on success */
+static inline int numa_interleave(void) {
+#if defined(__linux__) && defined(SYS_set_mempolicy) && defined(SYS_get_mempolicy)
+    unsigned long mask[NUMA_MAX_NODES / (8 * sizeof(unsigned long))];
+    int mode;
+    memset(mask, 0, sizeof(mask));
+    if (syscall(SYS_get_mempolicy, &mode, mask, (unsigned long)NUMA_MAX_NODES,
+                NULL, (unsigned long)NUMA_MPOL_F_MEMS_ALLOWED) != 0) {
+        return -1;
+    }
+    return syscall(SYS_set_mempolicy, NUMA_MPOL_INTERLEAVE, mask,
+                   (unsigned long)NUMA_MAX_NODES) == 0 ? 0 : -1;
+#else
+    return -1;
+#endif
+}
+
+static inline const char *numa_bind_name(void) {
+    switch ((int)omp_get_proc_bind()) {
+        case 0: return "unbound";
+        case 1: return "true";
+        case 2: return "primary";
+        case 3: return "close";
+        case 4: return "spread";
+        default: return "unknown";
+    }
+}
+
+/* Abstract OMP_PLACES name (threads, cores, sockets, ...), or "custom" */
+static inline void numa_places_name(char *out, size_t size) {
+    const char *places = getenv("OMP_PLACES");
+    size_t n = 0;
+    if (places == NULL || *places == '\0') {
+        snprintf(out, size, "default");
+        return;
+    }
+    while (places[n] >= 'a' && places[n] <= 'z') {
+        n++;
+    }
+    if (n == 0 || (places[n] != '\0' && places[n] != '(')) {
+        snprintf(out, size, "custom");
+        return;
+    }
+    snprintf(out, size, "%.*s", (int)n, places);
+}
+
+/* Apply BENCH_NUMA and build the placement label; -1 for an unknown policy */
+static inline int numa_setup(void) {
+    const char *policy = getenv("BENCH_NUMA");
+    const char *memory = "first-touch";
+    char places[32];
+
+    if (policy != NULL && *policy != '\0' && strcmp(policy, "first-touch") != 0) {
+        if (strcmp(policy, "interleave") != 0) {
+            fprintf(stderr, "Error: BENCH_NUMA must be first-touch or interleave, not '%s'\n",
+                    policy);
+            return -1;
+        }
+        if (numa_interleave() == 0) {
+            memory = "interleave";
+        } else {
+            fprintf(stderr, "Warning: interleaved allocation unavailable, using first-touch\n");
+        }
+    }
+
+    numa_places_name(places, sizeof(places));
+    snprintf(numa_label(), 64, "%s/%s/%s", memory, numa_bind_name(), places);
+    return 0;
+}
+
+#endif
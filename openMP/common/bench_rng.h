@@ -0,0 +1,87 @@
+/*
+ * Counter-based random data shared by the benchmark binaries (C and C++)
+ *
+ * Element i of stream `seed` is a pure function of (seed, i): the
+ * SplitMix64 output for counter i of a stream whose start is derived from
+ * the seed. There is no generator state to carry from one element to the
+ * next, so arrays are filled in parallel, in any order, and come out
+ * bit-identical for every thread count.
+ *
+ *     rng_fill_uniform(arr, n, 42, -100.0, 100.0, num_threads);
+ *     value = rng_uniform(seed, i * N + j, lo, hi);   // one element of a matrix
+ *
+ * The fill uses schedule(static), the partition of the kernels' plain
+ * `parallel for`, so with the same thread count every page is first
+ * touched (and placed on its NUMA node) by the thread that later reads it.
+ * That only holds if nothing writes the memory earlier: C++ code should
+ * allocate 1-D data as first_touch_vector, which skips std::vector's
+ * serial zero-fill.
+ */
+
+#ifndef BENCH_RNG_H
+#define BENCH_RNG_H
+
+#define RNG_GAMMA 0x9E3779B97F4A7C15ULL
+
+static inline unsigned long long rng_mix(unsigned long long z) {
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL;
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL;
+    return z ^ (z >> 31);
+}
+
+/* 64 random bits for counter `index` of stream `seed` */
+static inline unsigned long long rng_bits(unsigned long long seed, unsigned long long index) {
+    return rng_mix(rng_mix(seed) + (index + 1) * RNG_GAMMA);
+}
+
+/* Uniform double in [lo, hi) from the top 53 bits */
+static inline double rng_uniform(unsigned long long seed, unsigned long long index,
+                                 double lo, double hi) {
+    double unit = (double)(rng_bits(seed, index) >> 11) * (1.0 / 9007199254740992.0);
+    return lo + (hi - lo) * unit;
+}
+
+/* data[i] = rng_uniform(seed, i, lo, hi), filled by num_threads threads */
+static inline void rng_fill_uniform(double *data, long long n, unsigned long long seed,
+                                    double lo, double hi, int num_threads) {
+    #pragma omp parallel for schedule(static) num_threads(num_threads)
+    for (long long i = 0; i < n; i++) {
+        data[i] = rng_uniform(seed, (unsigned long long)i, lo, hi);
+    }
+}
+
+#ifdef __cplusplus
+#include <memory>
+#include <new>
+#include <utility>
+#include <vector>
+
+/* std::allocator whose default construction leaves elements uninitialized */
+template <typename T>
+struct first_touch_allocator : std::allocator<T> {
+    template <typename U>
+    struct rebind {
+        typedef first_touch_allocator<U> other;
+    };
+
+    first_touch_allocator() = default;
+
+    template <typename U>
+    first_touch_allocator(const first_touch_allocator<U>&) {}
+
+    template <typename U>
+    void construct(U* p) {
+        ::new (static_cast<void*>(p)) U;
+    }
+
+    template <typename U, typename... Args>
+    void construct(U* p, Args&&... args) {
+        ::new (static_cast<void*>(p)) U(std::forward<Args>(args)...);
+    }
+};
+
+template <typename T>
+using first_touch_vector = std::vector<T, first_touch_allocator<T>>;
+#endif
+
+#endif
@@ -0,0 +1,174 @@
+/*
+ * Run-count control shared by the benchmark binaries (C and C++)
+ *
+ * The <runs>/<iterations> argument is either a fixed count ("10") or an
+ * adaptive plan "auto[:min[:max[:width]]]", e.g. "auto:5:100:0.02".
+ * In adaptive mode a configuration is repeated until the 95% bootstrap
+ * confidence interval of the median time is narrower than `width`
+ * (relative to the median), but at least `min` and at most `max` times.
+ *
+ *     run_plan plan;
+ *     run_series series;
+ *     if (run_plan_parse(argv[4], &plan) != 0) { usage error }
+ *     run_series_init(&series, &plan);
+ *     while (!run_series_done(&series)) {
+ *         ... time one run ...
+ *         run_series_add(&series, time_ms);
+ *     }
+ *     series.count, series.ci_low, series.ci_high -> output rows
+ *     run_series_free(&series);
+ *
+ * The CI is also computed for fixed counts, so every row records it.
+ */
+
+#ifndef BENCH_RUNS_H
+#define BENCH_RUNS_H
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+#define RUN_PLAN_MIN_RUNS 5
+#define RUN_PLAN_MAX_RUNS 100
+#define RUN_PLAN_WIDTH 0.05
+#define RUN_PLAN_RESAMPLES 1000
+
+typedef struct {
+    int min_runs;
+    int max_runs;
+    double width;       /* target relative CI width, 0 for a fixed count */
+} run_plan;
+
+typedef struct {
+    run_plan plan;
+    double *samples;
+    double *scratch;
+    double *medians;
+    int count;
+    double ci_low;      /* 95% CI of the median time, ms */
+    double ci_high;
+} run_series;
+
+/* 0 on success, -1 for a malformed or non-positive argument */
+static inline int run_plan_parse(const char *arg, run_plan *plan) {
+    if (strncmp(arg, "auto", 4) == 0) {
+        plan->min_runs = RUN_PLAN_MIN_RUNS;
+        plan->max_runs = RUN_PLAN_MAX_RUNS;
+        plan->width = RUN_PLAN_WIDTH;
+        if (arg[4] != '\0' && arg[4] != ':') {
+            return -1;
+        }
+        if (arg[4] == ':') {
+            /* %n marks the end of the last field read: nothing may follow it */
+            int used = 0;
+            int fields = sscanf(arg + 5, "%d%n:%d%n:%lf%n", &plan->min_runs, &used,
+                                &plan->max_runs, &used, &plan->width, &used);
+            if (fields < 1 || arg[5 + used] != '\0') {
+                return -1;
+            }
+        }
+        if (plan->min_runs < 2 || plan->max_runs < plan->min_runs || plan->width <= 0.0) {
+            return -1;
+        }
+        return 0;
+    }
+
+    char *end;
+    long runs = strtol(arg, &end, 10);
+    if (*end != '\0' || runs <= 0) {
+        return -1;
+    }
+    plan->min_runs = plan->max_runs = (int)runs;
+    plan->width = 0.0;
+    return 0;
+}
+
+static inline int run_plan_adaptive(const run_plan *plan) {
+    return plan->width > 0.0;
+}
+
+static inline void run_series_init(run_series *s, const run_plan *plan) {
+    s->plan = *plan;
+    s->samples = (double *)malloc(plan->max_runs * sizeof(double));
+    s->scratch = (double *)malloc(plan->max_runs * sizeof(double));
+    s->medians = (double *)malloc(RUN_PLAN_RESAMPLES * sizeof(double));
+    s->count = 0;
+    s->ci_low = s->ci_high = 0.0;
+}
+
+static inline void run_series_free(run_series *s) {
+    free(s->samples);
+    free(s->scratch);
+    free(s->medians);
+    s->samples = s->scratch = s->medians = NULL;
+}
+
+static inline void run_series_add(run_series *s, double time_ms) {
+    if (s->count < s->plan.max_runs) {
+        s->samples[s->count++] = time_ms;
+    }
+}
+
+static inline int run_compare_doubles(const void *a, const void *b) {
+    double x = *(const double *)a, y = *(const double *)b;
+    return (x > y) - (x < y);
+}
+
+static inline double run_median(double *values, int n) {
+    qsort(values, n, sizeof(double), run_compare_doubles);
+    return (n % 2) ? values[n / 2] : 0.5 * (values[n / 2 - 1] + values[n / 2]);
+}
+
+/* splitmix64: resampling must not disturb the benchmarks' own generators */
+static inline unsigned long long run_next_random(unsigned long long *state) {
+    unsigned long long z = (*state += 0x9E3779B97F4A7C15ULL);
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL;
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL;
+    return z ^ (z >> 31);
+}
+
+/* Percentile bootstrap: 95% CI of the median from RUN_PLAN_RESAMPLES resamples */
+static inline void run_series_update_ci(run_series *s) {
+    int n = s->count;
+    if (n < 2) {
+        s->ci_low = s->ci_high = n ? s->samples[0] : 0.0;
+        return;
+    }
+
+    unsigned long long state = 0x5DEECE66DULL + (unsigned long long)n;
+    for (int b = 0; b < RUN_PLAN_RESAMPLES; b++) {
+        for (int i = 0; i < n; i++) {
+            s->scratch[i] = s->samples[run_next_random(&state) % (unsigned long long)n];
+        }
+        s->medians[b] = run_median(s->scratch, n);
+    }
+    qsort(s->medians, RUN_PLAN_RESAMPLES, sizeof(double), run_compare_doubles);
+    s->ci_low = s->medians[(int)(0.025 * (RUN_PLAN_RESAMPLES - 1))];
+    s->ci_high = s->medians[(int)(0.975 * (RUN_PLAN_RESAMPLES - 1))];
+}
+
+static inline double run_series_median(run_series *s) {
+    memcpy(s->scratch, s->samples, s->count * sizeof(double));
+    return run_median(s->scratch, s->count);
+}
+
+/* CI width relative to the median (0 when the median is 0) */
+static inline double run_series_width(run_series *s) {
+    double median = s->count ? run_series_median(s) : 0.0;
+    return median > 0.0 ? (s->ci_high - s->ci_low) / median : 0.0;
+}
+
+/* 1 once no more runs are needed; updates ci_low/ci_high on the way */
+static inline int run_series_done(run_series *s) {
+    if (s->count >= s->plan.max_runs) {
+        run_series_update_ci(s);
+        return 1;
+    }
+    if (!run_plan_adaptive(&s->plan) || s->count < s->plan.min_runs) {
+        return 0;
+    }
+    run_series_update_ci(s);
+    return run_series_width(s) <= s->plan.width;
+}
+
+#endif /* BENCH_RUNS_H */
@@ -0,0 +1,49 @@
+// Comma-separated argument lists for the in-process sweep mode (C++)
+//
+// Binaries that support it accept e.g. "1,2,4,8" for threads and
+// "reduction,no-reduction" for methods; the data is set up once and every
+// combination is measured in the same process.
+
+#ifndef BENCH_SWEEP_HPP
+#define BENCH_SWEEP_HPP
+
+#include <sstream>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+inline std::vector<std::string> parse_list(const std::string& arg) {
+    std::vector<std::string> items;
+    std::stringstream stream(arg);
+    std::string item;
+    while (std::getline(stream, item, ',')) {
+        if (item.empty()) {
+            throw std::invalid_argument("empty item in list '" + arg + "'");
+        }
+        items.push_back(item);
+    }
+    if (items.empty()) {
+        throw std::invalid_argument("empty list");
+    }
+    return items;
+}
+
+inline std::vector<int> parse_int_list(const std::string& arg) {
+    std::vector<int> values;
+    for (const auto& item : parse_list(arg)) {
+        size_t used = 0;
+        int value = 0;
+        try {
+            value = std::stoi(item, &used);
+        } catch (const std::exception&) {
+            used = 0;
+        }
+        if (used != item.size() || value <= 0) {
+            throw std::invalid_argument("not a positive integer: '" + item + "'");
+        }
+        values.push_back(value);
+    }
+    return values;
+}
+
+#endif // BENCH_SWEEP_HPP
@@ -1,80 +1,138 @@
 #!/usr/bin/env python3
 
+import argparse
 import json
 import sys
-import numpy as np
+import time
 from pathlib import Path
-from collections import defaultdict
 
-def load_results(filepath):
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from benchkit import OnlineAggregator, Schema, add_speedup_records, summarize
+from benchkit.lazy import lazy_import
+from benchkit.placement import print_placement_summary
+
+pd = lazy_import('pandas')
+
+def parse_record(line):
+    """Parse one line of the results file; None for brackets and separators"""
+    line = line.strip()
+    if not line or line in ['[', ']', ',']:
+        return None
+    try:
+        return json.loads(line.rstrip(','))
+    except json.JSONDecodeError:
+        return None
+
+def iter_results(filepath):
+    """Yield result records one at a time without reading the whole file"""
     with open(filepath, 'r') as f:
-        lines = f.readlines()
-        results = []
-        for line in lines:
-            line = line.strip()
-            if line and line not in ['[', ']', ',']:
-                try:
-                    results.append(json.loads(line.rstrip(',')))
-                except json.JSONDecodeError:
-                    continue
-    return results
+        for line in f:
+            record = parse_record(line)
+            if record is not None:
+                yield record
 
-def group_results(results):
-    grouped = defaultdict(list)
-    
-    for result in results:
-        key = (
-            result['method'],
-            result['operation'],
-            result['threads'],
-            result['size']
-        )
-        grouped[key].append(result['time_ms'])
-    
-    return grouped
+def pass_records(record, pending):
+    """Records to aggregate for one input record
 
-def compute_statistics(grouped_results):
-    stats = []
-    
-    for key, times in grouped_results.items():
-        method, operation, threads, size = key
-        times_array = np.array(times)
-        
-        stat = {
-            'method': method,
-            'operation': operation,
-            'threads': threads,
-            'size': size,
-            'mean_time_ms': float(np.mean(times_array)),
-            'median_time_ms': float(np.median(times_array)),
-            'std_time_ms': float(np.std(times_array)),
-            'min_time_ms': float(np.min(times_array)),
-            'max_time_ms': float(np.max(times_array)),
-            'num_runs': len(times)
-        }
-        stats.append(stat)
-    
-    return stats
+    The two-pass methods time min and max separately; once both halves of a
+    run are seen, a derived 'minmax' record with their summed time is added
+    so they compare directly with the single-pass 'fused' method.
+    """
+    records = [TASK_SCHEMA.fill_record(record)]
+    operation = record.get('operation')
+    if operation in ('min', 'max'):
+        key = (record['method'], record['threads'], record['size'], record.get('run'),
+               record['placement'])
+        other = pending.pop(key, None)
+        if other is None or other['operation'] == operation:
+            pending[key] = record
+        else:
+            records.append(dict(record, operation='minmax',
+                                time_ms=record['time_ms'] + other['time_ms']))
+    return records
 
-def compute_speedup(stats):
-    baseline_times = {}
-    
-    for stat in stats:
-        if stat['threads'] == 1:
-            key = (stat['method'], stat['operation'], stat['size'])
-            baseline_times[key] = stat['median_time_ms']
+def with_passes(records):
+    pending = {}
+    for record in records:
+        yield from pass_records(record, pending)
+
+def load_results(filepath):
+    return list(with_passes(iter_results(filepath)))
+
+TASK_SCHEMA = Schema(
+    keys=['method', 'operation', 'threads', 'size'],
+    time='time_ms',
+    threads='threads',
+    speedup_from='median',
+    names={
+        'mean': 'mean_time_ms',
+        'median': 'median_time_ms',
+        'std': 'std_time_ms',
+        'min': 'min_time_ms',
+        'max': 'max_time_ms',
+        'count': 'num_runs',
+    },
+    fill_missing=1.0,
+    ddof=0,     # np.std, as the per-configuration loop this replaced
+)
+
+def compute_statistics(results):
+    df = pd.DataFrame(results)
+    return summarize(df, TASK_SCHEMA).to_dict('records')
+
+def new_aggregator():
+    return OnlineAggregator(TASK_SCHEMA.keys, TASK_SCHEMA.time, TASK_SCHEMA.ddof)
+
+def streaming_statistics(aggregator):
+    """Speedup table from online per-configuration statistics (no pandas)"""
+    return add_speedup_records(aggregator.rows(TASK_SCHEMA.names), TASK_SCHEMA)
+
+def stream_results(filepath):
+    """Single pass over the file with constant memory per configuration"""
+    aggregator = new_aggregator()
+    for record in with_passes(iter_results(filepath)):
+        aggregator.add(record)
+    return streaming_statistics(aggregator)
+
+def follow_results(filepath, interval):
+    """Tail a results file that run_benchmarks.sh is still appending to
+
+    Reprints the summary whenever new records arrived and returns once the
+    closing bracket is written (or on Ctrl+C).
+    """
+    aggregator = new_aggregator()
+    passes = {}
+    reported = 0
+    pending = ''
+    finished = False
     
-    # Add speedup to each stat
-    for stat in stats:
-        key = (stat['method'], stat['operation'], stat['size'])
-        if key in baseline_times and baseline_times[key] > 0:
-            stat['speedup'] = baseline_times[key] / stat['median_time_ms']
-            stat['efficiency'] = stat['speedup'] / stat['threads']
-        else:
-            stat['speedup'] = 1.0
-            stat['efficiency'] = 1.0
+    with open(filepath, 'r') as f:
+        try:
+            while not finished:
+                chunk = f.readline()
+                if chunk:
+                    pending += chunk
+                    if not pending.endswith('\n'):
+                        continue
+                    line, pending = pending, ''
+                    if line.strip() == ']':
+                        finished = True
+                    record = parse_record(line)
+                    if record is not None:
+                        for combined in pass_records(record, passes):
+                            aggregator.add(combined)
+                    continue
+                
+                if aggregator.records > reported:
+                    reported = aggregator.records
+                    print_summary(streaming_statistics(aggregator))
+                    print(f"\n[{time.strftime('%H:%M:%S')}] {reported} records, "
+                          f"{len(aggregator.groups)} configurations")
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
     
-    return stats
+    return streaming_statistics(aggregator)
 
 def print_summary(stats):
     """Print summary of results"""
@@ -92,13 +150,15 @@ def print_summary(stats):
         size_stats = [s for s in stats if s['size'] == size]
         
         # Group by method and operation
-        for method in ['reduction', 'no-reduction']:
-            for operation in ['min', 'max']:
-                print(f"\n  {method.upper()} - {operation.upper()}:")
-                
+        for method in ['reduction', 'no-reduction', 'fused']:
+            for operation in ['min', 'max', 'minmax']:
                 method_stats = [s for s in size_stats 
                               if s['method'] == method and s['operation'] == operation]
                 method_stats.sort(key=lambda x: x['threads'])
+                if not method_stats:
+                    continue
+                
+                print(f"\n  {method.upper()} - {operation.upper()}:")
                 
                 print(f"    {'Threads':<10} {'Time (ms)':<15} {'Speedup':<12} {'Efficiency':<12}")
                 print(f"    {'-'*10} {'-'*15} {'-'*12} {'-'*12}")
@@ -108,27 +168,61 @@ def print_summary(stats):
                           f"{stat['median_time_ms']:<15.3f} "
                           f"{stat['speedup']:<12.2f} "
                           f"{stat['efficiency']:<12.2%}")
+        
+        print_pass_comparison(size_stats)
+
+def print_pass_comparison(size_stats):
+    """Min+max time of the fused single pass against the two-pass methods"""
+    minmax = {(s['method'], s['threads']): s['median_time_ms']
+              for s in size_stats if s['operation'] == 'minmax'}
+    fused_threads = sorted(t for m, t in minmax if m == 'fused')
+    if not fused_threads:
+        return
+    
+    print("\n  MIN+MAX: FUSED vs TWO PASSES (median ms, gain = two-pass / fused):")
+    print(f"    {'Threads':<10} {'Fused':<12} {'Reduction':<12} {'Gain':<8} "
+          f"{'No-reduction':<14} {'Gain':<8}")
+    print(f"    {'-'*10} {'-'*12} {'-'*12} {'-'*8} {'-'*14} {'-'*8}")
+    for threads in fused_threads:
+        fused = minmax[('fused', threads)]
+        row = f"    {threads:<10} {fused:<12.3f} "
+        for method, width in [('reduction', 12), ('no-reduction', 14)]:
+            two_pass = minmax.get((method, threads))
+            if two_pass is None:
+                row += f"{'-':<{width}} {'-':<8} "
+            else:
+                row += f"{two_pass:<{width}.3f} {two_pass / fused:<8.2f} "
+        print(row.rstrip())
 
 def save_processed_results(stats, output_path):
     with open(output_path, 'w') as f:
         json.dump(stats, f, indent=2)
 
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python3 analyze.py <results_file.json>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="Analyze min/max benchmark results")
+    parser.add_argument('results_file', help="results/benchmark_*.json")
+    parser.add_argument('--stream', action='store_true',
+                        help="one pass with online statistics (constant memory)")
+    parser.add_argument('--follow', action='store_true',
+                        help="keep updating the summary while the file is appended to")
+    parser.add_argument('--interval', type=float, default=2.0,
+                        help="polling interval for --follow in seconds (default: 2)")
+    args = parser.parse_args()
     
-    input_file = sys.argv[1]
+    input_file = args.results_file
     
     if not Path(input_file).exists():
         sys.exit(1)
     
-    results = load_results(input_file)
-    grouped = group_results(results)
-    stats = compute_statistics(grouped)
-    stats = compute_speedup(stats)
+    if args.follow:
+        stats = follow_results(input_file, args.interval)
+    elif args.stream:
+        stats = stream_results(input_file)
+    else:
+        stats = compute_statistics(load_results(input_file))
     
     print_summary(stats)
+    print_placement_summary(stats, 'threads')
     output_file = input_file.replace('.json', '_processed.json')
     save_processed_results(stats, output_file)
 
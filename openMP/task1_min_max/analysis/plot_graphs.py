@@ -6,15 +6,22 @@ Creates comprehensive visualizations for deep performance analysis
 
 import json
 import sys
-import numpy as np
-import matplotlib.pyplot as plt
 from pathlib import Path
-from matplotlib.gridspec import GridSpec
 
-# Set style for better-looking plots
-plt.style.use('seaborn-v0_8-darkgrid')
-plt.rcParams['figure.figsize'] = (12, 8)
-plt.rcParams['font.size'] = 10
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from benchkit.lazy import lazy_import
+from benchkit.placement import plot_placement_speedup
+from benchkit.render import Job, parse_options, per_placement, render, split
+
+np = lazy_import('numpy')
+
+def set_style(plt):
+    """Set style for better-looking plots"""
+    plt.style.use('seaborn-v0_8-darkgrid')
+    plt.rcParams['figure.figsize'] = (12, 8)
+    plt.rcParams['font.size'] = 10
+
+plt = lazy_import('matplotlib.pyplot', setup=set_style)
 
 def load_processed_results(filepath):
     """Load processed statistics from JSON file"""
@@ -371,7 +378,7 @@ def plot_strong_scaling(stats, output_dir):
     
     for size in sizes:
         fig = plt.figure(figsize=(16, 10))
-        gs = GridSpec(2, 3, figure=fig)
+        gs = plt.GridSpec(2, 3, figure=fig)
         
         fig.suptitle(f'Strong Scaling Analysis (Size: {size:,} elements)', 
                      fontsize=16, fontweight='bold')
@@ -384,8 +391,10 @@ def plot_strong_scaling(stats, output_dir):
         ax3 = fig.add_subplot(gs[:, 2])
         
         for method in ['reduction', 'no-reduction']:
+            # The derived minmax rows (min + max time) would count every run twice
             method_stats = [s for s in stats 
-                          if s['size'] == size and s['method'] == method]
+                          if s['size'] == size and s['method'] == method
+                          and s['operation'] in ('min', 'max')]
             
             # Combine min and max for overall view
             combined_stats = {}
@@ -572,8 +581,10 @@ def plot_amdahls_law_analysis(stats, output_dir):
             else:
                 ax = axes[size_idx, method_idx]
             
+            # The derived minmax rows (min + max time) would count every run twice
             method_stats = [s for s in stats 
-                          if s['size'] == size and s['method'] == method]
+                          if s['size'] == size and s['method'] == method
+                          and s['operation'] in ('min', 'max')]
             
             if not method_stats:
                 continue
@@ -619,6 +630,56 @@ def plot_amdahls_law_analysis(stats, output_dir):
     print(f"✓ Saved: {output_file}")
     plt.close()
 
+def plot_fused_comparison(stats, output_dir):
+    """Min+max time of the fused single pass against both two-pass methods"""
+    sizes = sorted(set(s['size'] for s in stats))
+    methods = [('reduction', 'Two passes, with reduction', 'o'),
+               ('no-reduction', 'Two passes, without reduction', 's'),
+               ('fused', 'Fused (one pass)', 'D')]
+    
+    for size in sizes:
+        size_stats = [s for s in stats if s['size'] == size and s['operation'] == 'minmax']
+        if not any(s['method'] == 'fused' for s in size_stats):
+            continue
+        
+        # Speedup of every method relative to the sequential two-pass reduction
+        baseline = [s['median_time_ms'] for s in size_stats
+                    if s['method'] == 'reduction' and s['threads'] == 1]
+        
+        fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+        fig.suptitle(f'Min+Max: Fused vs Two Passes (Size: {size:,} elements)', 
+                     fontsize=14, fontweight='bold')
+        
+        for method, label, marker in methods:
+            method_stats = [s for s in size_stats if s['method'] == method]
+            method_stats.sort(key=lambda x: x['threads'])
+            if not method_stats:
+                continue
+            
+            threads = [s['threads'] for s in method_stats]
+            times = [s['median_time_ms'] for s in method_stats]
+            axes[0].plot(threads, times, marker=marker, linewidth=2, 
+                        markersize=8, label=label)
+            if baseline:
+                axes[1].plot(threads, [baseline[0] / t for t in times], marker=marker, 
+                            linewidth=2, markersize=8, label=label)
+        
+        axes[0].set_ylabel('Min+Max Time (ms)', fontsize=12)
+        axes[0].set_title('Execution Time (min + max)', fontsize=12)
+        axes[1].set_ylabel('Speedup vs 1-thread two-pass reduction', fontsize=12)
+        axes[1].set_title('Speedup', fontsize=12)
+        for ax in axes:
+            ax.set_xlabel('Number of Threads', fontsize=12)
+            ax.legend()
+            ax.grid(True, alpha=0.3)
+            ax.set_xticks(sorted(set(s['threads'] for s in size_stats)))
+        
+        plt.tight_layout()
+        output_file = output_dir / f'fused_comparison_size_{size}.png'
+        plt.savefig(output_file, dpi=300, bbox_inches='tight')
+        print(f"✓ Saved: {output_file}")
+        plt.close()
+
 def generate_summary_table(stats, output_dir):
     """Generate summary table in text format"""
     output_file = output_dir / 'summary_table.txt'
@@ -634,12 +695,14 @@ def generate_summary_table(stats, output_dir):
             f.write(f"\nVector Size: {size:,} elements\n")
             f.write("-"*100 + "\n")
             
-            for operation in ['min', 'max']:
+            for operation in ['min', 'max', 'minmax']:
+                if not any(s['size'] == size and s['operation'] == operation for s in stats):
+                    continue
                 f.write(f"\n{operation.upper()} Operation:\n")
                 f.write(f"{'Method':<20} {'Threads':<10} {'Time (ms)':<15} {'Speedup':<12} {'Efficiency':<12}\n")
                 f.write(f"{'-'*20} {'-'*10} {'-'*15} {'-'*12} {'-'*12}\n")
                 
-                for method in ['reduction', 'no-reduction']:
+                for method in ['reduction', 'no-reduction', 'fused']:
                     method_stats = [s for s in stats
                                   if s['size'] == size
                                   and s['operation'] == operation
@@ -656,6 +719,8 @@ def generate_summary_table(stats, output_dir):
     print(f"✓ Saved: {output_file}")
 
 def main():
+    options = parse_options()
+    
     # Find the most recent processed results file
     # Handle both running from analysis/ and from project root
     script_dir = Path(__file__).parent
@@ -683,26 +748,36 @@ def main():
     report_dir = script_dir.parent / 'graphs'
     report_dir.mkdir(exist_ok=True)
     
-    print("\nGenerating graphs...")
+    print(f"\nGenerating graphs (jobs: {options.jobs})...")
     print("-" * 50)
     
-    # Original graphs
-    plot_execution_time(stats, report_dir)
-    plot_speedup(stats, report_dir)
-    plot_efficiency(stats, report_dir)
-    plot_comparison_reduction_methods(stats, report_dir)
-    
-    # NEW: Advanced analysis graphs
-    print("\nGenerating advanced analysis graphs...")
-    plot_scalability_analysis(stats, report_dir)
-    plot_overhead_analysis(stats, report_dir)
-    plot_performance_heatmap(stats, report_dir)
-    plot_strong_scaling(stats, report_dir)
-    plot_method_comparison_detailed(stats, report_dir)
-    plot_amdahls_law_analysis(stats, report_dir)
-    
-    # Summary table
-    generate_summary_table(stats, report_dir)
+    # Everything but the placement comparison is drawn once per placement policy
+    def policy_jobs(directory, where):
+        return [
+            # Original graphs
+            *split(stats, plot_execution_time, 'size', directory, where=where),
+            *split(stats, plot_speedup, 'size', directory, where=where),
+            *split(stats, plot_efficiency, 'size', directory, where=where),
+            Job(plot_comparison_reduction_methods, directory, where=where),
+            
+            # NEW: Advanced analysis graphs
+            Job(plot_scalability_analysis, directory, where=where,
+                title="\nGenerating advanced analysis graphs..."),
+            Job(plot_overhead_analysis, directory, where=where),
+            Job(plot_performance_heatmap, directory, where=where),
+            *split(stats, plot_strong_scaling, 'size', directory, where=where),
+            Job(plot_method_comparison_detailed, directory, where=where),
+            Job(plot_amdahls_law_analysis, directory, where=where),
+            *split(stats, plot_fused_comparison, 'size', directory, where=where),
+            
+            # Summary table
+            Job(generate_summary_table, directory, where=where),
+        ]
+    
+    render([
+        *per_placement(stats, report_dir, policy_jobs),
+        Job(plot_placement_speedup, report_dir, 'threads'),
+    ], stats, options, report_dir)
     
     print("\n" + "="*50)
     print("✓ All graphs generated successfully!")
@@ -718,6 +793,8 @@ def main():
     print("  - strong_scaling_*.png (NEW)")
     print("  - method_comparison_detailed.png (NEW)")
     print("  - amdahls_law_analysis.png (NEW)")
+    print("  - fused_comparison_*.png (fused method only)")
+    print("  - placement_speedup.png (placement policies recorded)")
     print("  - summary_table.txt")
     print("="*50)
 
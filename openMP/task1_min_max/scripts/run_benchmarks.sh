@@ -5,30 +5,33 @@ RESULTS_FILE="../results/benchmark_$(date +%Y%m%d_%H%M%S).json"
 
 SIZES=(1000000 10000000 100000000)
 THREADS=(1 2 4 8 16 32 64 128)
-METHODS=("reduction" "no-reduction")
-RUNS=10
+METHODS=("reduction" "no-reduction" "fused")
+# Fixed count, or adaptive: RUNS=auto[:min[:max[:width]]] ./run_benchmarks.sh
+RUNS=${RUNS:-10}
+# Placement, recorded in every row: BENCH_NUMA=first-touch|interleave,
+# threads pinned with OMP_PROC_BIND/OMP_PLACES (read once at program start)
+export BENCH_NUMA=${BENCH_NUMA:-first-touch}
+export OMP_PROC_BIND=${OMP_PROC_BIND:-spread}
+export OMP_PLACES=${OMP_PLACES:-cores}
 
 echo "[" > "$RESULTS_FILE"
 
+# One process per size: the array is generated once and every
+# (method, threads) pair is measured on it
+THREAD_LIST=$(IFS=,; echo "${THREADS[*]}")
+METHOD_LIST=$(IFS=,; echo "${METHODS[*]}")
+
 FIRST=1
-TOTAL=$((${#SIZES[@]} * ${#THREADS[@]} * ${#METHODS[@]}))
-CURRENT=0
 
 for size in "${SIZES[@]}"; do
-    for threads in "${THREADS[@]}"; do
-        for method in "${METHODS[@]}"; do
-            CURRENT=$((CURRENT + 1))
-            
-            OUTPUT=$(../bin/min_max $size $threads $method $RUNS)
-            
-            if [ $FIRST -eq 0 ]; then
-                echo "," >> "$RESULTS_FILE"
-            fi
-            FIRST=0
-            
-            echo "$OUTPUT" >> "$RESULTS_FILE"
-        done
-    done
+    OUTPUT=$(../bin/min_max $size $THREAD_LIST $METHOD_LIST $RUNS)
+    
+    if [ $FIRST -eq 0 ]; then
+        echo "," >> "$RESULTS_FILE"
+    fi
+    FIRST=0
+    
+    echo "$OUTPUT" >> "$RESULTS_FILE"
 done
 
 echo "" >> "$RESULTS_FILE"
@@ -2,43 +2,141 @@
 #include <stdlib.h>
 #include <omp.h>
 #include <float.h>
-#include <time.h>
 #include <string.h>
 
+#include "../../common/bench_numa.h"
+#include "../../common/bench_rng.h"
+#include "../../common/bench_runs.h"
+
 double find_min_with_reduction(double *arr, long long n, int num_threads);
 double find_min_without_reduction(double *arr, long long n, int num_threads, double *thread_storage);
 double find_max_with_reduction(double *arr, long long n, int num_threads);
 double find_max_without_reduction(double *arr, long long n, int num_threads, double *thread_storage);
-void generate_random_array(double *arr, long long n);
+void find_min_max_fused(const double *arr, long long n, int num_threads,
+                        double *min_out, double *max_out);
+void generate_random_array(double *arr, long long n, int num_threads);
 void print_json_result(const char *method, const char *operation, int threads,
-                       long long size, double result, double time_ms, int run, int is_last);
+                       long long size, double result, double time_ms, int run,
+                       const run_series *series, int is_last);
+void print_json_minmax(int threads, long long size, double min_result, double max_result,
+                       double time_ms, int run, const run_series *series, int is_last);
+
+#define MAX_SWEEP 64
+
+/* Independent accumulators per thread in the fused kernel: one 64-byte
+   cache line of doubles, consumed with aligned SIMD loads */
+#define FUSED_LANES 8
+#define ARRAY_ALIGN 64
+
+int parse_thread_list(const char *arg, int *threads);
+int parse_method_list(char *arg, char **methods);
+int run_config(double *arr, long long size, int num_threads, const char *method,
+               const run_plan *plan, int is_last_config);
+int run_fused_config(double *arr, long long size, int num_threads,
+                     const run_plan *plan, int is_last_config);
 
 int main(int argc, char *argv[]) {
     if (argc != 5) {
         fprintf(stderr, "Usage: %s <size> <threads> <method> <runs>\n", argv[0]);
-        fprintf(stderr, "  method: reduction | no-reduction\n");
+        fprintf(stderr, "  threads: N or a list, e.g. 1,2,4,8 (sweep in one process)\n");
+        fprintf(stderr, "  method:  reduction | no-reduction | fused, or a list, e.g. reduction,no-reduction,fused\n");
+        fprintf(stderr, "           fused finds min and max in one SIMD pass (operation \"minmax\")\n");
+        fprintf(stderr, "  runs:    N | auto[:min[:max[:width]]] (adaptive, e.g. auto:5:100:0.02)\n");
         fprintf(stderr, "  Example: %s 1000000 4 reduction 10\n", argv[0]);
+        fprintf(stderr, "  Sweep:   %s 100000000 1,2,4,8 reduction,no-reduction,fused 10\n", argv[0]);
+        fprintf(stderr, "  Placement: BENCH_NUMA=first-touch|interleave, OMP_PROC_BIND, OMP_PLACES\n");
         return 1;
     }
 
     long long size = atoll(argv[1]);
-    int num_threads = atoi(argv[2]);
-    char *method = argv[3];
-    int num_runs = atoi(argv[4]);
+    int thread_counts[MAX_SWEEP];
+    char *methods[MAX_SWEEP];
+    int num_thread_counts = parse_thread_list(argv[2], thread_counts);
+    int num_methods = parse_method_list(argv[3], methods);
+    run_plan plan;
 
-    if (size <= 0 || num_threads <= 0 || num_runs <= 0) {
+    if (size <= 0 || num_thread_counts <= 0 || num_methods <= 0 ||
+        run_plan_parse(argv[4], &plan) != 0) {
         fprintf(stderr, "Error: Invalid parameters\n");
         return 1;
     }
 
-    double *arr = (double *)malloc(size * sizeof(double));
+    /* Memory policy must be in place before the array is allocated */
+    if (numa_setup() != 0) {
+        return 1;
+    }
+
+    /* The array is generated once and shared by every (method, threads) pair;
+       it is cache-line aligned so the fused kernel can use aligned loads */
+    size_t bytes = (size_t)size * sizeof(double);
+    bytes = (bytes + ARRAY_ALIGN - 1) / ARRAY_ALIGN * ARRAY_ALIGN;
+    double *arr = (double *)aligned_alloc(ARRAY_ALIGN, bytes);
     if (arr == NULL) {
         fprintf(stderr, "Error: Memory allocation failed\n");
         return 1;
     }
 
-    srand(time(NULL));
-    generate_random_array(arr, size);
+    /* Filled by as many threads as the widest configuration, with the
+       kernels' static partition, so its pages are first touched where
+       they are read; the values do not depend on the thread count */
+    int fill_threads = 1;
+    for (int t = 0; t < num_thread_counts; t++) {
+        if (thread_counts[t] > fill_threads) {
+            fill_threads = thread_counts[t];
+        }
+    }
+    generate_random_array(arr, size, fill_threads);
+
+    for (int m = 0; m < num_methods; m++) {
+        for (int t = 0; t < num_thread_counts; t++) {
+            int is_last_config = (m == num_methods - 1 && t == num_thread_counts - 1);
+            if (run_config(arr, size, thread_counts[t], methods[m], &plan, is_last_config) != 0) {
+                free(arr);
+                return 1;
+            }
+        }
+    }
+
+    free(arr);
+    return 0;
+}
+
+/* Comma-separated positive integers; returns the count or -1 */
+int parse_thread_list(const char *arg, int *threads) {
+    int count = 0;
+    const char *p = arg;
+    while (*p != '\0') {
+        char *end;
+        long value = strtol(p, &end, 10);
+        if (end == p || value <= 0 || count == MAX_SWEEP || (*end != ',' && *end != '\0')) {
+            return -1;
+        }
+        threads[count++] = (int)value;
+        p = (*end == ',') ? end + 1 : end;
+    }
+    return count;
+}
+
+/* Splits arg in place on commas; returns the count or -1 for unknown methods */
+int parse_method_list(char *arg, char **methods) {
+    int count = 0;
+    for (char *method = strtok(arg, ","); method != NULL; method = strtok(NULL, ",")) {
+        if (count == MAX_SWEEP ||
+            (strcmp(method, "reduction") != 0 && strcmp(method, "no-reduction") != 0 &&
+             strcmp(method, "fused") != 0)) {
+            return -1;
+        }
+        methods[count++] = method;
+    }
+    return count;
+}
+
+/* Benchmark one (method, threads) pair and print its JSON rows */
+int run_config(double *arr, long long size, int num_threads, const char *method,
+               const run_plan *plan, int is_last_config) {
+    if (strcmp(method, "fused") == 0) {
+        return run_fused_config(arr, size, num_threads, plan, is_last_config);
+    }
 
     omp_set_num_threads(num_threads);
 
@@ -49,7 +147,6 @@ int main(int argc, char *argv[]) {
         thread_storage = (double *)malloc(num_threads * sizeof(double));
         if (thread_storage == NULL) {
             fprintf(stderr, "Error: Thread storage allocation failed\n");
-            free(arr);
             return 1;
         }
     }
@@ -62,38 +159,92 @@ int main(int argc, char *argv[]) {
     }
     (void)warmup_result;
 
-    for (int run = 0; run < num_runs; run++) {
-        double start_time, end_time, elapsed_time;
-        double result;
+    double *min_results = (double *)malloc(plan->max_runs * sizeof(double));
+    double *max_results = (double *)malloc(plan->max_runs * sizeof(double));
+    run_series min_series, max_series;
+    run_series_init(&min_series, plan);
+    run_series_init(&max_series, plan);
+
+    /* Both operations are repeated until both intervals are tight */
+    while (!(run_series_done(&min_series) & run_series_done(&max_series))) {
+        int run = min_series.count;
+        double start_time, end_time;
 
         start_time = omp_get_wtime();
         if (use_reduction) {
-            result = find_min_with_reduction(arr, size, num_threads);
+            min_results[run] = find_min_with_reduction(arr, size, num_threads);
         } else {
-            result = find_min_without_reduction(arr, size, num_threads, thread_storage);
+            min_results[run] = find_min_without_reduction(arr, size, num_threads, thread_storage);
         }
         end_time = omp_get_wtime();
-        elapsed_time = (end_time - start_time) * 1000.0;
-        
-        print_json_result(method, "min", num_threads, size, result, elapsed_time, run, 0);
+        run_series_add(&min_series, (end_time - start_time) * 1000.0);
 
         start_time = omp_get_wtime();
         if (use_reduction) {
-            result = find_max_with_reduction(arr, size, num_threads);
+            max_results[run] = find_max_with_reduction(arr, size, num_threads);
         } else {
-            result = find_max_without_reduction(arr, size, num_threads, thread_storage);
+            max_results[run] = find_max_without_reduction(arr, size, num_threads, thread_storage);
         }
         end_time = omp_get_wtime();
-        elapsed_time = (end_time - start_time) * 1000.0;
-        
-        int is_last = (run == num_runs - 1);
-        print_json_result(method, "max", num_threads, size, result, elapsed_time, run, is_last);
+        run_series_add(&max_series, (end_time - start_time) * 1000.0);
     }
 
+    int num_runs = min_series.count;
+    for (int run = 0; run < num_runs; run++) {
+        int is_last = is_last_config && run == num_runs - 1;
+        print_json_result(method, "min", num_threads, size, min_results[run],
+                          min_series.samples[run], run, &min_series, 0);
+        print_json_result(method, "max", num_threads, size, max_results[run],
+                          max_series.samples[run], run, &max_series, is_last);
+    }
+
+    run_series_free(&min_series);
+    run_series_free(&max_series);
+    free(min_results);
+    free(max_results);
     if (thread_storage != NULL) {
         free(thread_storage);
     }
-    free(arr);
+    return 0;
+}
+
+/* Fused min+max: one timed operation per run, checked against the
+   reduction kernels before timing starts */
+int run_fused_config(double *arr, long long size, int num_threads,
+                     const run_plan *plan, int is_last_config) {
+    omp_set_num_threads(num_threads);
+
+    double warmup_min, warmup_max;
+    find_min_max_fused(arr, size, num_threads, &warmup_min, &warmup_max);
+    if (warmup_min != find_min_with_reduction(arr, size, num_threads) ||
+        warmup_max != find_max_with_reduction(arr, size, num_threads)) {
+        fprintf(stderr, "Error: fused min/max disagrees with the reduction kernels\n");
+        return 1;
+    }
+
+    double *min_results = (double *)malloc(plan->max_runs * sizeof(double));
+    double *max_results = (double *)malloc(plan->max_runs * sizeof(double));
+    run_series series;
+    run_series_init(&series, plan);
+
+    while (!run_series_done(&series)) {
+        int run = series.count;
+        double start_time = omp_get_wtime();
+        find_min_max_fused(arr, size, num_threads, &min_results[run], &max_results[run]);
+        double end_time = omp_get_wtime();
+        run_series_add(&series, (end_time - start_time) * 1000.0);
+    }
+
+    int num_runs = series.count;
+    for (int run = 0; run < num_runs; run++) {
+        int is_last = is_last_config && run == num_runs - 1;
+        print_json_minmax(num_threads, size, min_results[run], max_results[run],
+                          series.samples[run], run, &series, is_last);
+    }
+
+    run_series_free(&series);
+    free(min_results);
+    free(max_results);
     return 0;
 }
 
@@ -183,17 +334,69 @@ double find_max_without_reduction(double *arr, long long n, int num_threads, dou
     return global_max;
 }
 
-void generate_random_array(double *arr, long long n) {
-    for (long long i = 0; i < n; i++) {
-        arr[i] = ((double)rand() / RAND_MAX) * 2000.0 - 1000.0;
+/* Min and max in a single pass over memory. Each thread keeps FUSED_LANES
+   independent min/max accumulators so the compare chains do not serialize,
+   walks its static share of 64-byte blocks with aligned SIMD loads, and
+   folds its lanes into the OpenMP min/max reductions at the end. */
+void find_min_max_fused(const double *arr, long long n, int num_threads,
+                        double *min_out, double *max_out) {
+    double min_val = DBL_MAX;
+    double max_val = -DBL_MAX;
+    long long blocks = n / FUSED_LANES;
+
+    #pragma omp parallel num_threads(num_threads) reduction(min:min_val) reduction(max:max_val)
+    {
+        double lo[FUSED_LANES], hi[FUSED_LANES];
+        for (int k = 0; k < FUSED_LANES; k++) {
+            lo[k] = DBL_MAX;
+            hi[k] = -DBL_MAX;
+        }
+
+        #pragma omp for schedule(static)
+        for (long long b = 0; b < blocks; b++) {
+            const double *block = arr + b * FUSED_LANES;
+            #pragma omp simd aligned(block:ARRAY_ALIGN)
+            for (int k = 0; k < FUSED_LANES; k++) {
+                lo[k] = block[k] < lo[k] ? block[k] : lo[k];
+                hi[k] = block[k] > hi[k] ? block[k] : hi[k];
+            }
+        }
+
+        for (int k = 0; k < FUSED_LANES; k++) {
+            if (lo[k] < min_val) {
+                min_val = lo[k];
+            }
+            if (hi[k] > max_val) {
+                max_val = hi[k];
+            }
+        }
+    }
+
+    for (long long i = blocks * FUSED_LANES; i < n; i++) {
+        if (arr[i] < min_val) {
+            min_val = arr[i];
+        }
+        if (arr[i] > max_val) {
+            max_val = arr[i];
+        }
     }
+
+    *min_out = min_val;
+    *max_out = max_val;
+}
+
+void generate_random_array(double *arr, long long n, int num_threads) {
+    rng_fill_uniform(arr, n, 42, -1000.0, 1000.0, num_threads);
 }
 
 void print_json_result(const char *method, const char *operation, int threads,
-                       long long size, double result, double time_ms, int run, int is_last) {
+                       long long size, double result, double time_ms, int run,
+                       const run_series *series, int is_last) {
     printf("{\"method\":\"%s\",\"operation\":\"%s\",\"threads\":%d,\"size\":%lld,"
-           "\"result\":%.6f,\"time_ms\":%.6f,\"run\":%d}",
-           method, operation, threads, size, result, time_ms, run);
+           "\"result\":%.6f,\"time_ms\":%.6f,\"run\":%d,"
+           "\"runs_used\":%d,\"ci_low_ms\":%.6f,\"ci_high_ms\":%.6f,\"placement\":\"%s\"}",
+           method, operation, threads, size, result, time_ms, run,
+           series->count, series->ci_low, series->ci_high, numa_placement());
     
     if (!is_last) {
         printf(",");
@@ -201,3 +404,19 @@ void print_json_result(const char *method, const char *operation, int threads,
     printf("\n");
     fflush(stdout);
 }
+
+/* One row per fused run: "result" is the minimum, "result_max" the maximum */
+void print_json_minmax(int threads, long long size, double min_result, double max_result,
+                       double time_ms, int run, const run_series *series, int is_last) {
+    printf("{\"method\":\"fused\",\"operation\":\"minmax\",\"threads\":%d,\"size\":%lld,"
+           "\"result\":%.6f,\"result_max\":%.6f,\"time_ms\":%.6f,\"run\":%d,"
+           "\"runs_used\":%d,\"ci_low_ms\":%.6f,\"ci_high_ms\":%.6f,\"placement\":\"%s\"}",
+           threads, size, min_result, max_result, time_ms, run,
+           series->count, series->ci_low, series->ci_high, numa_placement());
+
+    if (!is_last) {
+        printf(",");
+    }
+    printf("\n");
+    fflush(stdout);
+}
@@ -1,11 +1,17 @@
 #!/usr/bin/env python3
 
-import pandas as pd
-import numpy as np
 import sys
 import os
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from benchkit import Schema, summarize
+from benchkit.lazy import lazy_import
+from benchkit.placement import print_placement_summary
+
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+
 def load_data(csv_file):
     try:
         df = pd.read_csv(csv_file)
@@ -13,51 +19,10 @@ def load_data(csv_file):
     except Exception as e:
         sys.exit(1)
 
-def calculate_statistics(df):
-    grouped = df.groupby(['vector_size', 'num_threads', 'method'])
-    
-    stats = grouped['execution_time_ms'].agg([
-        ('mean', 'mean'),
-        ('median', 'median'),
-        ('std', 'std'),
-        ('min', 'min'),
-        ('max', 'max'),
-        ('count', 'count')
-    ]).reset_index()
-    
-    return stats
+TASK_SCHEMA = Schema(keys=['vector_size', 'num_threads', 'method'])
 
-def calculate_speedup(stats):
-    results = []
-    
-    for size in stats['vector_size'].unique():
-        for method in stats['method'].unique():
-            # Get baseline (1 thread) time
-            baseline = stats[
-                (stats['vector_size'] == size) & 
-                (stats['num_threads'] == 1) & 
-                (stats['method'] == method)
-            ]
-            
-            if len(baseline) == 0:
-                continue
-                
-            baseline_time = baseline['mean'].values[0]
-            
-            # Calculate speedup for all thread counts
-            method_data = stats[
-                (stats['vector_size'] == size) & 
-                (stats['method'] == method)
-            ].copy()
-            
-            method_data['speedup'] = baseline_time / method_data['mean']
-            method_data['efficiency'] = method_data['speedup'] / method_data['num_threads']
-            
-            results.append(method_data)
-    
-    if results:
-        return pd.concat(results, ignore_index=True)
-    return pd.DataFrame()
+def calculate_statistics(df):
+    return summarize(df, TASK_SCHEMA)
 
 def print_summary(stats_with_speedup):
     """Print summary tables"""
@@ -123,6 +88,29 @@ def compare_methods(stats_with_speedup):
                     
                     print(f"  {threads:3d} threads: {faster:15s} is {ratio:.2f}x faster "
                           f"(reduction: {red_time:.4f}ms, no-reduction: {no_red_time:.4f}ms)")
+                
+                reproducible = thread_data[thread_data['method'] == 'reproducible']
+                if len(reduction) > 0 and len(reproducible) > 0:
+                    red_time = reduction['mean'].values[0]
+                    rep_time = reproducible['mean'].values[0]
+                    print(f"  {threads:3d} threads: reproducible takes {rep_time / red_time:.2f}x "
+                          f"the reduction time ({rep_time:.4f}ms vs {red_time:.4f}ms)")
+
+def check_reproducibility(df):
+    """Distinct result values of each method across thread counts"""
+    print("\n" + "="*80)
+    print("RESULT REPRODUCIBILITY ACROSS THREAD COUNTS")
+    print("="*80)
+    
+    for size in sorted(df['vector_size'].unique()):
+        print(f"\nVector Size: {size:,} elements")
+        size_data = df[df['vector_size'] == size]
+        for method in sorted(size_data['method'].unique()):
+            values = size_data[size_data['method'] == method]['result_value']
+            distinct = values.nunique()
+            spread = values.max() - values.min()
+            verdict = "bit-identical" if distinct == 1 else f"{distinct} distinct values, spread {spread:.3e}"
+            print(f"  {method:<15} {verdict}")
 
 def main():
     if len(sys.argv) < 2:
@@ -136,14 +124,15 @@ def main():
         sys.exit(1)
     
     df = load_data(csv_file)
-    stats = calculate_statistics(df)
-    stats_with_speedup = calculate_speedup(stats)
+    stats_with_speedup = calculate_statistics(df)
     
     if len(stats_with_speedup) == 0:
         sys.exit(1)
     
     print_summary(stats_with_speedup)
+    print_placement_summary(stats_with_speedup, 'num_threads')
     compare_methods(stats_with_speedup)
+    check_reproducibility(df)
     output_file = csv_file.replace('.csv', '_processed.csv')
     save_processed_data(stats_with_speedup, output_file)
 
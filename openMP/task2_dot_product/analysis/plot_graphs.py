@@ -4,18 +4,26 @@ Graph generation script for dot product benchmark results
 Creates comprehensive performance visualization
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
 import sys
 import os
 from pathlib import Path
 import glob
 
-# Set style for better-looking plots
-plt.style.use('seaborn-v0_8-darkgrid')
-plt.rcParams['figure.figsize'] = (12, 8)
-plt.rcParams['font.size'] = 10
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from benchkit.lazy import lazy_import
+from benchkit.placement import plot_placement_speedup
+from benchkit.render import Job, parse_options, per_placement, render, split
+
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+
+def set_style(plt):
+    """Set style for better-looking plots"""
+    plt.style.use('seaborn-v0_8-darkgrid')
+    plt.rcParams['figure.figsize'] = (12, 8)
+    plt.rcParams['font.size'] = 10
+
+plt = lazy_import('matplotlib.pyplot', setup=set_style)
 
 def find_latest_processed_file():
     """Find the most recent processed CSV file"""
@@ -286,6 +294,8 @@ def create_summary_table(df, output_dir):
     print(f"  ✓ Saved: {filename}")
 
 def main():
+    options = parse_options()
+    
     print("="*80)
     print("DOT PRODUCT BENCHMARK GRAPH GENERATION")
     print("="*80)
@@ -306,21 +316,25 @@ def main():
     print()
     
     # Generate plots
-    print("Generating graphs...")
-    print("\n1. Execution Time plots:")
-    plot_execution_time(df, output_dir)
-    
-    print("\n2. Speedup plots:")
-    plot_speedup(df, output_dir)
-    
-    print("\n3. Efficiency plots:")
-    plot_efficiency(df, output_dir)
-    
-    print("\n4. Method comparison plot:")
-    plot_method_comparison(df, output_dir)
+    print(f"Generating graphs (jobs: {options.jobs})...")
+    # Everything but the placement comparison is drawn once per placement policy
+    def policy_jobs(directory, where):
+        return [
+            *split(df, plot_execution_time, 'vector_size', directory,
+                   title="\n1. Execution Time plots:", where=where),
+            *split(df, plot_speedup, 'vector_size', directory,
+                   title="\n2. Speedup plots:", where=where),
+            *split(df, plot_efficiency, 'vector_size', directory,
+                   title="\n3. Efficiency plots:", where=where),
+            Job(plot_method_comparison, directory, where=where,
+                title="\n4. Method comparison plot:"),
+            Job(create_summary_table, directory, where=where, title="\n5. Summary table:"),
+        ]
     
-    print("\n5. Summary table:")
-    create_summary_table(df, output_dir)
+    render([
+        *per_placement(df, output_dir, policy_jobs),
+        Job(plot_placement_speedup, output_dir, 'num_threads'),
+    ], df, options, output_dir)
     
     print("\n" + "="*80)
     print("GRAPH GENERATION COMPLETE")
@@ -16,16 +16,24 @@ OUTPUT_FILE="results/benchmark_${TIMESTAMP}.csv"
 
 SIZES=(1000000 10000000 100000000)
 THREADS=(1 2 4 8 16 32 64 128)
-METHODS=("reduction" "no-reduction")
-RUNS=10
-
-echo "vector_size,num_threads,method,iteration,execution_time_ms,result_value" > "$OUTPUT_FILE"
+METHODS=("reduction" "no-reduction" "reproducible")
+# Fixed count, or adaptive: RUNS=auto[:min[:max[:width]]] ./run_benchmarks.sh
+RUNS=${RUNS:-10}
+# Placement, recorded in every row: BENCH_NUMA=first-touch|interleave,
+# threads pinned with OMP_PROC_BIND/OMP_PLACES (read once at program start)
+export BENCH_NUMA=${BENCH_NUMA:-first-touch}
+export OMP_PROC_BIND=${OMP_PROC_BIND:-spread}
+export OMP_PLACES=${OMP_PLACES:-cores}
+
+# dot_product writes the CSV header itself into a new (empty) file
+rm -f "$OUTPUT_FILE"
+
+# One process per size: the vectors are generated once and every
+# (method, threads) pair is measured on them
+THREAD_LIST=$(IFS=,; echo "${THREADS[*]}")
+METHOD_LIST=$(IFS=,; echo "${METHODS[*]}")
 
 for size in "${SIZES[@]}"; do
-    for method in "${METHODS[@]}"; do
-        for threads in "${THREADS[@]}"; do
-            ./bin/dot_product $size $threads $method $RUNS "$OUTPUT_FILE" > /dev/null 2>&1
-            sleep 0.5
-        done
-    done
+    ./bin/dot_product $size $THREAD_LIST $METHOD_LIST $RUNS "$OUTPUT_FILE" > /dev/null 2>&1
+    sleep 0.5
 done
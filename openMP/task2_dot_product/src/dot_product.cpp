@@ -1,7 +1,6 @@
 #include <iostream>
 #include <fstream>
 #include <vector>
-#include <random>
 #include <chrono>
 #include <iomanip>
 #include <algorithm>
@@ -9,16 +8,16 @@
 #include <cmath>
 #include <cfloat>
 
-void initialize_vector(std::vector<double>& vec, unsigned int seed) {
-    std::mt19937 gen(seed);
-    std::uniform_real_distribution<double> dis(-100.0, 100.0);
-    
-    for (size_t i = 0; i < vec.size(); ++i) {
-        vec[i] = dis(gen);
-    }
+#include "../../common/bench_numa.h"
+#include "../../common/bench_rng.h"
+#include "../../common/bench_runs.h"
+#include "../../common/bench_sweep.hpp"
+
+void initialize_vector(first_touch_vector<double>& vec, unsigned int seed, int num_threads) {
+    rng_fill_uniform(vec.data(), vec.size(), seed, -100.0, 100.0, num_threads);
 }
 
-double dot_product_sequential(const std::vector<double>& a, const std::vector<double>& b) {
+double dot_product_sequential(const first_touch_vector<double>& a, const first_touch_vector<double>& b) {
     double result = 0.0;
     for (size_t i = 0; i < a.size(); ++i) {
         result += a[i] * b[i];
@@ -26,7 +25,7 @@ double dot_product_sequential(const std::vector<double>& a, const std::vector<do
     return result;
 }
 
-double dot_product_reduction(const std::vector<double>& a, const std::vector<double>& b, int num_threads) {
+double dot_product_reduction(const first_touch_vector<double>& a, const first_touch_vector<double>& b, int num_threads) {
     double result = 0.0;
     size_t n = a.size();
     
@@ -40,7 +39,7 @@ double dot_product_reduction(const std::vector<double>& a, const std::vector<dou
     return result;
 }
 
-double dot_product_no_reduction(const std::vector<double>& a, const std::vector<double>& b, int num_threads) {
+double dot_product_no_reduction(const first_touch_vector<double>& a, const first_touch_vector<double>& b, int num_threads) {
     double result = 0.0;
     size_t n = a.size();
     
@@ -64,6 +63,70 @@ double dot_product_no_reduction(const std::vector<double>& a, const std::vector<
     return result;
 }
 
+// Reproducible method: elements are summed in fixed blocks, each block with
+// REPRO_LANES compensated (Kahan) accumulators, and the block partials are
+// combined by a fixed pairwise tree. Neither the block boundaries nor the
+// tree depend on the thread count, so the result is bit-identical for any
+// number of threads.
+const size_t REPRO_BLOCK = 4096;
+const int REPRO_LANES = 8;
+
+double dot_product_block(const double* a, const double* b, size_t n) {
+    double sum[REPRO_LANES] = {0.0};
+    double comp[REPRO_LANES] = {0.0};
+    size_t full = n - n % REPRO_LANES;
+    
+    for (size_t i = 0; i < full; i += REPRO_LANES) {
+        #pragma omp simd
+        for (int k = 0; k < REPRO_LANES; ++k) {
+            double y = a[i + k] * b[i + k] - comp[k];
+            double t = sum[k] + y;
+            comp[k] = (t - sum[k]) - y;
+            sum[k] = t;
+        }
+    }
+    for (size_t i = full; i < n; ++i) {
+        int k = static_cast<int>(i - full);
+        double y = a[i] * b[i] - comp[k];
+        double t = sum[k] + y;
+        comp[k] = (t - sum[k]) - y;
+        sum[k] = t;
+    }
+    
+    // Fixed pairwise combine of the lanes: (0+4)+(2+6) + (1+5)+(3+7)
+    for (int width = REPRO_LANES / 2; width > 0; width /= 2) {
+        for (int k = 0; k < width; ++k) {
+            sum[k] += sum[k + width];
+        }
+    }
+    return sum[0];
+}
+
+double pairwise_sum(const double* values, size_t n) {
+    if (n <= 2) {
+        return n == 0 ? 0.0 : (n == 1 ? values[0] : values[0] + values[1]);
+    }
+    size_t half = n / 2;
+    return pairwise_sum(values, half) + pairwise_sum(values + half, n - half);
+}
+
+double dot_product_reproducible(const first_touch_vector<double>& a, const first_touch_vector<double>& b, int num_threads) {
+    size_t n = a.size();
+    size_t num_blocks = (n + REPRO_BLOCK - 1) / REPRO_BLOCK;
+    std::vector<double> partials(num_blocks);
+    
+    omp_set_num_threads(num_threads);
+    
+    #pragma omp parallel for schedule(static)
+    for (size_t block = 0; block < num_blocks; ++block) {
+        size_t begin = block * REPRO_BLOCK;
+        size_t length = std::min(REPRO_BLOCK, n - begin);
+        partials[block] = dot_product_block(a.data() + begin, b.data() + begin, length);
+    }
+    
+    return pairwise_sum(partials.data(), num_blocks);
+}
+
 struct BenchmarkResult {
     size_t vector_size;
     int num_threads;
@@ -71,18 +134,21 @@ struct BenchmarkResult {
     double execution_time;
     double result_value;
     int iteration;
+    int runs_used;
+    double ci_low_ms;
+    double ci_high_ms;
 };
 
-std::vector<BenchmarkResult> run_benchmark(size_t vector_size, int num_threads, 
-                                           const std::string& method, int iterations) {
+std::vector<BenchmarkResult> run_benchmark(const first_touch_vector<double>& a, const first_touch_vector<double>& b,
+                                           int num_threads, const std::string& method,
+                                           const run_plan& plan) {
     std::vector<BenchmarkResult> results;
+    size_t vector_size = a.size();
     
-    std::vector<double> a(vector_size);
-    std::vector<double> b(vector_size);
-    initialize_vector(a, 12345);
-    initialize_vector(b, 67890);
+    run_series series;
+    run_series_init(&series, &plan);
     
-    for (int iter = 0; iter < iterations; ++iter) {
+    for (int iter = 0; !run_series_done(&series); ++iter) {
         double result = 0.0;
         double execution_time = 0.0;
         
@@ -91,6 +157,8 @@ std::vector<BenchmarkResult> run_benchmark(size_t vector_size, int num_threads,
                 dot_product_reduction(a, b, num_threads);
             } else if (method == "no-reduction") {
                 dot_product_no_reduction(a, b, num_threads);
+            } else if (method == "reproducible") {
+                dot_product_reproducible(a, b, num_threads);
             }
         }
         
@@ -100,10 +168,13 @@ std::vector<BenchmarkResult> run_benchmark(size_t vector_size, int num_threads,
             result = dot_product_reduction(a, b, num_threads);
         } else if (method == "no-reduction") {
             result = dot_product_no_reduction(a, b, num_threads);
+        } else if (method == "reproducible") {
+            result = dot_product_reproducible(a, b, num_threads);
         }
         
         auto end = std::chrono::high_resolution_clock::now();
         execution_time = std::chrono::duration<double, std::milli>(end - start).count();
+        run_series_add(&series, execution_time);
         
         BenchmarkResult bench_result;
         bench_result.vector_size = vector_size;
@@ -116,14 +187,21 @@ std::vector<BenchmarkResult> run_benchmark(size_t vector_size, int num_threads,
         results.push_back(bench_result);
     }
     
+    for (auto& result : results) {
+        result.runs_used = series.count;
+        result.ci_low_ms = series.ci_low;
+        result.ci_high_ms = series.ci_high;
+    }
+    run_series_free(&series);
+    
     return results;
 }
 
 bool verify_correctness(size_t test_size = 10000) {
-    std::vector<double> a(test_size);
-    std::vector<double> b(test_size);
-    initialize_vector(a, 12345);
-    initialize_vector(b, 67890);
+    first_touch_vector<double> a(test_size);
+    first_touch_vector<double> b(test_size);
+    initialize_vector(a, 12345, omp_get_max_threads());
+    initialize_vector(b, 67890, omp_get_max_threads());
     
     double seq_result = dot_product_sequential(a, b);
     double par_reduction = dot_product_reduction(a, b, 4);
@@ -136,41 +214,83 @@ bool verify_correctness(size_t test_size = 10000) {
     bool reduction_ok = rel_error_reduction < epsilon;
     bool no_reduction_ok = rel_error_no_reduction < epsilon;
     
-    return reduction_ok && no_reduction_ok;
+    // The reproducible method must agree with itself bit for bit
+    double reproducible = dot_product_reproducible(a, b, 1);
+    bool reproducible_ok = std::abs((seq_result - reproducible) / seq_result) < epsilon;
+    for (int threads = 2; threads <= 8; ++threads) {
+        reproducible_ok = reproducible_ok && dot_product_reproducible(a, b, threads) == reproducible;
+    }
+    
+    return reduction_ok && no_reduction_ok && reproducible_ok;
 }
 
 int main(int argc, char* argv[]) {
     if (argc < 5) {
         std::cerr << "Usage: " << argv[0] << " <vector_size> <num_threads> <method> <iterations> [output_file]" << std::endl;
-        std::cerr << "Methods: reduction, no-reduction" << std::endl;
+        std::cerr << "Methods: reduction, no-reduction, reproducible (bit-identical for any thread count)" << std::endl;
+        std::cerr << "Iterations: N or auto[:min[:max[:width]]] (adaptive, e.g. auto:5:100:0.02)" << std::endl;
+        std::cerr << "Threads and methods may be comma-separated lists; the vectors are then" << std::endl;
+        std::cerr << "generated once and every combination runs in the same process." << std::endl;
         std::cerr << "Example: " << argv[0] << " 1000000 4 reduction 10" << std::endl;
+        std::cerr << "Sweep:   " << argv[0] << " 100000000 1,2,4,8 reduction,no-reduction 10 out.csv" << std::endl;
         return 1;
     }
     
     size_t vector_size = std::stoull(argv[1]);
-    int num_threads = std::stoi(argv[2]);
-    std::string method = argv[3];
-    int iterations = std::stoi(argv[4]);
+    std::vector<int> thread_counts;
+    std::vector<std::string> methods;
+    try {
+        thread_counts = parse_int_list(argv[2]);
+        methods = parse_list(argv[3]);
+    } catch (const std::exception& e) {
+        std::cerr << "Error: Invalid threads or methods: " << e.what() << std::endl;
+        return 1;
+    }
     std::string output_file = (argc > 5) ? argv[5] : "";
     
-    if (method != "reduction" && method != "no-reduction") {
-        std::cerr << "Error: Invalid method '" << method << "'. Use 'reduction' or 'no-reduction'" << std::endl;
+    run_plan plan;
+    if (run_plan_parse(argv[4], &plan) != 0) {
+        std::cerr << "Error: Invalid iterations '" << argv[4] << "'" << std::endl;
         return 1;
     }
     
+    if (numa_setup() != 0) {
+        return 1;
+    }
+    
+    for (const auto& method : methods) {
+        if (method != "reduction" && method != "no-reduction" && method != "reproducible") {
+            std::cerr << "Error: Invalid method '" << method << "'. Use 'reduction', 'no-reduction' or 'reproducible'" << std::endl;
+            return 1;
+        }
+    }
+    
     if (!verify_correctness()) {
         std::cerr << "Error: Correctness verification failed!" << std::endl;
         return 1;
     }
 
-    auto results = run_benchmark(vector_size, num_threads, method, iterations);
+    first_touch_vector<double> a(vector_size);
+    first_touch_vector<double> b(vector_size);
+    // Filled in parallel by the widest configuration's threads (first touch)
+    int fill_threads = *std::max_element(thread_counts.begin(), thread_counts.end());
+    initialize_vector(a, 12345, fill_threads);
+    initialize_vector(b, 67890, fill_threads);
+    
+    std::vector<BenchmarkResult> results;
+    for (const auto& method : methods) {
+        for (int num_threads : thread_counts) {
+            auto config_results = run_benchmark(a, b, num_threads, method, plan);
+            results.insert(results.end(), config_results.begin(), config_results.end());
+        }
+    }
     
     if (!output_file.empty()) {
         std::ofstream out(output_file, std::ios::app);
         if (out.is_open()) {
             out.seekp(0, std::ios::end);
             if (out.tellp() == 0) {
-                out << "vector_size,num_threads,method,iteration,execution_time_ms,result_value" << std::endl;
+                out << "vector_size,num_threads,method,iteration,execution_time_ms,result_value,runs_used,ci_low_ms,ci_high_ms,placement" << std::endl;
             }
             
             for (const auto& result : results) {
@@ -179,7 +299,10 @@ int main(int argc, char* argv[]) {
                     << result.method << ","
                     << result.iteration << ","
                     << std::fixed << std::setprecision(6) << result.execution_time << ","
-                    << std::scientific << std::setprecision(15) << result.result_value << std::endl;
+                    << std::scientific << std::setprecision(16) << result.result_value << ","
+                    << result.runs_used << ","
+                    << std::fixed << std::setprecision(6) << result.ci_low_ms << ","
+                    << result.ci_high_ms << "," << numa_placement() << std::endl;
             }
             out.close();
         } else {
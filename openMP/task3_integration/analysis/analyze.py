@@ -4,72 +4,51 @@ Analysis script for Task 3: Numerical Integration benchmarks
 Processes CSV results and calculates performance metrics
 """
 
-import pandas as pd
 import sys
 import os
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from benchkit import Schema, summarize
+from benchkit.stats import OPTIONAL_KEYS
+from benchkit.lazy import lazy_import
+from benchkit.placement import print_placement_summary
+
+pd = lazy_import('pandas')
+
 def load_data(csv_file):
     """Load benchmark data from CSV file"""
     try:
         df = pd.read_csv(csv_file)
         print(f"✓ Loaded {len(df)} records from {csv_file}")
+        # Results from before the adaptive method: N points, error not recorded
+        if 'subintervals' not in df.columns:
+            df = df.assign(subintervals=df['N'])
+        if 'abs_error' not in df.columns:
+            df = df.assign(abs_error=float('nan'))
         return df
     except Exception as e:
         print(f"✗ Error loading file: {e}")
         sys.exit(1)
 
+TASK_SCHEMA = Schema(
+    keys=['function', 'N', 'num_threads', 'method'],
+    names={'mean': 'time_mean', 'median': 'time_median', 'std': 'time_std',
+           'min': 'time_min', 'max': 'time_max', 'count': 'runs'},
+    extra={'result': ('result_value', 'mean'),
+           'subintervals': ('subintervals', 'max'),
+           'abs_error': ('abs_error', 'mean')},
+    # adaptive runs are configured by tolerance (0 for the fixed-N methods)
+    optional={**OPTIONAL_KEYS, 'tolerance': 0.0},
+)
+
 def calculate_statistics(df):
-    """Calculate mean, min, max, std for each configuration"""
-    stats = df.groupby(['function', 'N', 'num_threads', 'method']).agg({
-        'execution_time_ms': ['mean', 'min', 'max', 'std'],
-        'result_value': 'mean'
-    }).reset_index()
-    
-    # Flatten column names
-    stats.columns = ['function', 'N', 'num_threads', 'method', 
-                     'time_mean', 'time_min', 'time_max', 'time_std', 'result']
-    
-    return stats
+    """Calculate run statistics, speedup and efficiency for each configuration"""
+    return summarize(df, TASK_SCHEMA)
 
-def calculate_speedup(stats):
-    """Calculate speedup relative to single thread"""
-    results = []
-    
-    for func in stats['function'].unique():
-        for size in stats['N'].unique():
-            for method in stats['method'].unique():
-                subset = stats[(stats['function'] == func) & 
-                              (stats['N'] == size) & 
-                              (stats['method'] == method)]
-                
-                if len(subset) == 0:
-                    continue
-                
-                # Get baseline (1 thread)
-                baseline = subset[subset['num_threads'] == 1]
-                if len(baseline) == 0:
-                    continue
-                
-                baseline_time = baseline['time_mean'].values[0]
-                
-                for _, row in subset.iterrows():
-                    speedup = baseline_time / row['time_mean']
-                    efficiency = speedup / row['num_threads']
-                    
-                    results.append({
-                        'function': func,
-                        'N': size,
-                        'num_threads': row['num_threads'],
-                        'method': method,
-                        'time_mean': row['time_mean'],
-                        'time_std': row['time_std'],
-                        'result': row['result'],
-                        'speedup': speedup,
-                        'efficiency': efficiency
-                    })
-    
-    return pd.DataFrame(results)
+def fixed_n(df_analysis):
+    """Rows of the fixed-N methods (adaptive runs are configured by tolerance)"""
+    return df_analysis[df_analysis['method'] != 'adaptive']
 
 def print_summary(df_analysis):
     """Print summary tables"""
@@ -77,6 +56,7 @@ def print_summary(df_analysis):
     print("PERFORMANCE SUMMARY")
     print("="*80)
     
+    df_analysis = fixed_n(df_analysis)
     for func in df_analysis['function'].unique():
         print(f"\n{'='*80}")
         print(f"Function: {func}")
@@ -102,6 +82,59 @@ def print_summary(df_analysis):
             
             print()
 
+def compare_methods(df_analysis):
+    """Speedup of the inlined (SIMD) integrands over the function-pointer reduction"""
+    methods = set(df_analysis['method'].unique())
+    if not {'reduction', 'inlined'} <= methods:
+        return
+    
+    print("\n" + "="*80)
+    print("METHOD COMPARISON (inlined vs reduction, speedup = reduction / inlined time)")
+    print("="*80)
+    
+    for func in df_analysis['function'].unique():
+        print(f"\nFunction: {func}")
+        print(f"{'N':<14} {'Threads':<8} {'Reduction (ms)':<16} {'Inlined (ms)':<14} {'Speedup':<10}")
+        print("-" * 80)
+        
+        subset = df_analysis[df_analysis['function'] == func]
+        for size in sorted(subset['N'].unique()):
+            size_data = subset[subset['N'] == size]
+            for threads in sorted(size_data['num_threads'].unique()):
+                thread_data = size_data[size_data['num_threads'] == threads]
+                reduction = thread_data[thread_data['method'] == 'reduction']
+                inlined = thread_data[thread_data['method'] == 'inlined']
+                if len(reduction) == 0 or len(inlined) == 0:
+                    continue
+                
+                red_time = reduction['time_mean'].values[0]
+                inl_time = inlined['time_mean'].values[0]
+                print(f"{size:<14,} {threads:<8} {red_time:>14.3f}  {inl_time:>12.3f}  "
+                      f"{red_time / inl_time:>8.2f}x")
+
+def print_accuracy_summary(df_analysis):
+    """Time to accuracy: achieved error and fastest time of every configuration"""
+    if df_analysis['abs_error'].isna().all():
+        return
+    
+    print("\n" + "="*80)
+    print("TIME TO ACCURACY (fastest thread count of each configuration)")
+    print("="*80)
+    
+    for func in df_analysis['function'].unique():
+        subset = df_analysis[(df_analysis['function'] == func) & df_analysis['abs_error'].notna()]
+        best = subset.loc[subset.groupby(['method', 'N', 'tolerance'])['time_mean'].idxmin()]
+        
+        print(f"\nFunction: {func}")
+        print(f"{'Method':<12} {'N / tol':<14} {'Subintervals':<14} {'Abs error':<12} "
+              f"{'Threads':<8} {'Time (ms)':<12}")
+        print("-" * 80)
+        
+        for _, row in best.sort_values('abs_error', ascending=False).iterrows():
+            config = f"{row['tolerance']:.0e}" if row['method'] == 'adaptive' else f"{row['N']:,}"
+            print(f"{row['method']:<12} {config:<14} {row['subintervals']:<14,} "
+                  f"{row['abs_error']:<12.3e} {row['num_threads']:<8} {row['time_mean']:>10.3f}")
+
 def save_processed_data(df_analysis, output_file):
     """Save processed data to CSV"""
     df_analysis.to_csv(output_file, index=False)
@@ -116,6 +149,7 @@ def generate_summary_table(df_analysis, output_dir):
         f.write("NUMERICAL INTEGRATION - PERFORMANCE SUMMARY\n")
         f.write("="*100 + "\n\n")
         
+        df_analysis = fixed_n(df_analysis)
         for func in df_analysis['function'].unique():
             f.write(f"\n{'='*100}\n")
             f.write(f"Function: {func}\n")
@@ -162,16 +196,15 @@ def main():
     # Load data
     df = load_data(csv_file)
     
-    # Calculate statistics
-    print("\nCalculating statistics...")
-    stats = calculate_statistics(df)
-    
-    # Calculate speedup and efficiency
-    print("Calculating speedup and efficiency...")
-    df_analysis = calculate_speedup(stats)
+    # Calculate statistics, speedup and efficiency
+    print("\nCalculating statistics, speedup and efficiency...")
+    df_analysis = calculate_statistics(df)
     
     # Print summary
     print_summary(df_analysis)
+    compare_methods(df_analysis)
+    print_accuracy_summary(df_analysis)
+    print_placement_summary(df_analysis, 'num_threads')
     
     # Save processed data
     output_file = csv_file.replace('.csv', '_processed.csv')
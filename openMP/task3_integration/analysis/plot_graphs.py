@@ -1,21 +1,29 @@
 #!/usr/bin/env python3
 """
 Graph generation script for Task 3: Numerical Integration
-Creates performance visualization graphs for single method (reduction)
+Creates performance visualization graphs for the reduction method, and
+compares it with the inlined (SIMD) integrands when those were measured
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
 import os
 import sys
 from pathlib import Path
 import glob
 
-# Set style
-plt.style.use('seaborn-v0_8-darkgrid')
-plt.rcParams['figure.figsize'] = (12, 8)
-plt.rcParams['font.size'] = 10
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from benchkit.lazy import lazy_import
+from benchkit.placement import plot_placement_speedup
+from benchkit.render import Job, parse_options, per_placement, render, split
+
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+
+def set_style(plt):
+    plt.style.use('seaborn-v0_8-darkgrid')
+    plt.rcParams['figure.figsize'] = (12, 8)
+    plt.rcParams['font.size'] = 10
+
+plt = lazy_import('matplotlib.pyplot', setup=set_style)
 
 def find_latest_processed_file():
     """Find the most recent processed CSV file"""
@@ -54,6 +62,12 @@ def plot_execution_time(df, output_dir):
             plt.plot(method_data['num_threads'], method_data['time_mean'], 
                     marker='o', linewidth=2, markersize=8, label='OpenMP Reduction', color='#2E86AB')
             
+            # Plot inlined method
+            method_data = subset[subset['method'] == 'inlined'].sort_values('num_threads')
+            if len(method_data) > 0:
+                plt.plot(method_data['num_threads'], method_data['time_mean'], 
+                        marker='s', linewidth=2, markersize=8, label='Inlined (SIMD)', color='#A23B72')
+            
             plt.xlabel('Number of Threads', fontsize=12, fontweight='bold')
             plt.ylabel('Execution Time (ms)', fontsize=12, fontweight='bold')
             plt.title(f'Execution Time vs Threads\nFunction: {func}, N={size:,}', 
@@ -292,7 +306,75 @@ def plot_scalability_analysis(df, output_dir):
         plt.close()
         print(f"  ✓ {filename}")
 
+def plot_inlined_speedup(df, output_dir):
+    """Speedup of the inlined integrands over the pointer-based reduction"""
+    for func in df['function'].unique():
+        subset = df[df['function'] == func]
+        reduction = subset[subset['method'] == 'reduction']
+        inlined = subset[subset['method'] == 'inlined']
+        if len(reduction) == 0 or len(inlined) == 0:
+            continue
+        
+        merged = reduction.merge(inlined, on=['N', 'num_threads'], suffixes=('_red', '_inl'))
+        
+        plt.figure(figsize=(12, 8))
+        colors = plt.cm.viridis(np.linspace(0, 1, len(merged['N'].unique())))
+        
+        for idx, size in enumerate(sorted(merged['N'].unique())):
+            size_data = merged[merged['N'] == size].sort_values('num_threads')
+            plt.plot(size_data['num_threads'], size_data['time_mean_red'] / size_data['time_mean_inl'],
+                    marker='o', linewidth=2, markersize=8, label=f'N={size:,}', color=colors[idx])
+        
+        plt.axhline(y=1.0, color='k', linestyle='--', linewidth=2, alpha=0.7, label='Same as reduction')
+        plt.xlabel('Number of Threads', fontsize=12, fontweight='bold')
+        plt.ylabel('Speedup (reduction time / inlined time)', fontsize=12, fontweight='bold')
+        plt.title(f'Inlined (SIMD) vs Function-Pointer Reduction\nFunction: {func}', 
+                 fontsize=14, fontweight='bold')
+        plt.legend(fontsize=11)
+        plt.grid(True, alpha=0.3)
+        plt.xscale('log', base=2)
+        
+        filename = f'inlined_speedup_{func}.png'
+        filepath = os.path.join(output_dir, filename)
+        plt.savefig(filepath, dpi=300, bbox_inches='tight')
+        plt.close()
+        print(f"  ✓ {filename}")
+
+def plot_time_to_accuracy(df, output_dir):
+    """Fastest time vs achieved error, one curve per method"""
+    if 'abs_error' not in df.columns:
+        return
+    for func in df['function'].unique():
+        subset = df[(df['function'] == func) & df['abs_error'].notna()]
+        if len(subset) == 0:
+            continue
+        best = subset.loc[subset.groupby(['method', 'N', 'tolerance'])['time_mean'].idxmin()]
+        
+        plt.figure(figsize=(12, 8))
+        for method in sorted(best['method'].unique()):
+            method_data = best[best['method'] == method].sort_values('abs_error')
+            # exact results (error 0) are drawn at the bottom of the axis
+            plt.plot(method_data['abs_error'].clip(lower=1e-16), method_data['time_mean'],
+                    marker='o', linewidth=2, markersize=8, label=method)
+        
+        plt.xlabel('Absolute Error (vs exact integral)', fontsize=12, fontweight='bold')
+        plt.ylabel('Execution Time (ms, fastest thread count)', fontsize=12, fontweight='bold')
+        plt.title(f'Time to Accuracy\nFunction: {func}', fontsize=14, fontweight='bold')
+        plt.legend(fontsize=11)
+        plt.grid(True, alpha=0.3)
+        plt.xscale('log')
+        plt.yscale('log')
+        plt.gca().invert_xaxis()
+        
+        filename = f'time_to_accuracy_{func}.png'
+        filepath = os.path.join(output_dir, filename)
+        plt.savefig(filepath, dpi=300, bbox_inches='tight')
+        plt.close()
+        print(f"  ✓ {filename}")
+
 def main():
+    options = parse_options()
+    
     print("="*80)
     print("NUMERICAL INTEGRATION - GRAPH GENERATION")
     print("="*80)
@@ -308,27 +390,38 @@ def main():
     
     # Load data
     df = load_data(csv_file)
+    # adaptive runs have no N; the per-N graphs only cover the fixed-N methods
+    fixed = df[df['method'] != 'adaptive']
     
     # Create output directory
     output_dir = '../graphs'
     os.makedirs(output_dir, exist_ok=True)
     
     # Generate graphs
-    print("\nGenerating graphs...")
-    print("\n1. Execution Time graphs:")
-    plot_execution_time(df, output_dir)
-    
-    print("\n2. Speedup graphs:")
-    plot_speedup(df, output_dir)
-    
-    print("\n3. Efficiency graphs:")
-    plot_efficiency(df, output_dir)
-    
-    print("\n4. Size comparison graphs:")
-    plot_size_comparison(df, output_dir)
+    print(f"\nGenerating graphs (jobs: {options.jobs})...")
+    # Everything but the placement comparison is drawn once per placement policy
+    def policy_jobs(directory, where):
+        return [
+            *split(fixed, plot_execution_time, ['function', 'N'], directory,
+                   title="\n1. Execution Time graphs:", where=where),
+            *split(fixed, plot_speedup, ['function', 'N'], directory,
+                   title="\n2. Speedup graphs:", where=where),
+            *split(fixed, plot_efficiency, ['function', 'N'], directory,
+                   title="\n3. Efficiency graphs:", where=where),
+            *split(df, plot_size_comparison, 'function', directory,
+                   title="\n4. Size comparison graphs:", where=where),
+            *split(df, plot_scalability_analysis, 'function', directory,
+                   title="\n5. Scalability analysis:", where=where),
+            *split(df, plot_inlined_speedup, 'function', directory,
+                   title="\n6. Inlined vs reduction:", where=where),
+            *split(df, plot_time_to_accuracy, 'function', directory,
+                   title="\n7. Time to accuracy:", where=where),
+        ]
     
-    print("\n5. Scalability analysis:")
-    plot_scalability_analysis(df, output_dir)
+    render([
+        *per_placement(df, output_dir, policy_jobs),
+        Job(plot_placement_speedup, output_dir, 'num_threads'),
+    ], df, options, output_dir)
     
     print("\n" + "="*80)
     print("GRAPH GENERATION COMPLETE")
@@ -340,6 +433,8 @@ def main():
     print("  - efficiency_*.png - Parallel efficiency vs threads")
     print("  - size_comparison_*.png - Performance across problem sizes")
     print("  - scalability_analysis_*.png - Strong scaling analysis")
+    print("  - inlined_speedup_*.png - Inlined (SIMD) over reduction speedup")
+    print("  - time_to_accuracy_*.png - Fastest time vs achieved error per method")
 
 if __name__ == '__main__':
     main()
@@ -9,6 +9,28 @@
 #include <cmath>
 #include <string>
 
+#include "../../common/bench_numa.h"
+#include "../../common/bench_runs.h"
+
+// glibc's libmvec has SIMD variants of sin and exp, but <math.h> only
+// declares them under -ffast-math. Declaring them here lets GCC call them
+// from the `omp simd` loop of integrate_inlined at the default flags (libm
+// pulls in libmvec as needed). sqrt, for circle, vectorizes only with
+// -fno-math-errno.
+#if defined(__GNUC__) && !defined(__clang__) && defined(__x86_64__) && \
+    defined(__GLIBC_PREREQ) && !defined(__FAST_MATH__)
+#if __GLIBC_PREREQ(2, 22)
+extern "C" {
+__attribute__((simd("notinbranch"))) double sin(double) throw();
+__attribute__((simd("notinbranch"))) double exp(double) throw();
+}
+#endif
+#endif
+
+const int INLINED_BLOCK = 4096;
+const int ADAPTIVE_TASK_DEPTH = 12;
+const int ADAPTIVE_MAX_DEPTH = 50;
+
 double test_function_1(double x) {
     return x * x;
 }
@@ -29,6 +51,27 @@ double test_function_5(double x) {
     return std::sqrt(1.0 - x * x);
 }
 
+// The same integrands as functors, for integrate_inlined
+struct Square {
+    double operator()(double x) const { return x * x; }
+};
+
+struct Sine {
+    double operator()(double x) const { return std::sin(x); }
+};
+
+struct Exponential {
+    double operator()(double x) const { return std::exp(x); }
+};
+
+struct Arctan {
+    double operator()(double x) const { return 1.0 / (1.0 + x * x); }
+};
+
+struct Circle {
+    double operator()(double x) const { return std::sqrt(1.0 - x * x); }
+};
+
 typedef double (*FunctionPtr)(double);
 
 FunctionPtr get_function(const std::string& name) {
@@ -67,6 +110,121 @@ double integrate_reduction(FunctionPtr f, double a, double b, long long N, int n
     return h * sum;
 }
 
+// integrate_reduction with the integrand inlined: each thread sums blocks of
+// INLINED_BLOCK points in an `omp simd` loop, so the compiler evaluates f on
+// whole vectors. The int block index keeps the index-to-double conversion
+// vectorizable; the points are the same a + i * h as in integrate_reduction.
+template <typename F>
+double integrate_inlined(F f, double a, double b, long long N, int num_threads) {
+    double h = (b - a) / N;
+    long long blocks = (N + INLINED_BLOCK - 1) / INLINED_BLOCK;
+    double sum = 0.0;
+    
+    omp_set_num_threads(num_threads);
+    
+    #pragma omp parallel for schedule(static) reduction(+:sum)
+    for (long long k = 0; k < blocks; ++k) {
+        long long first = k * INLINED_BLOCK;
+        int len = (int)std::min<long long>(INLINED_BLOCK, N - first);
+        double base = (double)first;
+        double block_sum = 0.0;
+        
+        #pragma omp simd reduction(+:block_sum)
+        for (int j = 0; j < len; ++j) {
+            block_sum += f(a + (base + j) * h);
+        }
+        sum += block_sum;
+    }
+    
+    return h * sum;
+}
+
+// integrate_inlined for a built-in function by name
+double integrate_builtin(const std::string& name, double a, double b, long long N, int num_threads) {
+    if (name == "sin") return integrate_inlined(Sine(), a, b, N, num_threads);
+    if (name == "exp") return integrate_inlined(Exponential(), a, b, N, num_threads);
+    if (name == "arctan") return integrate_inlined(Arctan(), a, b, N, num_threads);
+    if (name == "circle") return integrate_inlined(Circle(), a, b, N, num_threads);
+    return integrate_inlined(Square(), a, b, N, num_threads);
+}
+
+struct AdaptiveResult {
+    double value;
+    long long subintervals;
+};
+
+// Adaptive Simpson on [a, b] given f at a, (a+b)/2, b and the Simpson
+// estimate `whole`: accepts the two half-interval estimates when they agree
+// with it to 15 * tol, otherwise refines both halves with tol / 2. Halves
+// above ADAPTIVE_TASK_DEPTH are refined as OpenMP tasks, deeper ones inline.
+AdaptiveResult adaptive_simpson(FunctionPtr f, double a, double b, double fa, double fm,
+                                double fb, double whole, double tol, int depth) {
+    double m = 0.5 * (a + b);
+    double lm = 0.5 * (a + m);
+    double rm = 0.5 * (m + b);
+    double flm = f(lm);
+    double frm = f(rm);
+    double left = (m - a) / 6.0 * (fa + 4.0 * flm + fm);
+    double right = (b - m) / 6.0 * (fm + 4.0 * frm + fb);
+    double delta = left + right - whole;
+    
+    if (depth >= ADAPTIVE_MAX_DEPTH || std::abs(delta) <= 15.0 * tol ||
+        !(a < lm && lm < m && m < rm && rm < b)) {
+        AdaptiveResult leaf = {left + right + delta / 15.0, 1};
+        return leaf;
+    }
+    
+    AdaptiveResult l, r;
+    if (depth < ADAPTIVE_TASK_DEPTH) {
+        #pragma omp task shared(l)
+        l = adaptive_simpson(f, a, m, fa, flm, fm, left, 0.5 * tol, depth + 1);
+        r = adaptive_simpson(f, m, b, fm, frm, fb, right, 0.5 * tol, depth + 1);
+        #pragma omp taskwait
+    } else {
+        l = adaptive_simpson(f, a, m, fa, flm, fm, left, 0.5 * tol, depth + 1);
+        r = adaptive_simpson(f, m, b, fm, frm, fb, right, 0.5 * tol, depth + 1);
+    }
+    
+    AdaptiveResult sum = {l.value + r.value, l.subintervals + r.subintervals};
+    return sum;
+}
+
+// The subdivision only depends on f and tol, so the result and the number of
+// subintervals are the same for every thread count
+AdaptiveResult integrate_adaptive(FunctionPtr f, double a, double b, double tol, int num_threads) {
+    AdaptiveResult result = {0.0, 0};
+    
+    omp_set_num_threads(num_threads);
+    
+    #pragma omp parallel
+    {
+        #pragma omp single
+        {
+            double fa = f(a);
+            double fm = f(0.5 * (a + b));
+            double fb = f(b);
+            double whole = (b - a) / 6.0 * (fa + 4.0 * fm + fb);
+            result = adaptive_simpson(f, a, b, fa, fm, fb, whole, tol, 0);
+        }
+    }
+    
+    return result;
+}
+
+// Exact integral of a built-in function over [a, b] (the exact_integral
+// values in data/test_configs.json, for any bounds)
+double antiderivative(const std::string& name, double x) {
+    if (name == "sin") return -std::cos(x);
+    if (name == "exp") return std::exp(x);
+    if (name == "arctan") return std::atan(x);
+    if (name == "circle") return 0.5 * (x * std::sqrt(1.0 - x * x) + std::asin(x));
+    return x * x * x / 3.0;
+}
+
+double exact_integral(const std::string& name, double a, double b) {
+    return antiderivative(name, b) - antiderivative(name, a);
+}
+
 struct BenchmarkResult {
     long long N;
     int num_threads;
@@ -74,36 +232,58 @@ struct BenchmarkResult {
     std::string function;
     double a;
     double b;
+    double tolerance;
+    long long subintervals;
+    double abs_error;
     double execution_time;
     double result_value;
     int iteration;
+    int runs_used;
+    double ci_low_ms;
+    double ci_high_ms;
 };
 
 std::vector<BenchmarkResult> run_benchmark(const std::string& function_name,
-                                           double a, double b, long long N,
+                                           double a, double b, long long N, double tolerance,
                                            int num_threads, const std::string& method,
-                                           int iterations) {
+                                           const run_plan& plan) {
     std::vector<BenchmarkResult> results;
     FunctionPtr f = get_function(function_name);
+    double exact = exact_integral(function_name, a, b);
     
     if (method == "reduction") {
         integrate_reduction(f, a, b, N, num_threads);
+    } else if (method == "inlined") {
+        integrate_builtin(function_name, a, b, N, num_threads);
+    } else if (method == "adaptive") {
+        integrate_adaptive(f, a, b, tolerance, num_threads);
     }
     
-    for (int iter = 0; iter < iterations; ++iter) {
+    run_series series;
+    run_series_init(&series, &plan);
+    
+    for (int iter = 0; !run_series_done(&series); ++iter) {
         double result = 0.0;
+        long long subintervals = N;
         double execution_time = 0.0;
         
         auto start = std::chrono::high_resolution_clock::now();
         
         if (method == "reduction") {
             result = integrate_reduction(f, a, b, N, num_threads);
+        } else if (method == "inlined") {
+            result = integrate_builtin(function_name, a, b, N, num_threads);
+        } else if (method == "adaptive") {
+            AdaptiveResult adaptive = integrate_adaptive(f, a, b, tolerance, num_threads);
+            result = adaptive.value;
+            subintervals = adaptive.subintervals;
         } else if (method == "sequential") {
             result = integrate_sequential(f, a, b, N);
         }
         
         auto end = std::chrono::high_resolution_clock::now();
         execution_time = std::chrono::duration<double, std::milli>(end - start).count();
+        run_series_add(&series, execution_time);
         
         BenchmarkResult bench_result;
         bench_result.N = N;
@@ -112,6 +292,9 @@ std::vector<BenchmarkResult> run_benchmark(const std::string& function_name,
         bench_result.function = function_name;
         bench_result.a = a;
         bench_result.b = b;
+        bench_result.tolerance = tolerance;
+        bench_result.subintervals = subintervals;
+        bench_result.abs_error = std::abs(result - exact);
         bench_result.execution_time = execution_time;
         bench_result.result_value = result;
         bench_result.iteration = iter;
@@ -119,6 +302,13 @@ std::vector<BenchmarkResult> run_benchmark(const std::string& function_name,
         results.push_back(bench_result);
     }
     
+    for (auto& result : results) {
+        result.runs_used = series.count;
+        result.ci_low_ms = series.ci_low;
+        result.ci_high_ms = series.ci_high;
+    }
+    run_series_free(&series);
+    
     return results;
 }
 
@@ -129,35 +319,75 @@ bool verify_correctness() {
     
     double seq = integrate_sequential(test_function_1, a, b, N);
     double par_red = integrate_reduction(test_function_1, a, b, N, 4);
+    double inlined = integrate_inlined(Square(), a, b, N, 4);
+    
+    if (std::abs(seq - exact) > 1e-3 || std::abs(par_red - exact) > 1e-3 ||
+        std::abs(inlined - exact) > 1e-3) {
+        return false;
+    }
     
-    if (std::abs(seq - exact) > 1e-3 || std::abs(par_red - exact) > 1e-3) {
+    AdaptiveResult adaptive = integrate_adaptive(test_function_1, a, b, 1e-10, 4);
+    if (std::abs(adaptive.value - exact) > 1e-9) {
         return false;
     }
     
+    // Vector math may round differently from the scalar libm calls
+    const char* names[] = {"x2", "sin", "exp", "arctan", "circle"};
+    for (const char* name : names) {
+        double pointer = integrate_reduction(get_function(name), 0.0, 1.0, N, 4);
+        if (std::abs(integrate_builtin(name, 0.0, 1.0, N, 4) - pointer) > 1e-9) {
+            return false;
+        }
+    }
+    
     return true;
 }
 
 int main(int argc, char* argv[]) {
     if (argc < 8) {
-        std::cerr << "Usage: " << argv[0] << " <function> <a> <b> <N> <num_threads> <method> <iterations> [output_file]" << std::endl;
+        std::cerr << "Usage: " << argv[0] << " <function> <a> <b> <N|tolerance> <num_threads> <method> <iterations> [output_file]" << std::endl;
         std::cerr << "\nFunctions: x2, sin, exp, arctan, circle" << std::endl;
-        std::cerr << "Methods: sequential, reduction" << std::endl;
+        std::cerr << "Methods: sequential, reduction, inlined, adaptive" << std::endl;
+        std::cerr << "N: number of points; adaptive takes a target tolerance instead (e.g. 1e-10)" << std::endl;
+        std::cerr << "Iterations: N or auto[:min[:max[:width]]] (adaptive, e.g. auto:5:100:0.02)" << std::endl;
         std::cerr << "\nExamples:" << std::endl;
         std::cerr << "  " << argv[0] << " x2 0 1 1000000 4 reduction 10" << std::endl;
         std::cerr << "  " << argv[0] << " sin 0 3.14159 10000000 8 reduction 5" << std::endl;
+        std::cerr << "  " << argv[0] << " sin 0 3.14159 10000000 8 inlined 5" << std::endl;
+        std::cerr << "  " << argv[0] << " circle 0 1 1e-12 8 adaptive 5" << std::endl;
         return 1;
     }
     
     std::string function_name = argv[1];
     double a = std::stod(argv[2]);
     double b = std::stod(argv[3]);
-    long long N = std::stoll(argv[4]);
     int num_threads = std::stoi(argv[5]);
     std::string method = argv[6];
-    int iterations = std::stoi(argv[7]);
+    long long N = 0;
+    double tolerance = 0.0;
+    if (method == "adaptive") {
+        tolerance = std::stod(argv[4]);
+        if (!(tolerance > 0.0)) {
+            std::cerr << "Error: Invalid tolerance '" << argv[4] << "'" << std::endl;
+            return 1;
+        }
+    } else {
+        N = std::stoll(argv[4]);
+    }
     std::string output_file = (argc > 8) ? argv[8] : "";
     
-    if (method != "sequential" && method != "reduction") {
+    run_plan plan;
+    if (run_plan_parse(argv[7], &plan) != 0) {
+        std::cerr << "Error: Invalid iterations '" << argv[7] << "'" << std::endl;
+        return 1;
+    }
+    
+    if (numa_setup() != 0) {
+        return 1;
+    }
+    
+    if (method != "sequential" && method != "reduction" && method != "inlined" &&
+        method != "adaptive") {
         std::cerr << "Error: Invalid method '" << method << "'" << std::endl;
         return 1;
     }
@@ -169,7 +399,7 @@ int main(int argc, char* argv[]) {
     }
     
     // Run benchmark
-    auto results = run_benchmark(function_name, a, b, N, num_threads, method, iterations);
+    auto results = run_benchmark(function_name, a, b, N, tolerance, num_threads, method, plan);
     
     // Calculate statistics
     double sum_time = 0.0;
@@ -190,7 +420,7 @@ int main(int argc, char* argv[]) {
         if (out.is_open()) {
             out.seekp(0, std::ios::end);
             if (out.tellp() == 0) {
-                out << "function,a,b,N,num_threads,method,iteration,execution_time_ms,result_value" << std::endl;
+                out << "function,a,b,N,num_threads,method,iteration,execution_time_ms,result_value,runs_used,ci_low_ms,ci_high_ms,placement,tolerance,subintervals,abs_error" << std::endl;
             }
             
             for (const auto& result : results) {
@@ -202,7 +432,13 @@ int main(int argc, char* argv[]) {
                     << result.method << ","
                     << result.iteration << ","
                     << result.execution_time << ","
-                    << std::scientific << std::setprecision(15) << result.result_value << std::endl;
+                    << std::scientific << std::setprecision(15) << result.result_value << ","
+                    << result.runs_used << ","
+                    << std::fixed << std::setprecision(6) << result.ci_low_ms << ","
+                    << result.ci_high_ms << "," << numa_placement() << ","
+                    << std::scientific << std::setprecision(3) << result.tolerance << ","
+                    << result.subintervals << ","
+                    << std::setprecision(6) << result.abs_error << std::endl;
             }
             out.close();
         }
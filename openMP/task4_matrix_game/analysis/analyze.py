@@ -4,68 +4,48 @@ Analysis script for Task 4: Matrix Game (Maximin) benchmarks
 Processes CSV results and calculates performance metrics
 """
 
-import pandas as pd
 import sys
 import os
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from benchkit import Schema, summarize
+from benchkit.stats import OPTIONAL_KEYS
+from benchkit.lazy import lazy_import
+from benchkit.placement import print_placement_summary
+
+pd = lazy_import('pandas')
+
 def load_data(csv_file):
     """Load benchmark data from CSV file"""
     try:
         df = pd.read_csv(csv_file)
         print(f"✓ Loaded {len(df)} records from {csv_file}")
+        # Results from before the pruned method scanned every element
+        if 'skipped_fraction' not in df.columns:
+            df = df.assign(skipped_fraction=0.0)
         return df
     except Exception as e:
         print(f"✗ Error loading file: {e}")
         sys.exit(1)
 
+TASK_SCHEMA = Schema(
+    keys=['N', 'num_threads', 'method'],
+    names={'mean': 'time_mean', 'median': 'time_median', 'std': 'time_std',
+           'min': 'time_min', 'max': 'time_max', 'count': 'runs'},
+    extra={'result': ('result_value', 'mean'),
+           'skipped': ('skipped_fraction', 'mean')},
+    # random or adversarial input (see matrix_value in matrix_game.cpp)
+    optional={**OPTIONAL_KEYS, 'matrix': 'random'},
+)
+
 def calculate_statistics(df):
-    """Calculate mean, min, max, std for each configuration"""
-    stats = df.groupby(['N', 'num_threads', 'method']).agg({
-        'execution_time_ms': ['mean', 'min', 'max', 'std'],
-        'result_value': 'mean'
-    }).reset_index()
-    
-    # Flatten column names
-    stats.columns = ['N', 'num_threads', 'method', 
-                     'time_mean', 'time_min', 'time_max', 'time_std', 'result']
-    
-    return stats
+    """Calculate run statistics, speedup and efficiency for each configuration"""
+    return summarize(df, TASK_SCHEMA)
 
-def calculate_speedup(stats):
-    """Calculate speedup relative to single thread"""
-    results = []
-    
-    for size in stats['N'].unique():
-        for method in stats['method'].unique():
-            subset = stats[(stats['N'] == size) & (stats['method'] == method)]
-            
-            if len(subset) == 0:
-                continue
-            
-            # Get baseline (1 thread)
-            baseline = subset[subset['num_threads'] == 1]
-            if len(baseline) == 0:
-                continue
-            
-            baseline_time = baseline['time_mean'].values[0]
-            
-            for _, row in subset.iterrows():
-                speedup = baseline_time / row['time_mean']
-                efficiency = speedup / row['num_threads']
-                
-                results.append({
-                    'N': size,
-                    'num_threads': row['num_threads'],
-                    'method': method,
-                    'time_mean': row['time_mean'],
-                    'time_std': row['time_std'],
-                    'result': row['result'],
-                    'speedup': speedup,
-                    'efficiency': efficiency
-                })
-    
-    return pd.DataFrame(results)
+def method_label(method, matrix):
+    """Method name, marked with the matrix kind unless it is random"""
+    return method if matrix == 'random' else f"{method} [{matrix}]"
 
 def print_summary(df_analysis):
     """Print summary tables"""
@@ -80,20 +60,28 @@ def print_summary(df_analysis):
         
         subset = df_analysis[df_analysis['N'] == size]
         
-        print(f"\n{'Method':<15} {'Threads':<8} {'Time (ms)':<12} {'Speedup':<10} {'Efficiency':<12}")
+        print(f"\n{'Method':<24} {'Threads':<8} {'Time (ms)':<12} {'Speedup':<10} {'Efficiency':<12}")
         print("-" * 80)
         
-        for method in sorted(subset['method'].unique()):
-            method_data = subset[subset['method'] == method].sort_values('num_threads')
-            
-            for _, row in method_data.iterrows():
-                print(f"{method:<15} {row['num_threads']:<8} "
+        for (method, matrix), method_data in subset.groupby(['method', 'matrix']):
+            label = method_label(method, matrix)
+            for _, row in method_data.sort_values('num_threads').iterrows():
+                print(f"{label:<24} {row['num_threads']:<8} "
                       f"{row['time_mean']:>10.3f}  "
                       f"{row['speedup']:>8.2f}x  "
                       f"{row['efficiency']:>10.1%}")
         
         print()
 
+def bandwidth_gbs(row):
+    """Matrix bytes read per second of the mean time
+
+    Every method reads N*N doubles except pruned, which reads only the elements
+    it did not skip (skipped_fraction, 0 for the other methods).
+    """
+    scanned = row['N'] ** 2 * (1.0 - row['skipped'])
+    return scanned * 8 / (row['time_mean'] * 1e6)
+
 def compare_methods(df_analysis):
     """Compare different methods"""
     print("\n" + "="*80)
@@ -113,8 +101,33 @@ def compare_methods(df_analysis):
             if len(thread_data) > 1:
                 print(f"\n  Threads: {threads}")
                 for _, row in thread_data.iterrows():
-                    print(f"    {row['method']:<12}: {row['time_mean']:>8.3f} ms "
-                          f"(speedup: {row['speedup']:>6.2f}x, efficiency: {row['efficiency']:>6.1%})")
+                    print(f"    {method_label(row['method'], row['matrix']):<24}: {row['time_mean']:>8.3f} ms "
+                          f"(speedup: {row['speedup']:>6.2f}x, efficiency: {row['efficiency']:>6.1%}, "
+                          f"{bandwidth_gbs(row):>6.2f} GB/s)")
+
+def print_pruning_summary(df_analysis):
+    """Pruned vs flat (the same kernel without pruning) and the share of elements skipped"""
+    pruned = df_analysis[df_analysis['method'] == 'pruned']
+    flat = df_analysis[df_analysis['method'] == 'flat']
+    if len(pruned) == 0:
+        return
+    
+    print("\n" + "="*80)
+    print("PRUNING (gain = flat time / pruned time)")
+    print("="*80)
+    print(f"\n{'N':<8} {'Matrix':<12} {'Threads':<8} {'Skipped':<10} {'Pruned (ms)':<12} "
+          f"{'Flat (ms)':<12} {'Gain':<8}")
+    print("-" * 80)
+    
+    merged = pruned.merge(flat, on=['N', 'matrix', 'num_threads', 'placement'],
+                          how='left', suffixes=('', '_flat'))
+    for _, row in merged.sort_values(['N', 'matrix', 'num_threads']).iterrows():
+        flat_time = row['time_mean_flat']
+        measured = pd.notna(flat_time)
+        gain = f"{flat_time / row['time_mean']:.2f}x" if measured else '-'
+        flat_text = f"{flat_time:.3f}" if measured else '-'
+        print(f"{row['N']:<8} {row['matrix']:<12} {row['num_threads']:<8} {row['skipped']:<10.1%} "
+              f"{row['time_mean']:<12.3f} {flat_text:<12} {gain:<8}")
 
 def save_processed_data(df_analysis, output_file):
     """Save processed data to CSV"""
@@ -138,14 +151,13 @@ def generate_summary_table(df_analysis, output_dir):
             
             subset = df_analysis[df_analysis['N'] == size]
             
-            f.write(f"\n{'Method':<15} {'Threads':<8} {'Time (ms)':<15} {'Speedup':<12} {'Efficiency':<12} {'Result':<20}\n")
+            f.write(f"\n{'Method':<24} {'Threads':<8} {'Time (ms)':<15} {'Speedup':<12} {'Efficiency':<12} {'Result':<20}\n")
             f.write("-" * 100 + "\n")
             
-            for method in sorted(subset['method'].unique()):
-                method_data = subset[subset['method'] == method].sort_values('num_threads')
-                
-                for _, row in method_data.iterrows():
-                    f.write(f"{method:<15} {row['num_threads']:<8} "
+            for (method, matrix), method_data in subset.groupby(['method', 'matrix']):
+                label = method_label(method, matrix)
+                for _, row in method_data.sort_values('num_threads').iterrows():
+                    f.write(f"{label:<24} {row['num_threads']:<8} "
                            f"{row['time_mean']:>13.3f}  "
                            f"{row['speedup']:>10.2f}x  "
                            f"{row['efficiency']:>10.1%}  "
@@ -170,8 +182,9 @@ def generate_summary_table(df_analysis, output_dir):
                 if len(thread_data) > 1:
                     f.write(f"\n  Threads: {threads}\n")
                     for _, row in thread_data.iterrows():
-                        f.write(f"    {row['method']:<12}: {row['time_mean']:>8.3f} ms "
-                               f"(speedup: {row['speedup']:>6.2f}x, efficiency: {row['efficiency']:>6.1%})\n")
+                        f.write(f"    {method_label(row['method'], row['matrix']):<24}: {row['time_mean']:>8.3f} ms "
+                               f"(speedup: {row['speedup']:>6.2f}x, efficiency: {row['efficiency']:>6.1%}, "
+                               f"{bandwidth_gbs(row):>6.2f} GB/s)\n")
             f.write("\n")
     
     print(f"✓ Summary table saved to: {output_file}")
@@ -194,19 +207,17 @@ def main():
     # Load data
     df = load_data(csv_file)
     
-    # Calculate statistics
-    print("\nCalculating statistics...")
-    stats = calculate_statistics(df)
-    
-    # Calculate speedup and efficiency
-    print("Calculating speedup and efficiency...")
-    df_analysis = calculate_speedup(stats)
+    # Calculate statistics, speedup and efficiency
+    print("\nCalculating statistics, speedup and efficiency...")
+    df_analysis = calculate_statistics(df)
     
     # Print summary
     print_summary(df_analysis)
+    print_placement_summary(df_analysis, 'num_threads')
     
     # Compare methods
     compare_methods(df_analysis)
+    print_pruning_summary(df_analysis)
     
     # Save processed data
     output_file = csv_file.replace('.csv', '_processed.csv')
@@ -4,15 +4,22 @@ Graph generation script for Task 4: Matrix Game (Maximin) benchmarks
 Creates performance visualization graphs
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
 import os
 import sys
 from pathlib import Path
 
-# Set style
-plt.style.use('seaborn-v0_8-darkgrid')
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from benchkit.lazy import lazy_import
+from benchkit.placement import plot_placement_speedup
+from benchkit.render import Job, parse_options, per_placement, render, split
+
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+
+def set_style(plt):
+    plt.style.use('seaborn-v0_8-darkgrid')
+
+plt = lazy_import('matplotlib.pyplot', setup=set_style)
 
 def find_latest_processed_file(results_dir='../results'):
     """Find the most recent processed CSV file"""
@@ -200,7 +207,51 @@ def plot_scalability_analysis(df, output_dir):
     plt.close()
     print(f"✓ Saved: {output_file}")
 
+def plot_pruning(df, output_dir):
+    """Time of the flat and pruned methods per matrix kind, with elements skipped"""
+    data = df[df['method'].isin(['flat', 'pruned'])]
+    if 'pruned' not in set(data['method']):
+        return
+    
+    for size in sorted(data['N'].unique()):
+        subset = data[data['N'] == size]
+        fig, (ax_time, ax_skip) = plt.subplots(1, 2, figsize=(16, 7))
+        
+        for (method, matrix), group in subset.groupby(['method', 'matrix']):
+            group = group.sort_values('num_threads')
+            linestyle = '-' if matrix == 'random' else '--'
+            ax_time.plot(group['num_threads'], group['time_mean'], marker='o', linewidth=2,
+                         markersize=8, linestyle=linestyle, label=f'{method} ({matrix})')
+            if method == 'pruned':
+                ax_skip.plot(group['num_threads'], group['skipped'], marker='o', linewidth=2,
+                             markersize=8, linestyle=linestyle, label=matrix)
+        
+        ax_time.set_xlabel('Number of Threads', fontsize=12, fontweight='bold')
+        ax_time.set_ylabel('Execution Time (ms)', fontsize=12, fontweight='bold')
+        ax_time.set_title('Flat vs Pruned Maximin', fontsize=14, fontweight='bold')
+        ax_time.set_xscale('log', base=2)
+        ax_time.set_yscale('log')
+        ax_time.legend(fontsize=11)
+        ax_time.grid(True, alpha=0.3)
+        
+        ax_skip.set_xlabel('Number of Threads', fontsize=12, fontweight='bold')
+        ax_skip.set_ylabel('Fraction of Elements Skipped', fontsize=12, fontweight='bold')
+        ax_skip.set_title('Pruned Elements', fontsize=14, fontweight='bold')
+        ax_skip.set_xscale('log', base=2)
+        ax_skip.set_ylim(0, 1.05)
+        ax_skip.legend(fontsize=11)
+        ax_skip.grid(True, alpha=0.3)
+        
+        fig.suptitle(f'Matrix Size {size}x{size}', fontsize=14, fontweight='bold')
+        plt.tight_layout()
+        output_file = os.path.join(output_dir, f'pruning_size_{size}.png')
+        plt.savefig(output_file, dpi=300, bbox_inches='tight')
+        plt.close()
+        print(f"✓ Saved: {output_file}")
+
 def main():
+    options = parse_options()
+    
     print("="*80)
     print("MATRIX GAME (MAXIMIN) - GRAPH GENERATION")
     print("="*80)
@@ -226,14 +277,24 @@ def main():
     os.makedirs(output_dir, exist_ok=True)
     
     # Generate graphs
-    print("\nGenerating graphs...")
+    print(f"\nGenerating graphs (jobs: {options.jobs})...")
     print("-" * 80)
     
-    plot_execution_time(df, output_dir)
-    plot_speedup(df, output_dir)
-    plot_efficiency(df, output_dir)
-    plot_size_comparison(df, output_dir)
-    plot_scalability_analysis(df, output_dir)
+    # Everything but the placement comparison is drawn once per placement policy
+    def policy_jobs(directory, where):
+        return [
+            *split(df, plot_execution_time, 'N', directory, where=where),
+            *split(df, plot_speedup, 'N', directory, where=where),
+            *split(df, plot_efficiency, 'N', directory, where=where),
+            Job(plot_size_comparison, directory, where=where),
+            Job(plot_scalability_analysis, directory, where=where),
+            *split(df, plot_pruning, 'N', directory, where=where),
+        ]
+    
+    render([
+        *per_placement(df, output_dir, policy_jobs),
+        Job(plot_placement_speedup, output_dir, 'num_threads'),
+    ], df, options, output_dir)
     
     print("-" * 80)
     print(f"\n✓ All graphs saved to: {output_dir}")
@@ -247,6 +308,7 @@ def main():
     print(f"  - efficiency_size_*.png")
     print(f"  - size_comparison.png")
     print(f"  - scalability_analysis.png")
+    print(f"  - pruning_size_*.png (when the pruned method was measured)")
 
 if __name__ == '__main__':
     main()
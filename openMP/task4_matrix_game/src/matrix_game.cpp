@@ -7,19 +7,114 @@
 #include <omp.h>
 #include <cmath>
 #include <string>
-#include <random>
 #include <limits>
+#include <cstdlib>
+#include <atomic>
+#include <new>
+
+#include "../../common/bench_numa.h"
+#include "../../common/bench_rng.h"
+#include "../../common/bench_runs.h"
+#include "../../common/bench_sweep.hpp"
 
 using Matrix = std::vector<std::vector<double>>;
 
-Matrix generate_matrix(int N, int seed = 42) {
-    Matrix matrix(N, std::vector<double>(N));
-    std::mt19937 gen(seed);
-    std::uniform_real_distribution<> dis(-100.0, 100.0);
+// Element (i, j) of the benchmark matrix; values depend only on (seed, i, j).
+// Random matrices are uniform in [-100, 100). Adversarial ones defeat the
+// pruned method: each row is uniform in [0, 100) except its last element,
+// the row minimum -100 + 100 * i / N, so no row can be ruled out before
+// its final element.
+inline double matrix_value(int seed, int N, int i, int j, bool adversarial) {
+    if (!adversarial) {
+        return rng_uniform(seed, (unsigned long long)i * N + j, -100.0, 100.0);
+    }
+    if (j == N - 1) {
+        return -100.0 + 100.0 * i / N;
+    }
+    return rng_uniform(seed, (unsigned long long)i * N + j, 0.0, 100.0);
+}
+
+// Rows of FlatMatrix start on a cache line and are consumed ROW_MIN_LANES
+// doubles (one 64-byte line) at a time with aligned SIMD loads
+const int ROW_ALIGN = 64;
+const int ROW_MIN_LANES = 8;
+
+// Elements of a row the pruned method scans between checks of the shared
+// best-so-far (a multiple of ROW_MIN_LANES)
+const int PRUNE_BLOCK = 256;
+
+// Row-major N x N matrix in a single 64-byte aligned block. Each row is
+// padded to a multiple of ROW_MIN_LANES with +infinity, which never wins a
+// row minimum, so row_min_simd needs no scalar tail.
+class FlatMatrix {
+public:
+    FlatMatrix() : N_(0), stride_(0), data_(nullptr) {}
+    
+    // Same values as generate_matrix, rows first touched by the thread that
+    // owns them under the static row partition
+    FlatMatrix(int N, int seed, int num_threads, bool adversarial = false) {
+        allocate(N);
+        #pragma omp parallel for schedule(static) num_threads(num_threads)
+        for (int i = 0; i < N; ++i) {
+            double* out = data_ + (size_t)i * stride_;
+            for (int j = 0; j < N; ++j) {
+                out[j] = matrix_value(seed, N, i, j, adversarial);
+            }
+            std::fill(out + N, out + stride_, std::numeric_limits<double>::infinity());
+        }
+    }
     
+    explicit FlatMatrix(const Matrix& rows) {
+        allocate(rows.size());
+        for (int i = 0; i < N_; ++i) {
+            double* out = data_ + (size_t)i * stride_;
+            std::copy(rows[i].begin(), rows[i].end(), out);
+            std::fill(out + N_, out + stride_, std::numeric_limits<double>::infinity());
+        }
+    }
+    
+    ~FlatMatrix() { std::free(data_); }
+    
+    FlatMatrix(const FlatMatrix&) = delete;
+    FlatMatrix& operator=(const FlatMatrix&) = delete;
+    
+    FlatMatrix(FlatMatrix&& other) : N_(other.N_), stride_(other.stride_), data_(other.data_) {
+        other.N_ = 0;
+        other.stride_ = 0;
+        other.data_ = nullptr;
+    }
+    
+    int size() const { return N_; }
+    int stride() const { return stride_; }
+    const double* row(int i) const { return data_ + (size_t)i * stride_; }
+    
+private:
+    void allocate(int N) {
+        N_ = N;
+        stride_ = (N + ROW_MIN_LANES - 1) / ROW_MIN_LANES * ROW_MIN_LANES;
+        size_t bytes = (size_t)N * stride_ * sizeof(double);
+        data_ = static_cast<double*>(aligned_alloc(ROW_ALIGN, bytes > 0 ? bytes : ROW_ALIGN));
+        if (data_ == nullptr) {
+            // Same failure as the std::vector rows of Matrix
+            throw std::bad_alloc();
+        }
+    }
+    
+    int N_;
+    int stride_;
+    double* data_;
+};
+
+// Rows are allocated and filled by the thread that owns them under the
+// kernels' static row partition; values depend only on (seed, i, j)
+Matrix generate_matrix(int N, int seed = 42, int num_threads = 1, bool adversarial = false) {
+    Matrix matrix(N);
+    
+    #pragma omp parallel for schedule(static) num_threads(num_threads)
     for (int i = 0; i < N; ++i) {
+        matrix[i].resize(N);
         for (int j = 0; j < N; ++j) {
-            matrix[i][j] = dis(gen);
+            matrix[i][j] = matrix_value(seed, N, i, j, adversarial);
         }
     }
     
@@ -59,6 +154,89 @@ double maximin_reduction(const Matrix& matrix, int num_threads) {
     return max_of_mins;
 }
 
+// Minimum of a padded FlatMatrix row: ROW_MIN_LANES independent min
+// accumulators, so the compares do not form one serial dependency chain
+inline double row_min_simd(const double* row, int stride) {
+    double lo[ROW_MIN_LANES];
+    for (int k = 0; k < ROW_MIN_LANES; ++k) {
+        lo[k] = row[k];
+    }
+    
+    for (int j = ROW_MIN_LANES; j < stride; j += ROW_MIN_LANES) {
+        const double* block = row + j;
+        #pragma omp simd aligned(block:ROW_ALIGN)
+        for (int k = 0; k < ROW_MIN_LANES; ++k) {
+            lo[k] = block[k] < lo[k] ? block[k] : lo[k];
+        }
+    }
+    
+    double row_min = lo[0];
+    for (int k = 1; k < ROW_MIN_LANES; ++k) {
+        row_min = std::min(row_min, lo[k]);
+    }
+    return row_min;
+}
+
+double maximin_flat(const FlatMatrix& matrix, int num_threads) {
+    int N = matrix.size();
+    int stride = matrix.stride();
+    double max_of_mins = std::numeric_limits<double>::lowest();
+    
+    omp_set_num_threads(num_threads);
+    
+    #pragma omp parallel for schedule(static) reduction(max:max_of_mins)
+    for (int i = 0; i < N; ++i) {
+        max_of_mins = std::max(max_of_mins, row_min_simd(matrix.row(i), stride));
+    }
+    
+    return max_of_mins;
+}
+
+// maximin_flat that stops scanning a row once its running minimum is no
+// larger than the best row minimum found so far by any thread: such a row
+// cannot raise the maximum. The best value is shared through a relaxed
+// atomic, read every PRUNE_BLOCK elements and raised (compare-exchange) by
+// each fully scanned row that beats it. A stale read only prunes less, and
+// the winning row is never pruned, so the result is exact.
+double maximin_pruned(const FlatMatrix& matrix, int num_threads, double* skipped_fraction) {
+    int N = matrix.size();
+    int stride = matrix.stride();
+    std::atomic<double> best(std::numeric_limits<double>::lowest());
+    long long scanned = 0;
+    
+    omp_set_num_threads(num_threads);
+    
+    #pragma omp parallel for schedule(static) reduction(+:scanned)
+    for (int i = 0; i < N; ++i) {
+        const double* row = matrix.row(i);
+        double bound = best.load(std::memory_order_relaxed);
+        double row_min = std::numeric_limits<double>::infinity();
+        int end = 0;
+        
+        while (end < stride) {
+            int start = end;
+            end = std::min(start + PRUNE_BLOCK, stride);
+            row_min = std::min(row_min, row_min_simd(row + start, end - start));
+            if (row_min <= bound) {
+                break;
+            }
+            bound = best.load(std::memory_order_relaxed);
+        }
+        scanned += std::min(end, N);
+        
+        if (end == stride && row_min > bound) {
+            double current = best.load(std::memory_order_relaxed);
+            while (row_min > current &&
+                   !best.compare_exchange_weak(current, row_min, std::memory_order_relaxed)) {
+            }
+        }
+    }
+    
+    if (skipped_fraction != nullptr) {
+        *skipped_fraction = N > 0 ? 1.0 - (double)scanned / ((double)N * N) : 0.0;
+    }
+    return best.load(std::memory_order_relaxed);
+}
 
 struct BenchmarkResult {
     int N;
@@ -66,35 +244,58 @@ struct BenchmarkResult {
     std::string method;
     double execution_time;
     double result_value;
+    double skipped_fraction;
     int iteration;
+    int runs_used;
+    double ci_low_ms;
+    double ci_high_ms;
 };
 
+// Methods that read the FlatMatrix rather than the vector of rows
+bool uses_flat(const std::string& method) {
+    return method == "flat" || method == "pruned";
+}
+
 std::vector<BenchmarkResult> run_benchmark(const Matrix& matrix,
+                                           const FlatMatrix& flat,
                                            int num_threads,
                                            const std::string& method,
-                                           int iterations) {
+                                           const run_plan& plan) {
     std::vector<BenchmarkResult> results;
-    int N = matrix.size();
+    int N = uses_flat(method) ? flat.size() : (int)matrix.size();
     
     // Warmup
     if (method == "reduction") {
         maximin_reduction(matrix, num_threads);
+    } else if (method == "flat") {
+        maximin_flat(flat, num_threads);
+    } else if (method == "pruned") {
+        maximin_pruned(flat, num_threads, nullptr);
     }
     
-    for (int iter = 0; iter < iterations; ++iter) {
+    run_series series;
+    run_series_init(&series, &plan);
+    
+    for (int iter = 0; !run_series_done(&series); ++iter) {
         double result = 0.0;
+        double skipped_fraction = 0.0;
         double execution_time = 0.0;
         
         auto start = std::chrono::high_resolution_clock::now();
         
         if (method == "reduction") {
             result = maximin_reduction(matrix, num_threads);
+        } else if (method == "flat") {
+            result = maximin_flat(flat, num_threads);
+        } else if (method == "pruned") {
+            result = maximin_pruned(flat, num_threads, &skipped_fraction);
         } else if (method == "sequential") {
             result = maximin_sequential(matrix);
         }
         
         auto end = std::chrono::high_resolution_clock::now();
         execution_time = std::chrono::duration<double, std::milli>(end - start).count();
+        run_series_add(&series, execution_time);
         
         BenchmarkResult bench_result;
         bench_result.N = N;
@@ -102,11 +303,19 @@ std::vector<BenchmarkResult> run_benchmark(const Matrix& matrix,
         bench_result.method = method;
         bench_result.execution_time = execution_time;
         bench_result.result_value = result;
+        bench_result.skipped_fraction = skipped_fraction;
         bench_result.iteration = iter;
         
         results.push_back(bench_result);
     }
     
+    for (auto& result : results) {
+        result.runs_used = series.count;
+        result.ci_low_ms = series.ci_low;
+        result.ci_high_ms = series.ci_high;
+    }
+    run_series_free(&series);
+    
     return results;
 }
 
@@ -119,9 +328,12 @@ bool verify_correctness() {
     
     double seq = maximin_sequential(test_matrix);
     double par_red = maximin_reduction(test_matrix, 2);
+    double flat = maximin_flat(FlatMatrix(test_matrix), 2);
+    double pruned = maximin_pruned(FlatMatrix(test_matrix), 2, nullptr);
     double expected = 4.0;
     
-    if (std::abs(seq - expected) > 1e-6 || std::abs(par_red - expected) > 1e-6) {
+    if (std::abs(seq - expected) > 1e-6 || std::abs(par_red - expected) > 1e-6 ||
+        std::abs(flat - expected) > 1e-6 || std::abs(pruned - expected) > 1e-6) {
         return false;
     }
     
@@ -129,47 +341,99 @@ bool verify_correctness() {
     Matrix test_matrix2 = generate_matrix(N, 12345);
     double seq2 = maximin_sequential(test_matrix2);
     double par_red2 = maximin_reduction(test_matrix2, 4);
+    double flat2 = maximin_flat(FlatMatrix(N, 12345, 4), 4);
     
-    if (std::abs(seq2 - par_red2) > 1e-6) {
+    if (std::abs(seq2 - par_red2) > 1e-6 || seq2 != flat2) {
         return false;
     }
     
+    // N = 1000 spans several PRUNE_BLOCKs per row
+    for (int adversarial = 0; adversarial <= 1; ++adversarial) {
+        FlatMatrix test_flat(1000, 12345, 4, adversarial);
+        if (maximin_pruned(test_flat, 4, nullptr) != maximin_flat(test_flat, 4)) {
+            return false;
+        }
+    }
+    
     return true;
 }
 
 int main(int argc, char* argv[]) {
     if (argc < 5) {
-        std::cerr << "Usage: " << argv[0] << " <N> <num_threads> <method> <iterations> [output_file]" << std::endl;
+        std::cerr << "Usage: " << argv[0] << " <N> <num_threads> <method> <iterations> [output_file] [matrix]" << std::endl;
         std::cerr << "\nParameters:" << std::endl;
         std::cerr << "  N           - matrix size (NxN)" << std::endl;
-        std::cerr << "  num_threads - number of OpenMP threads" << std::endl;
-        std::cerr << "  method      - sequential, reduction" << std::endl;
-        std::cerr << "  iterations  - number of runs for averaging" << std::endl;
+        std::cerr << "  num_threads - number of OpenMP threads, or a list (e.g. 1,2,4,8)" << std::endl;
+        std::cerr << "  method      - sequential, reduction, flat, or a list (e.g. sequential,reduction)" << std::endl;
+        std::cerr << "                flat: contiguous 64-byte aligned rows, SIMD row minimum" << std::endl;
+        std::cerr << "                pruned: flat, skipping rows that cannot beat the best so far" << std::endl;
+        std::cerr << "  iterations  - number of runs, or auto[:min[:max[:width]]] to repeat until" << std::endl;
+        std::cerr << "                the median's 95% CI is within width (e.g. auto:5:100:0.02)" << std::endl;
+        std::cerr << "  matrix      - random (default) or adversarial (no row can be pruned early)" << std::endl;
         std::cerr << "\nExamples:" << std::endl;
         std::cerr << "  " << argv[0] << " 1000 4 reduction 10" << std::endl;
         std::cerr << "  " << argv[0] << " 5000 8 critical 5" << std::endl;
+        std::cerr << "  " << argv[0] << " 5000 1,2,4,8 sequential,reduction 10 out.csv" << std::endl;
+        std::cerr << "  " << argv[0] << " 5000 1,2,4,8 flat,pruned 10 out.csv adversarial" << std::endl;
+        std::cerr << "\nWith lists the matrix is generated once and every (method, threads)" << std::endl;
+        std::cerr << "pair runs in the same process." << std::endl;
         return 1;
     }
     
     int N = std::stoi(argv[1]);
-    int num_threads = std::stoi(argv[2]);
-    std::string method = argv[3];
-    int iterations = std::stoi(argv[4]);
     std::string output_file = (argc > 5) ? argv[5] : "";
+    std::string matrix_kind = (argc > 6) ? argv[6] : "random";
+    if (matrix_kind != "random" && matrix_kind != "adversarial") {
+        std::cerr << "Error: Invalid matrix '" << matrix_kind << "'" << std::endl;
+        return 1;
+    }
+    bool adversarial = matrix_kind == "adversarial";
+    std::vector<int> thread_counts;
+    std::vector<std::string> methods;
+    try {
+        thread_counts = parse_int_list(argv[2]);
+        methods = parse_list(argv[3]);
+    } catch (const std::exception& e) {
+        std::cerr << "Error: Invalid threads or methods: " << e.what() << std::endl;
+        return 1;
+    }
     
-    if (method != "sequential" && method != "reduction") {
-        std::cerr << "Error: Invalid method '" << method << "'" << std::endl;
+    run_plan plan;
+    if (run_plan_parse(argv[4], &plan) != 0) {
+        std::cerr << "Error: Invalid iterations '" << argv[4] << "'" << std::endl;
         return 1;
     }
     
+    if (numa_setup() != 0) {
+        return 1;
+    }
+    
+    for (const auto& method : methods) {
+        if (method != "sequential" && method != "reduction" && !uses_flat(method)) {
+            std::cerr << "Error: Invalid method '" << method << "'" << std::endl;
+            return 1;
+        }
+    }
+    
     // Run verification
     if (!verify_correctness()) {
         std::cerr << "Error: Correctness verification failed!" << std::endl;
         return 1;
     }
     
-    Matrix matrix = generate_matrix(N);
-    auto results = run_benchmark(matrix, num_threads, method, iterations);
+    int fill_threads = *std::max_element(thread_counts.begin(), thread_counts.end());
+    // Each storage is only built if a method uses it
+    bool use_rows = !std::all_of(methods.begin(), methods.end(), uses_flat);
+    bool use_flat = std::any_of(methods.begin(), methods.end(), uses_flat);
+    Matrix matrix = use_rows ? generate_matrix(N, 42, fill_threads, adversarial) : Matrix();
+    FlatMatrix flat = use_flat ? FlatMatrix(N, 42, fill_threads, adversarial) : FlatMatrix();
+    std::vector<BenchmarkResult> results;
+    for (const auto& method : methods) {
+        for (int num_threads : thread_counts) {
+            auto config_results = run_benchmark(matrix, flat, num_threads, method, plan);
+            results.insert(results.end(), config_results.begin(), config_results.end());
+        }
+    }
     
     double sum_time = 0.0;
     double min_time = results[0].execution_time;
@@ -188,7 +452,7 @@ int main(int argc, char* argv[]) {
         if (out.is_open()) {
             out.seekp(0, std::ios::end);
             if (out.tellp() == 0) {
-                out << "N,num_threads,method,iteration,execution_time_ms,result_value" << std::endl;
+                out << "N,num_threads,method,iteration,execution_time_ms,result_value,runs_used,ci_low_ms,ci_high_ms,placement,matrix,skipped_fraction" << std::endl;
             }
             
             for (const auto& result : results) {
@@ -197,7 +461,11 @@ int main(int argc, char* argv[]) {
                     << result.method << ","
                     << result.iteration << ","
                     << std::fixed << std::setprecision(6) << result.execution_time << ","
-                    << std::scientific << std::setprecision(15) << result.result_value << std::endl;
+                    << std::scientific << std::setprecision(15) << result.result_value << ","
+                    << result.runs_used << ","
+                    << std::fixed << std::setprecision(6) << result.ci_low_ms << ","
+                    << result.ci_high_ms << "," << numa_placement() << ","
+                    << matrix_kind << "," << result.skipped_fraction << std::endl;
             }
             out.close();
         }
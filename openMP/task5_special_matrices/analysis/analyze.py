@@ -4,11 +4,17 @@ Analysis script for Task 5: Special Matrices benchmarks
 Processes CSV results and calculates performance metrics
 """
 
-import pandas as pd
 import sys
 import os
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from benchkit import Schema, summarize
+from benchkit.lazy import lazy_import
+from benchkit.placement import print_placement_summary
+
+pd = lazy_import('pandas')
+
 def load_data(csv_file):
     """Load benchmark data from CSV file"""
     try:
@@ -19,63 +25,16 @@ def load_data(csv_file):
         print(f"✗ Error loading file: {e}")
         sys.exit(1)
 
-def calculate_statistics(df):
-    """Calculate mean, min, max, std for each configuration"""
-    stats = df.groupby(['N', 'matrix_type', 'bandwidth', 'num_threads', 'schedule', 'chunk_size']).agg({
-        'execution_time_ms': ['mean', 'min', 'max', 'std'],
-        'result_value': 'mean'
-    }).reset_index()
-    
-    # Flatten column names
-    stats.columns = ['N', 'matrix_type', 'bandwidth', 'num_threads', 'schedule', 'chunk_size',
-                     'time_mean', 'time_min', 'time_max', 'time_std', 'result']
-    
-    return stats
+TASK_SCHEMA = Schema(
+    keys=['N', 'matrix_type', 'bandwidth', 'num_threads', 'schedule', 'chunk_size'],
+    names={'mean': 'time_mean', 'median': 'time_median', 'std': 'time_std',
+           'min': 'time_min', 'max': 'time_max', 'count': 'runs'},
+    extra={'result': ('result_value', 'mean')},
+)
 
-def calculate_speedup(stats):
-    """Calculate speedup relative to single thread"""
-    results = []
-    
-    for size in stats['N'].unique():
-        for matrix_type in stats['matrix_type'].unique():
-            for schedule in stats['schedule'].unique():
-                for chunk in stats['chunk_size'].unique():
-                    subset = stats[
-                        (stats['N'] == size) & 
-                        (stats['matrix_type'] == matrix_type) &
-                        (stats['schedule'] == schedule) &
-                        (stats['chunk_size'] == chunk)
-                    ]
-                    
-                    if len(subset) == 0:
-                        continue
-                    
-                    # Get baseline (1 thread)
-                    baseline = subset[subset['num_threads'] == 1]
-                    if len(baseline) == 0:
-                        continue
-                    
-                    baseline_time = baseline['time_mean'].values[0]
-                    
-                    for _, row in subset.iterrows():
-                        speedup = baseline_time / row['time_mean']
-                        efficiency = speedup / row['num_threads']
-                        
-                        results.append({
-                            'N': size,
-                            'matrix_type': matrix_type,
-                            'bandwidth': row['bandwidth'],
-                            'num_threads': row['num_threads'],
-                            'schedule': schedule,
-                            'chunk_size': chunk,
-                            'time_mean': row['time_mean'],
-                            'time_std': row['time_std'],
-                            'result': row['result'],
-                            'speedup': speedup,
-                            'efficiency': efficiency
-                        })
-    
-    return pd.DataFrame(results)
+def calculate_statistics(df):
+    """Calculate run statistics, speedup and efficiency for each configuration"""
+    return summarize(df, TASK_SCHEMA)
 
 def print_summary(df_analysis):
     """Print summary tables"""
@@ -285,16 +244,13 @@ def main():
     # Load data
     df = load_data(csv_file)
     
-    # Calculate statistics
-    print("\nCalculating statistics...")
-    stats = calculate_statistics(df)
-    
-    # Calculate speedup and efficiency
-    print("Calculating speedup and efficiency...")
-    df_analysis = calculate_speedup(stats)
+    # Calculate statistics, speedup and efficiency
+    print("\nCalculating statistics, speedup and efficiency...")
+    df_analysis = calculate_statistics(df)
     
     # Print summary
     print_summary(df_analysis)
+    print_placement_summary(df_analysis, 'num_threads')
     
     # Compare schedules
     compare_schedules(df_analysis)
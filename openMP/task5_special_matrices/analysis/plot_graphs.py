@@ -4,17 +4,24 @@ Graph generation script for Task 5: Special Matrices benchmarks
 Creates visualization of performance metrics
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
 import os
 import sys
 from pathlib import Path
 
-# Set style
-plt.style.use('seaborn-v0_8-darkgrid')
-plt.rcParams['figure.figsize'] = (12, 8)
-plt.rcParams['font.size'] = 10
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from benchkit.lazy import lazy_import
+from benchkit.placement import plot_placement_speedup
+from benchkit.render import Job, parse_options, per_placement, render, split
+
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+
+def set_style(plt):
+    plt.style.use('seaborn-v0_8-darkgrid')
+    plt.rcParams['figure.figsize'] = (12, 8)
+    plt.rcParams['font.size'] = 10
+
+plt = lazy_import('matplotlib.pyplot', setup=set_style)
 
 def find_latest_processed_file():
     """Find the most recent processed CSV file"""
@@ -173,7 +180,7 @@ def plot_schedule_comparison(df, output_dir):
     # Plot 1: Execution time by matrix type
     ax = axes[0, 0]
     x = np.arange(len(matrix_types))
-    width = 0.25
+    width = 0.8 / len(schedules)
     for i, schedule in enumerate(schedules):
         times = [subset[(subset['matrix_type'] == mt) & (subset['schedule'] == schedule)]['time_mean'].mean() 
                 for mt in matrix_types]
@@ -181,7 +188,7 @@ def plot_schedule_comparison(df, output_dir):
     ax.set_xlabel('Matrix Type', fontweight='bold')
     ax.set_ylabel('Execution Time (ms)', fontweight='bold')
     ax.set_title('Execution Time by Matrix Type')
-    ax.set_xticks(x + width)
+    ax.set_xticks(x + width * (len(schedules) - 1) / 2)
     ax.set_xticklabels([mt.upper() for mt in matrix_types])
     ax.legend()
     ax.grid(True, alpha=0.3, axis='y')
@@ -195,7 +202,7 @@ def plot_schedule_comparison(df, output_dir):
     ax.set_xlabel('Matrix Type', fontweight='bold')
     ax.set_ylabel('Speedup', fontweight='bold')
     ax.set_title('Speedup by Matrix Type')
-    ax.set_xticks(x + width)
+    ax.set_xticks(x + width * (len(schedules) - 1) / 2)
     ax.set_xticklabels([mt.upper() for mt in matrix_types])
     ax.legend()
     ax.grid(True, alpha=0.3, axis='y')
@@ -209,7 +216,7 @@ def plot_schedule_comparison(df, output_dir):
     ax.set_xlabel('Matrix Type', fontweight='bold')
     ax.set_ylabel('Efficiency', fontweight='bold')
     ax.set_title('Efficiency by Matrix Type')
-    ax.set_xticks(x + width)
+    ax.set_xticks(x + width * (len(schedules) - 1) / 2)
     ax.set_xticklabels([mt.upper() for mt in matrix_types])
     ax.legend()
     ax.grid(True, alpha=0.3, axis='y')
@@ -307,6 +314,8 @@ def plot_matrix_type_comparison(df, output_dir):
     print(f"  ✓ Created {filename}")
 
 def main():
+    options = parse_options()
+    
     print("="*80)
     print("SPECIAL MATRICES - GRAPH GENERATION")
     print("="*80)
@@ -319,23 +328,29 @@ def main():
     output_dir = '../graphs'
     os.makedirs(output_dir, exist_ok=True)
     
-    print("\nGenerating graphs...")
+    print(f"\nGenerating graphs (jobs: {options.jobs})...")
     
     # Generate plots
-    print("\n1. Execution time plots...")
-    plot_execution_time_by_schedule(df, output_dir)
-    
-    print("\n2. Speedup plots...")
-    plot_speedup_by_schedule(df, output_dir)
-    
-    print("\n3. Efficiency plots...")
-    plot_efficiency_by_schedule(df, output_dir)
-    
-    print("\n4. Schedule comparison...")
-    plot_schedule_comparison(df, output_dir)
+    by_matrix = ['N', 'matrix_type']
+    # Everything but the placement comparison is drawn once per placement policy
+    def policy_jobs(directory, where):
+        return [
+            *split(df, plot_execution_time_by_schedule, by_matrix, directory,
+                   title="\n1. Execution time plots...", where=where),
+            *split(df, plot_speedup_by_schedule, by_matrix, directory,
+                   title="\n2. Speedup plots...", where=where),
+            *split(df, plot_efficiency_by_schedule, by_matrix, directory,
+                   title="\n3. Efficiency plots...", where=where),
+            Job(plot_schedule_comparison, directory, where=where,
+                title="\n4. Schedule comparison..."),
+            Job(plot_matrix_type_comparison, directory, where=where,
+                title="\n5. Matrix type comparison..."),
+        ]
     
-    print("\n5. Matrix type comparison...")
-    plot_matrix_type_comparison(df, output_dir)
+    render([
+        *per_placement(df, output_dir, policy_jobs),
+        Job(plot_placement_speedup, output_dir, 'num_threads'),
+    ], df, options, output_dir)
     
     print("\n" + "="*80)
     print("GRAPH GENERATION COMPLETE")
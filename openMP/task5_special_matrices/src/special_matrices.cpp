@@ -7,9 +7,12 @@
 #include <omp.h>
 #include <cmath>
 #include <string>
-#include <random>
 #include <limits>
 
+#include "../../common/bench_numa.h"
+#include "../../common/bench_rng.h"
+#include "../../common/bench_runs.h"
+
 enum class MatrixType {
     DENSE,
     BANDED,
@@ -20,68 +23,75 @@ enum class MatrixType {
 enum class ScheduleType {
     STATIC,
     DYNAMIC,
-    GUIDED
+    GUIDED,
+    BALANCED
 };
 
+// Only the structurally nonzero elements are stored, row after row in one
+// array, so memory grows with the nonzeros rather than N^2:
+//   DENSE             N * N, row-major
+//   BANDED            band storage: 2 * bandwidth + 1 slots per row, slot k of
+//                     row i holding column i - bandwidth + k (slots outside
+//                     the matrix at the first and last rows stay unused)
+//   LOWER_TRIANGULAR  packed: row i holds columns 0..i at offset i(i+1)/2
+//   UPPER_TRIANGULAR  packed: row i holds columns i..N-1 at offset
+//                     i * N - i(i-1)/2
 class SpecialMatrix {
 private:
-    std::vector<std::vector<double>> data;
+    first_touch_vector<double> data;
     int N;
     MatrixType type;
     int bandwidth;
     
 public:
-    SpecialMatrix(int size, MatrixType mat_type, int band = 5, int seed = 42)
+    SpecialMatrix(int size, MatrixType mat_type, int band = 5, int seed = 42, int fill_threads = 1)
         : N(size), type(mat_type), bandwidth(band) {
-        data.resize(N, std::vector<double>(N, 0.0));
-        generate(seed);
+        size_t last = N > 0 ? (size_t)N - 1 : 0;
+        data.resize(N > 0 ? rowOffset(last) + rowSlots(last) : 0);
+        generate(seed, fill_threads);
     }
     
-    void generate(int seed) {
-        std::mt19937 gen(seed);
-        std::uniform_real_distribution<> dis(-100.0, 100.0);
-        
+    // Rows are filled in parallel (static row partition, so each row is
+    // first touched by the thread that owns it); every element depends only
+    // on (seed, i, j), never on the thread count or the storage layout
+    void generate(int seed, int fill_threads) {
+        #pragma omp parallel for schedule(static) num_threads(fill_threads)
+        for (int i = 0; i < N; ++i) {
+            double* row = data.data() + rowOffset(i);
+            int j_start = rowStart(i);
+            int length = rowLength(i);
+            std::fill(row, row + rowSlots(i), 0.0);
+            for (int k = 0; k < length; ++k) {
+                int j = j_start + k;
+                row[slot(i, j)] = rng_uniform(seed, (unsigned long long)i * N + j, -100.0, 100.0);
+            }
+        }
+    }
+    
+    // First stored column of a row
+    int rowStart(int i) const {
         switch (type) {
-            case MatrixType::DENSE:
-                for (int i = 0; i < N; ++i) {
-                    for (int j = 0; j < N; ++j) {
-                        data[i][j] = dis(gen);
-                    }
-                }
-                break;
-                
-            case MatrixType::BANDED:
-                for (int i = 0; i < N; ++i) {
-                    for (int j = 0; j < N; ++j) {
-                        if (std::abs(i - j) <= bandwidth) {
-                            data[i][j] = dis(gen);
-                        } else {
-                            data[i][j] = 0.0;
-                        }
-                    }
-                }
-                break;
-                
-            case MatrixType::LOWER_TRIANGULAR:
-                for (int i = 0; i < N; ++i) {
-                    for (int j = 0; j <= i; ++j) {
-                        data[i][j] = dis(gen);
-                    }
-                }
-                break;
-                
-            case MatrixType::UPPER_TRIANGULAR:
-                for (int i = 0; i < N; ++i) {
-                    for (int j = i; j < N; ++j) {
-                        data[i][j] = dis(gen);
-                    }
-                }
-                break;
+            case MatrixType::BANDED: return std::max(0, i - bandwidth);
+            case MatrixType::UPPER_TRIANGULAR: return i;
+            default: return 0;
+        }
+    }
+    
+    // Number of nonzeros in a row
+    int rowLength(int i) const {
+        switch (type) {
+            case MatrixType::BANDED: return std::min(N - 1, i + bandwidth) - rowStart(i) + 1;
+            case MatrixType::LOWER_TRIANGULAR: return i + 1;
+            case MatrixType::UPPER_TRIANGULAR: return N - i;
+            default: return N;
         }
     }
     
     double get(int i, int j) const {
-        return data[i][j];
+        if (j < rowStart(i) || j >= rowStart(i) + rowLength(i)) {
+            return 0.0;
+        }
+        return data[rowOffset(i) + slot(i, j)];
     }
     
     int size() const { return N; }
@@ -91,40 +101,37 @@ public:
     int getBandwidth() const { return bandwidth; }
     
     double getRowMin(int row) const {
+        const double* values = data.data() + rowOffset(row) + slot(row, rowStart(row));
+        int length = rowLength(row);
         double row_min = std::numeric_limits<double>::max();
         
-        switch (type) {
-            case MatrixType::DENSE:
-                for (int j = 0; j < N; ++j) {
-                    row_min = std::min(row_min, data[row][j]);
-                }
-                break;
-                
-            case MatrixType::BANDED:
-                {
-                    int j_start = std::max(0, row - bandwidth);
-                    int j_end = std::min(N - 1, row + bandwidth);
-                    for (int j = j_start; j <= j_end; ++j) {
-                        row_min = std::min(row_min, data[row][j]);
-                    }
-                }
-                break;
-                
-            case MatrixType::LOWER_TRIANGULAR:
-                for (int j = 0; j <= row; ++j) {
-                    row_min = std::min(row_min, data[row][j]);
-                }
-                break;
-                
-            case MatrixType::UPPER_TRIANGULAR:
-                for (int j = row; j < N; ++j) {
-                    row_min = std::min(row_min, data[row][j]);
-                }
-                break;
+        for (int k = 0; k < length; ++k) {
+            row_min = std::min(row_min, values[k]);
         }
         
         return row_min;
     }
+    
+private:
+    // Start of a row in data
+    size_t rowOffset(size_t i) const {
+        switch (type) {
+            case MatrixType::BANDED: return i * (2 * (size_t)bandwidth + 1);
+            case MatrixType::LOWER_TRIANGULAR: return i * (i + 1) / 2;
+            case MatrixType::UPPER_TRIANGULAR: return i * N - i * (i - 1) / 2;
+            default: return i * N;
+        }
+    }
+    
+    // Slots reserved for a row (band rows keep unused slots at the edges)
+    size_t rowSlots(size_t i) const {
+        return type == MatrixType::BANDED ? 2 * (size_t)bandwidth + 1 : rowLength(i);
+    }
+    
+    // Position of column j within row i
+    int slot(int i, int j) const {
+        return type == MatrixType::BANDED ? j - (i - bandwidth) : j - rowStart(i);
+    }
 };
 
 MatrixType stringToMatrixType(const std::string& str) {
@@ -139,6 +146,7 @@ ScheduleType stringToScheduleType(const std::string& str) {
     if (str == "static") return ScheduleType::STATIC;
     if (str == "dynamic") return ScheduleType::DYNAMIC;
     if (str == "guided") return ScheduleType::GUIDED;
+    if (str == "balanced") return ScheduleType::BALANCED;
     return ScheduleType::STATIC;
 }
 
@@ -159,6 +167,7 @@ std::string scheduleTypeToString(ScheduleType type) {
         case ScheduleType::STATIC: return "static";
         case ScheduleType::DYNAMIC: return "dynamic";
         case ScheduleType::GUIDED: return "guided";
+        case ScheduleType::BALANCED: return "balanced";
         default: return "unknown";
     }
 }
@@ -176,6 +185,49 @@ double maximin_sequential(const SpecialMatrix& matrix) {
     return max_of_mins;
 }
 
+// Row ranges with equal nonzero counts: part t is rows [bounds[t],
+// bounds[t + 1]), cut where the prefix sum of row lengths crosses t / parts
+// of the total. Triangular rows grow linearly, so static's equal row counts
+// leave the last thread about twice the average work.
+std::vector<int> balanced_partition(const SpecialMatrix& matrix, int parts) {
+    int N = matrix.size();
+    std::vector<long long> prefix(N + 1, 0);
+    for (int i = 0; i < N; ++i) {
+        prefix[i + 1] = prefix[i] + matrix.rowLength(i);
+    }
+    
+    std::vector<int> bounds(parts + 1, N);
+    bounds[0] = 0;
+    for (int t = 1; t < parts; ++t) {
+        long long target = prefix[N] * t / parts;
+        bounds[t] = std::lower_bound(prefix.begin(), prefix.end(), target) - prefix.begin();
+    }
+    
+    return bounds;
+}
+
+// Each thread scans its precomputed row ranges: no runtime scheduler, and
+// the result does not depend on how many threads the team actually got
+double maximin_balanced(const SpecialMatrix& matrix, int num_threads, const std::vector<int>& bounds) {
+    int parts = bounds.size() - 1;
+    double max_of_mins = std::numeric_limits<double>::lowest();
+    
+    omp_set_num_threads(num_threads);
+    
+    #pragma omp parallel reduction(max:max_of_mins)
+    {
+        int team = omp_get_num_threads();
+        for (int part = omp_get_thread_num(); part < parts; part += team) {
+            for (int i = bounds[part]; i < bounds[part + 1]; ++i) {
+                double row_min = matrix.getRowMin(i);
+                max_of_mins = std::max(max_of_mins, row_min);
+            }
+        }
+    }
+    
+    return max_of_mins;
+}
+
 double maximin_parallel(const SpecialMatrix& matrix, int num_threads, ScheduleType schedule, int chunk_size = 0) {
     int N = matrix.size();
     double max_of_mins = std::numeric_limits<double>::lowest();
@@ -230,6 +282,11 @@ double maximin_parallel(const SpecialMatrix& matrix, int num_threads, ScheduleTy
                 }
             }
             break;
+            
+        case ScheduleType::BALANCED:
+            max_of_mins = maximin_balanced(matrix, num_threads,
+                                           balanced_partition(matrix, num_threads));
+            break;
     }
     
     return max_of_mins;
@@ -245,25 +302,40 @@ struct BenchmarkResult {
     double execution_time;
     double result_value;
     int iteration;
+    int runs_used;
+    double ci_low_ms;
+    double ci_high_ms;
 };
 
 std::vector<BenchmarkResult> run_benchmark(const SpecialMatrix& matrix,
                                           int num_threads,
                                           ScheduleType schedule,
                                           int chunk_size,
-                                          int iterations) {
+                                          const run_plan& plan) {
     std::vector<BenchmarkResult> results;
     int N = matrix.size();
     
+    // The balanced partition is computed once, outside the timed runs
+    std::vector<int> bounds;
+    if (schedule == ScheduleType::BALANCED) {
+        bounds = balanced_partition(matrix, num_threads);
+    }
+    
     // Warmup
     maximin_parallel(matrix, num_threads, schedule, chunk_size);
     
-    for (int iter = 0; iter < iterations; ++iter) {
+    run_series series;
+    run_series_init(&series, &plan);
+    
+    for (int iter = 0; !run_series_done(&series); ++iter) {
         auto start = std::chrono::high_resolution_clock::now();
-        double result = maximin_parallel(matrix, num_threads, schedule, chunk_size);
+        double result = (schedule == ScheduleType::BALANCED)
+            ? maximin_balanced(matrix, num_threads, bounds)
+            : maximin_parallel(matrix, num_threads, schedule, chunk_size);
         auto end = std::chrono::high_resolution_clock::now();
         
         double execution_time = std::chrono::duration<double, std::milli>(end - start).count();
+        run_series_add(&series, execution_time);
         
         BenchmarkResult bench_result;
         bench_result.N = N;
@@ -279,6 +351,13 @@ std::vector<BenchmarkResult> run_benchmark(const SpecialMatrix& matrix,
         results.push_back(bench_result);
     }
     
+    for (auto& result : results) {
+        result.runs_used = series.count;
+        result.ci_low_ms = series.ci_low;
+        result.ci_high_ms = series.ci_high;
+    }
+    run_series_free(&series);
+    
     return results;
 }
 
@@ -289,10 +368,12 @@ bool verify_correctness() {
     double par_static = maximin_parallel(test_matrix, 2, ScheduleType::STATIC, 0);
     double par_dynamic = maximin_parallel(test_matrix, 2, ScheduleType::DYNAMIC, 0);
     double par_guided = maximin_parallel(test_matrix, 2, ScheduleType::GUIDED, 0);
+    double par_balanced = maximin_parallel(test_matrix, 2, ScheduleType::BALANCED, 0);
     
     if (std::abs(seq - par_static) > 1e-6 ||
         std::abs(seq - par_dynamic) > 1e-6 ||
-        std::abs(seq - par_guided) > 1e-6) {
+        std::abs(seq - par_guided) > 1e-6 ||
+        std::abs(seq - par_balanced) > 1e-6) {
         return false;
     }
     
@@ -304,6 +385,25 @@ bool verify_correctness() {
         return false;
     }
     
+    // Compact layouts: every element where the full matrix would have it
+    const int n = 50;
+    const MatrixType types[] = {MatrixType::BANDED, MatrixType::LOWER_TRIANGULAR,
+                                MatrixType::UPPER_TRIANGULAR};
+    for (MatrixType type : types) {
+        SpecialMatrix compact(n, type, 3, 777, 2);
+        for (int i = 0; i < n; ++i) {
+            for (int j = 0; j < n; ++j) {
+                bool nonzero = (type == MatrixType::BANDED && std::abs(i - j) <= 3) ||
+                               (type == MatrixType::LOWER_TRIANGULAR && j <= i) ||
+                               (type == MatrixType::UPPER_TRIANGULAR && j >= i);
+                double expected = nonzero ? rng_uniform(777, (unsigned long long)i * n + j, -100.0, 100.0) : 0.0;
+                if (compact.get(i, j) != expected) {
+                    return false;
+                }
+            }
+        }
+    }
+    
     return true;
 }
 
@@ -311,17 +411,21 @@ int main(int argc, char* argv[]) {
     if (argc < 7) {
         std::cerr << "Usage: " << argv[0] << " <N> <matrix_type> <bandwidth> <num_threads> <schedule> <chunk_size> <iterations> [output_file]" << std::endl;
         std::cerr << "\nParameters:" << std::endl;
-        std::cerr << "  N           - matrix size (NxN)" << std::endl;
+        std::cerr << "  N           - matrix size (NxN); only nonzeros are stored, so banded" << std::endl;
+        std::cerr << "                matrices scale to N in the millions" << std::endl;
         std::cerr << "  matrix_type - dense, banded, lower, upper" << std::endl;
         std::cerr << "  bandwidth   - bandwidth for banded matrices (ignored for others)" << std::endl;
         std::cerr << "  num_threads - number of OpenMP threads" << std::endl;
-        std::cerr << "  schedule    - static, dynamic, guided" << std::endl;
-        std::cerr << "  chunk_size  - chunk size for scheduling (0 = default)" << std::endl;
-        std::cerr << "  iterations  - number of runs for averaging" << std::endl;
+        std::cerr << "  schedule    - static, dynamic, guided, balanced (equal nonzeros per thread)" << std::endl;
+        std::cerr << "  chunk_size  - chunk size for scheduling (0 = default; ignored by balanced)" << std::endl;
+        std::cerr << "  iterations  - number of runs, or auto[:min[:max[:width]]] to repeat until" << std::endl;
+        std::cerr << "                the median's 95% CI is within width (e.g. auto:5:100:0.02)" << std::endl;
         std::cerr << "\nExamples:" << std::endl;
         std::cerr << "  " << argv[0] << " 1000 banded 5 4 static 0 10" << std::endl;
+        std::cerr << "  " << argv[0] << " 1000000 banded 5 8 static 0 10" << std::endl;
         std::cerr << "  " << argv[0] << " 2000 lower 0 8 dynamic 10 5" << std::endl;
         std::cerr << "  " << argv[0] << " 3000 upper 0 16 guided 0 10" << std::endl;
+        std::cerr << "  " << argv[0] << " 3000 lower 0 16 balanced 0 10" << std::endl;
         return 1;
     }
     
@@ -331,9 +435,18 @@ int main(int argc, char* argv[]) {
     int num_threads = std::stoi(argv[4]);
     std::string schedule_str = argv[5];
     int chunk_size = std::stoi(argv[6]);
-    int iterations = std::stoi(argv[7]);
     std::string output_file = (argc > 8) ? argv[8] : "";
     
+    run_plan plan;
+    if (run_plan_parse(argv[7], &plan) != 0) {
+        std::cerr << "Error: Invalid iterations '" << argv[7] << "'" << std::endl;
+        return 1;
+    }
+    
+    if (numa_setup() != 0) {
+        return 1;
+    }
+    
     MatrixType matrix_type = stringToMatrixType(matrix_type_str);
     ScheduleType schedule = stringToScheduleType(schedule_str);
     
@@ -343,8 +456,8 @@ int main(int argc, char* argv[]) {
         return 1;
     }
     
-    SpecialMatrix matrix(N, matrix_type, bandwidth);
-    auto results = run_benchmark(matrix, num_threads, schedule, chunk_size, iterations);
+    SpecialMatrix matrix(N, matrix_type, bandwidth, 42, num_threads);
+    auto results = run_benchmark(matrix, num_threads, schedule, chunk_size, plan);
     
     double sum_time = 0.0;
     double min_time = results[0].execution_time;
@@ -363,7 +476,7 @@ int main(int argc, char* argv[]) {
         if (out.is_open()) {
             out.seekp(0, std::ios::end);
             if (out.tellp() == 0) {
-                out << "N,matrix_type,bandwidth,num_threads,schedule,chunk_size,iteration,execution_time_ms,result_value" << std::endl;
+                out << "N,matrix_type,bandwidth,num_threads,schedule,chunk_size,iteration,execution_time_ms,result_value,runs_used,ci_low_ms,ci_high_ms,placement" << std::endl;
             }
             
             for (const auto& result : results) {
@@ -375,7 +488,10 @@ int main(int argc, char* argv[]) {
                     << result.chunk_size << ","
                     << result.iteration << ","
                     << std::fixed << std::setprecision(6) << result.execution_time << ","
-                    << std::scientific << std::setprecision(15) << result.result_value << std::endl;
+                    << std::scientific << std::setprecision(15) << result.result_value << ","
+                    << result.runs_used << ","
+                    << std::fixed << std::setprecision(6) << result.ci_low_ms << ","
+                    << result.ci_high_ms << "," << numa_placement() << std::endl;
             }
             out.close();
         }
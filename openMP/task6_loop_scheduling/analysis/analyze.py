@@ -3,73 +3,59 @@
 Analysis script for Task 6: Loop Scheduling Investigation
 
 This script processes benchmark results and generates statistical analysis
-comparing different OpenMP scheduling strategies (static, dynamic, guided)
+comparing different OpenMP scheduling strategies (static, dynamic, guided, steal)
 with uneven workload.
 """
 
-import pandas as pd
-import numpy as np
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from benchkit import Schema, summarize
+from benchkit.lazy import lazy_import
+from benchkit.placement import print_placement_summary
+
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+
+SCHEDULES = ['static', 'dynamic', 'guided', 'steal']
+
 def load_data(csv_file):
     """Load benchmark data from CSV file"""
     try:
         df = pd.read_csv(csv_file)
+        # Work-stealing counters were added later; older files ran no steal rows
+        for column in ['steals', 'min_thread_iterations', 'max_thread_iterations']:
+            if column not in df.columns:
+                df[column] = 0
         print(f"✓ Loaded {len(df)} benchmark results from {csv_file}")
         return df
     except Exception as e:
         print(f"✗ Error loading data: {e}")
         sys.exit(1)
 
+TASK_SCHEMA = Schema(
+    keys=['num_iterations', 'num_threads', 'schedule', 'chunk_size'],
+    baseline={'num_threads': 1, 'schedule': 'sequential'},
+    baseline_on=['num_iterations'],
+    names={'mean': 'mean_time_ms', 'median': 'median_time_ms', 'std': 'std_time_ms',
+           'min': 'min_time_ms', 'max': 'max_time_ms', 'count': 'runs'},
+    extra={'steals': ('steals', 'mean'),
+           'min_thread_iterations': ('min_thread_iterations', 'min'),
+           'max_thread_iterations': ('max_thread_iterations', 'max')},
+    keep_baseline=False,
+    baseline_column='baseline_time_ms',
+)
+
 def calculate_statistics(df):
-    """Calculate speedup and efficiency metrics"""
-    
-    # Group by configuration
-    grouped = df.groupby(['num_iterations', 'num_threads', 'schedule', 'chunk_size'])
+    """Calculate speedup and efficiency metrics against the sequential baseline"""
+    stats = summarize(df, TASK_SCHEMA)
     
-    # Calculate mean execution time for each configuration
-    stats = grouped['execution_time_ms'].agg(['mean', 'std', 'min', 'max']).reset_index()
-    stats.columns = ['num_iterations', 'num_threads', 'schedule', 'chunk_size', 
-                     'mean_time_ms', 'std_time_ms', 'min_time_ms', 'max_time_ms']
+    missing = set(df['num_iterations']) - set(stats['num_iterations'])
+    for iterations in sorted(missing):
+        print(f"Warning: No sequential baseline found for {iterations} iterations")
     
-    # Calculate speedup and efficiency for each iteration count
-    results = []
-    
-    for iterations in stats['num_iterations'].unique():
-        iter_data = stats[stats['num_iterations'] == iterations].copy()
-        
-        # Get sequential baseline (1 thread, sequential schedule)
-        baseline = iter_data[
-            (iter_data['num_threads'] == 1) & 
-            (iter_data['schedule'] == 'sequential')
-        ]['mean_time_ms'].values
-        
-        if len(baseline) == 0:
-            print(f"Warning: No sequential baseline found for {iterations} iterations")
-            continue
-            
-        baseline_time = baseline[0]
-        
-        # Calculate speedup and efficiency for parallel runs
-        for _, row in iter_data.iterrows():
-            if row['schedule'] != 'sequential':
-                speedup = baseline_time / row['mean_time_ms']
-                efficiency = speedup / row['num_threads']
-                
-                results.append({
-                    'num_iterations': row['num_iterations'],
-                    'num_threads': row['num_threads'],
-                    'schedule': row['schedule'],
-                    'chunk_size': row['chunk_size'],
-                    'mean_time_ms': row['mean_time_ms'],
-                    'std_time_ms': row['std_time_ms'],
-                    'speedup': speedup,
-                    'efficiency': efficiency,
-                    'baseline_time_ms': baseline_time
-                })
-    
-    return pd.DataFrame(results)
+    return stats
 
 def print_summary(df):
     """Print summary statistics"""
@@ -89,7 +75,7 @@ def print_summary(df):
         
         iter_data = df[df['num_iterations'] == iterations]
         
-        for schedule in ['static', 'dynamic', 'guided']:
+        for schedule in SCHEDULES:
             sched_data = iter_data[iter_data['schedule'] == schedule]
             
             if len(sched_data) == 0:
@@ -147,6 +133,34 @@ def compare_schedules(df):
                       f"{row['mean_time_ms']:>10.3f} ± {row['std_time_ms']:<5.2f} "
                       f"{row['speedup']:>8.2f}x    {is_best:<10}")
 
+def print_steal_summary(df):
+    """Steal schedule vs dynamic with the same chunk size and placement, plus steal counters"""
+    steal = df[df['schedule'] == 'steal']
+    if len(steal) == 0:
+        return
+    
+    print("\n" + "="*80)
+    print("WORK STEALING (steal vs dynamic, same chunk size and placement)")
+    print("="*80)
+    
+    columns = ['num_iterations', 'num_threads', 'chunk_size', 'placement']
+    dynamic = df[df['schedule'] == 'dynamic'].set_index(columns)['mean_time_ms']
+    print(f"\n{'Iterations':<12} {'Threads':<10} {'Chunk':<10} {'Placement':<30} {'Steal (ms)':<12} "
+          f"{'Dynamic (ms)':<14} {'Gain':<8} {'Steals':<10} {'Iter/thread':<15}")
+    print("-" * 126)
+    for _, row in steal.sort_values(columns).iterrows():
+        chunk_str = "default" if row['chunk_size'] == 0 else str(int(row['chunk_size']))
+        key = tuple(row[column] for column in columns)
+        if key in dynamic.index:
+            dynamic_text = f"{dynamic[key]:.3f}"
+            gain = f"{dynamic[key] / row['mean_time_ms']:.2f}x"
+        else:
+            dynamic_text = gain = "-"
+        spread = f"{int(row['min_thread_iterations'])}-{int(row['max_thread_iterations'])}"
+        print(f"{int(row['num_iterations']):<12} {int(row['num_threads']):<10} {chunk_str:<10} "
+              f"{row['placement']:<30} {row['mean_time_ms']:<12.3f} {dynamic_text:<14} {gain:<8} "
+              f"{row['steals']:<10.1f} {spread:<15}")
+
 def analyze_chunk_size_impact(df):
     """Analyze impact of chunk size on performance"""
     
@@ -165,7 +179,7 @@ def analyze_chunk_size_impact(df):
         
         iter_data = df[df['num_iterations'] == iterations]
         
-        for schedule in ['static', 'dynamic', 'guided']:
+        for schedule in SCHEDULES:
             sched_data = iter_data[iter_data['schedule'] == schedule]
             
             if len(sched_data) == 0:
@@ -228,7 +242,9 @@ def main():
     
     # Print analyses
     print_summary(stats_df)
+    print_placement_summary(stats_df, 'num_threads')
     compare_schedules(stats_df)
+    print_steal_summary(stats_df)
     analyze_chunk_size_impact(stats_df)
     
     # Save processed data
@@ -3,19 +3,30 @@
 Graph generation script for Task 6: Loop Scheduling Investigation
 
 Generates comprehensive visualizations comparing different OpenMP scheduling
-strategies (static, dynamic, guided) with uneven workload.
+strategies (static, dynamic, guided, steal) with uneven workload.
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
 from pathlib import Path
 import sys
 
-# Set style
-plt.style.use('seaborn-v0_8-darkgrid')
-plt.rcParams['figure.figsize'] = (12, 8)
-plt.rcParams['font.size'] = 10
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from benchkit.lazy import lazy_import
+from benchkit.placement import plot_placement_speedup
+from benchkit.render import Job, parse_options, per_placement, render, split
+
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+
+def set_style(plt):
+    plt.style.use('seaborn-v0_8-darkgrid')
+    plt.rcParams['figure.figsize'] = (12, 8)
+    plt.rcParams['font.size'] = 10
+
+plt = lazy_import('matplotlib.pyplot', setup=set_style)
+
+SCHEDULES = ['static', 'dynamic', 'guided', 'steal']
+COLORS = {'static': 'blue', 'dynamic': 'red', 'guided': 'green', 'steal': 'purple'}
+MARKERS = {'static': 'o', 'dynamic': 's', 'guided': '^', 'steal': 'D'}
 
 def find_latest_processed_file():
     """Find the most recent processed CSV file"""
@@ -48,11 +59,7 @@ def plot_execution_time_vs_threads(df, output_dir):
         
         fig, ax = plt.subplots(figsize=(12, 8))
         
-        schedules = ['static', 'dynamic', 'guided']
-        colors = {'static': 'blue', 'dynamic': 'red', 'guided': 'green'}
-        markers = {'static': 'o', 'dynamic': 's', 'guided': '^'}
-        
-        for schedule in schedules:
+        for schedule in SCHEDULES:
             # Use default chunk size (0) for main comparison
             sched_data = iter_data[
                 (iter_data['schedule'] == schedule) & 
@@ -61,8 +68,8 @@ def plot_execution_time_vs_threads(df, output_dir):
             
             if len(sched_data) > 0:
                 ax.plot(sched_data['num_threads'], sched_data['mean_time_ms'],
-                       marker=markers[schedule], label=schedule.capitalize(),
-                       color=colors[schedule], linewidth=2, markersize=8)
+                       marker=MARKERS[schedule], label=schedule.capitalize(),
+                       color=COLORS[schedule], linewidth=2, markersize=8)
         
         ax.set_xlabel('Number of Threads', fontsize=12, fontweight='bold')
         ax.set_ylabel('Execution Time (ms)', fontsize=12, fontweight='bold')
@@ -87,13 +94,9 @@ def plot_speedup_vs_threads(df, output_dir):
         
         fig, ax = plt.subplots(figsize=(12, 8))
         
-        schedules = ['static', 'dynamic', 'guided']
-        colors = {'static': 'blue', 'dynamic': 'red', 'guided': 'green'}
-        markers = {'static': 'o', 'dynamic': 's', 'guided': '^'}
-        
         max_threads = 0
         
-        for schedule in schedules:
+        for schedule in SCHEDULES:
             # Use default chunk size (0)
             sched_data = iter_data[
                 (iter_data['schedule'] == schedule) & 
@@ -102,8 +105,8 @@ def plot_speedup_vs_threads(df, output_dir):
             
             if len(sched_data) > 0:
                 ax.plot(sched_data['num_threads'], sched_data['speedup'],
-                       marker=markers[schedule], label=schedule.capitalize(),
-                       color=colors[schedule], linewidth=2, markersize=8)
+                       marker=MARKERS[schedule], label=schedule.capitalize(),
+                       color=COLORS[schedule], linewidth=2, markersize=8)
                 max_threads = max(max_threads, sched_data['num_threads'].max())
         
         # Plot ideal speedup line
@@ -135,11 +138,7 @@ def plot_efficiency_vs_threads(df, output_dir):
         
         fig, ax = plt.subplots(figsize=(12, 8))
         
-        schedules = ['static', 'dynamic', 'guided']
-        colors = {'static': 'blue', 'dynamic': 'red', 'guided': 'green'}
-        markers = {'static': 'o', 'dynamic': 's', 'guided': '^'}
-        
-        for schedule in schedules:
+        for schedule in SCHEDULES:
             # Use default chunk size (0)
             sched_data = iter_data[
                 (iter_data['schedule'] == schedule) & 
@@ -148,8 +147,8 @@ def plot_efficiency_vs_threads(df, output_dir):
             
             if len(sched_data) > 0:
                 ax.plot(sched_data['num_threads'], sched_data['efficiency'] * 100,
-                       marker=markers[schedule], label=schedule.capitalize(),
-                       color=colors[schedule], linewidth=2, markersize=8)
+                       marker=MARKERS[schedule], label=schedule.capitalize(),
+                       color=COLORS[schedule], linewidth=2, markersize=8)
         
         # Plot 100% efficiency line
         ax.axhline(y=100, color='k', linestyle='--', label='Ideal (100%)',
@@ -186,11 +185,10 @@ def plot_schedule_comparison(df, output_dir):
             (df['chunk_size'] == 0)
         ]
         
-        schedules = ['static', 'dynamic', 'guided']
         x = np.arange(len(iter_data['num_threads'].unique()))
-        width = 0.25
+        width = 0.8 / len(SCHEDULES)
         
-        for i, schedule in enumerate(schedules):
+        for i, schedule in enumerate(SCHEDULES):
             sched_data = iter_data[iter_data['schedule'] == schedule].sort_values('num_threads')
             if len(sched_data) > 0:
                 ax.bar(x + i * width, sched_data['speedup'], width,
@@ -199,7 +197,7 @@ def plot_schedule_comparison(df, output_dir):
         ax.set_xlabel('Number of Threads', fontsize=11, fontweight='bold')
         ax.set_ylabel('Speedup', fontsize=11, fontweight='bold')
         ax.set_title(f'{iterations} iterations', fontsize=12, fontweight='bold')
-        ax.set_xticks(x + width)
+        ax.set_xticks(x + width * (len(SCHEDULES) - 1) / 2)
         ax.set_xticklabels(sorted(iter_data['num_threads'].unique()))
         ax.legend()
         ax.grid(True, alpha=0.3, axis='y')
@@ -216,13 +214,11 @@ def plot_chunk_size_impact(df, output_dir):
     for iterations in sorted(df['num_iterations'].unique()):
         iter_data = df[df['num_iterations'] == iterations]
         
-        fig, axes = plt.subplots(1, 3, figsize=(18, 6))
+        fig, axes = plt.subplots(1, len(SCHEDULES), figsize=(6 * len(SCHEDULES), 6))
         fig.suptitle(f'Chunk Size Impact ({iterations} iterations)',
                     fontsize=14, fontweight='bold')
         
-        schedules = ['static', 'dynamic', 'guided']
-        
-        for idx, schedule in enumerate(schedules):
+        for idx, schedule in enumerate(SCHEDULES):
             ax = axes[idx]
             sched_data = iter_data[iter_data['schedule'] == schedule]
             
@@ -273,7 +269,7 @@ def create_summary_table(df, output_dir):
             
             iter_data = df[df['num_iterations'] == iterations]
             
-            for schedule in ['static', 'dynamic', 'guided']:
+            for schedule in SCHEDULES:
                 sched_data = iter_data[
                     (iter_data['schedule'] == schedule) & 
                     (iter_data['chunk_size'] == 0)
@@ -302,10 +298,13 @@ def create_summary_table(df, output_dir):
         f.write("2. Dynamic and guided schedules handle load imbalance better than static\n")
         f.write("3. Chunk size significantly affects performance for dynamic/guided schedules\n")
         f.write("4. Efficiency decreases with more threads due to overhead and load imbalance\n")
+        f.write("5. Steal starts from static blocks and only moves work off threads that fall behind\n")
     
     print(f"✓ Saved: {output_file}")
 
 def main():
+    options = parse_options()
+    
     print("="*80)
     print("Task 6: Loop Scheduling Investigation - Graph Generation")
     print("="*80)
@@ -323,15 +322,24 @@ def main():
     output_dir = Path(__file__).parent.parent / 'graphs'
     output_dir.mkdir(exist_ok=True)
     
-    print("\nGenerating graphs...")
+    print(f"\nGenerating graphs (jobs: {options.jobs})...")
     
     # Generate all plots
-    plot_execution_time_vs_threads(df, output_dir)
-    plot_speedup_vs_threads(df, output_dir)
-    plot_efficiency_vs_threads(df, output_dir)
-    plot_schedule_comparison(df, output_dir)
-    plot_chunk_size_impact(df, output_dir)
-    create_summary_table(df, output_dir)
+    # Everything but the placement comparison is drawn once per placement policy
+    def policy_jobs(directory, where):
+        return [
+            *split(df, plot_execution_time_vs_threads, 'num_iterations', directory, where=where),
+            *split(df, plot_speedup_vs_threads, 'num_iterations', directory, where=where),
+            *split(df, plot_efficiency_vs_threads, 'num_iterations', directory, where=where),
+            Job(plot_schedule_comparison, directory, where=where),
+            *split(df, plot_chunk_size_impact, 'num_iterations', directory, where=where),
+            Job(create_summary_table, directory, where=where),
+        ]
+    
+    render([
+        *per_placement(df, output_dir, policy_jobs),
+        Job(plot_placement_speedup, output_dir, 'num_threads'),
+    ], df, options, output_dir)
     
     print("\n" + "="*80)
     print("Graph generation complete!")
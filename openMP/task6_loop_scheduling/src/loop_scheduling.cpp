@@ -6,8 +6,15 @@
 #include <iomanip>
 #include <fstream>
 #include <string>
+#include <algorithm>
+#include <sstream>
+#include <cstdlib>
+#include <unistd.h>
 #include <omp.h>
 
+#include "../../common/bench_numa.h"
+#include "../../common/bench_runs.h"
+
 using namespace std;
 
 struct BenchmarkResult {
@@ -17,6 +24,40 @@ struct BenchmarkResult {
     int num_iterations;
     double execution_time_ms;
     double result;
+    int runs_used;
+    double ci_low_ms;
+    double ci_high_ms;
+};
+
+// Per-thread counters of the steal schedule (from the last run)
+struct StealStats {
+    vector<long long> iterations;
+    vector<long long> steals;
+};
+
+// Schedule and chunk size picked by the autotuner for one (workload, machine)
+struct TuneChoice {
+    string schedule;
+    int chunk_size;
+    double time_ms;     // median of the winner's runs during the search
+    int trials;         // timed runs the whole search took
+};
+
+// Search space of the autotuner and its early-drop rule: a configuration whose
+// median is more than TUNE_DROP_RATIO times the round's leader is not run again
+const char* const TUNE_SCHEDULES[] = {"static", "dynamic", "guided", "steal"};
+const int TUNE_CHUNKS[] = {0, 1, 4, 16, 64};
+const double TUNE_DROP_RATIO = 1.5;
+
+// One thread's share of the steal schedule: the iterations [begin, end) not yet
+// taken. The owner takes chunks from the front, thieves split off the back half.
+struct StealRange {
+    omp_lock_t lock;
+    int begin;
+    int end;
+    long long iterations;
+    long long steals;
+    char pad[64];   // keep neighbouring ranges on separate cache lines
 };
 
 double heavy_work(int iteration, int work_amount) {
@@ -35,6 +76,15 @@ double heavy_work(int iteration, int work_amount) {
 double light_work(int iteration) {
     return static_cast<double>(iteration) * 0.001;
 }
+
+inline double uneven_iteration(int i) {
+    if (i % 10 == 0) {
+        return heavy_work(i, 10000);
+    } else if (i % 5 == 0) {
+        return heavy_work(i, 5000);
+    }
+    return light_work(i);
+}
 double uneven_workload_loop_sequential(int num_iterations) {
     double total_sum = 0.0;
     
@@ -146,8 +196,120 @@ double uneven_workload_loop_guided(int num_iterations, int num_threads, int chun
     return total_sum;
 }
 
+// Work stealing: every thread starts with its static block, takes chunk_size
+// iterations at a time from the front (1 by default), and once it runs dry
+// steals the back half of another thread's remaining range. A thread stops
+// after a full sweep over the other threads finds nothing left to steal.
+// The blocks are split over the team the runtime actually gives, which may be
+// smaller than num_threads (OMP_THREAD_LIMIT, nested regions).
+double uneven_workload_loop_steal(int num_iterations, int num_threads, int chunk_size,
+                                  StealStats* stats) {
+    double total_sum = 0.0;
+    const int chunk = chunk_size > 0 ? chunk_size : 1;
+    vector<StealRange> ranges(num_threads);
+    int team_size = num_threads;
+    
+    for (int t = 0; t < num_threads; ++t) {
+        omp_init_lock(&ranges[t].lock);
+    }
+    
+    omp_set_num_threads(num_threads);
+    
+    #pragma omp parallel reduction(+:total_sum)
+    {
+        #pragma omp single
+        {
+            team_size = omp_get_num_threads();
+            for (int t = 0; t < team_size; ++t) {
+                ranges[t].begin = static_cast<int>(static_cast<long long>(num_iterations) * t / team_size);
+                ranges[t].end = static_cast<int>(static_cast<long long>(num_iterations) * (t + 1) / team_size);
+                ranges[t].iterations = 0;
+                ranges[t].steals = 0;
+            }
+        }
+        
+        const int team = team_size;
+        const int tid = omp_get_thread_num();
+        StealRange& own = ranges[tid];
+        unsigned int state = 2463534242u + 7919u * tid;
+        
+        while (true) {
+            omp_set_lock(&own.lock);
+            int begin = own.begin;
+            int end = min(own.end, begin + chunk);
+            own.begin = end;
+            omp_unset_lock(&own.lock);
+            
+            if (begin < end) {
+                for (int i = begin; i < end; ++i) {
+                    total_sum += uneven_iteration(i);
+                }
+                own.iterations += end - begin;
+                continue;
+            }
+            
+            // Own range is empty: sweep the others from a random start
+            state ^= state << 13;
+            state ^= state >> 17;
+            state ^= state << 5;
+            bool stolen = false;
+            for (int k = 0; k < team - 1 && !stolen; ++k) {
+                StealRange& victim = ranges[(tid + 1 + (state + k) % (team - 1)) % team];
+                omp_set_lock(&victim.lock);
+                int remaining = victim.end - victim.begin;
+                if (remaining > 0) {
+                    int split = victim.end - (remaining + 1) / 2;
+                    begin = split;
+                    end = victim.end;
+                    victim.end = split;
+                    stolen = true;
+                }
+                omp_unset_lock(&victim.lock);
+            }
+            if (!stolen) {
+                break;
+            }
+            
+            omp_set_lock(&own.lock);
+            own.begin = begin;
+            own.end = end;
+            omp_unset_lock(&own.lock);
+            own.steals++;
+        }
+    }
+    
+    if (stats) {
+        stats->iterations.assign(team_size, 0);
+        stats->steals.assign(team_size, 0);
+        for (int t = 0; t < team_size; ++t) {
+            stats->iterations[t] = ranges[t].iterations;
+            stats->steals[t] = ranges[t].steals;
+        }
+    }
+    for (int t = 0; t < num_threads; ++t) {
+        omp_destroy_lock(&ranges[t].lock);
+    }
+    
+    return total_sum;
+}
+
+double run_schedule(const string& schedule_type, int num_iterations, int num_threads,
+                    int chunk_size, StealStats* stats) {
+    if (schedule_type == "sequential") {
+        return uneven_workload_loop_sequential(num_iterations);
+    } else if (schedule_type == "static") {
+        return uneven_workload_loop_static(num_iterations, num_threads, chunk_size);
+    } else if (schedule_type == "dynamic") {
+        return uneven_workload_loop_dynamic(num_iterations, num_threads, chunk_size);
+    } else if (schedule_type == "guided") {
+        return uneven_workload_loop_guided(num_iterations, num_threads, chunk_size);
+    }
+    return uneven_workload_loop_steal(num_iterations, num_threads, chunk_size, stats);
+}
+
 BenchmarkResult run_benchmark(const string& schedule_type, int num_iterations, 
-                              int num_threads, int chunk_size, int runs) {
+                              int num_threads, int chunk_size, const run_plan& plan,
+                              StealStats* stats) {
     BenchmarkResult result;
     result.schedule_type = schedule_type;
     result.chunk_size = chunk_size;
@@ -157,30 +319,216 @@ BenchmarkResult run_benchmark(const string& schedule_type, int num_iterations,
     double total_time = 0.0;
     double final_result = 0.0;
     
-    for (int run = 0; run < runs; ++run) {
+    run_series series;
+    run_series_init(&series, &plan);
+    
+    while (!run_series_done(&series)) {
         auto start = chrono::high_resolution_clock::now();
         
-        if (schedule_type == "sequential") {
-            final_result = uneven_workload_loop_sequential(num_iterations);
-        } else if (schedule_type == "static") {
-            final_result = uneven_workload_loop_static(num_iterations, num_threads, chunk_size);
-        } else if (schedule_type == "dynamic") {
-            final_result = uneven_workload_loop_dynamic(num_iterations, num_threads, chunk_size);
-        } else if (schedule_type == "guided") {
-            final_result = uneven_workload_loop_guided(num_iterations, num_threads, chunk_size);
-        }
+        final_result = run_schedule(schedule_type, num_iterations, num_threads, chunk_size, stats);
         
         auto end = chrono::high_resolution_clock::now();
         chrono::duration<double, milli> duration = end - start;
         total_time += duration.count();
+        run_series_add(&series, duration.count());
     }
     
-    result.execution_time_ms = total_time / runs;
+    result.execution_time_ms = total_time / series.count;
     result.result = final_result;
+    result.runs_used = series.count;
+    result.ci_low_ms = series.ci_low;
+    result.ci_high_ms = series.ci_high;
+    run_series_free(&series);
     
     return result;
 }
 
+// ---- Autotuning -------------------------------------------------------------
+
+string tune_cache_path() {
+    const char* path = getenv("BENCH_TUNE_CACHE");
+    return (path && *path) ? path : "loop_scheduling_tune.json";
+}
+
+string tune_machine_key() {
+    char host[256] = "unknown";
+    gethostname(host, sizeof(host) - 1);
+    host[sizeof(host) - 1] = '\0';
+    return string(host) + "/" + to_string(omp_get_num_procs()) + "cpu/" + numa_placement();
+}
+
+string tune_workload_key(int num_iterations, int num_threads) {
+    return "uneven/" + to_string(num_iterations) + "/" + to_string(num_threads);
+}
+
+// Value of "key" in a flat JSON object (strings unquoted), or "" if absent
+string json_field(const string& object, const string& key) {
+    size_t pos = object.find("\"" + key + "\"");
+    if (pos == string::npos || (pos = object.find(':', pos)) == string::npos) {
+        return "";
+    }
+    pos = object.find_first_not_of(" \t\r\n", pos + 1);
+    if (pos == string::npos) {
+        return "";
+    }
+    if (object[pos] == '"') {
+        size_t end = object.find('"', pos + 1);
+        return end == string::npos ? "" : object.substr(pos + 1, end - pos - 1);
+    }
+    size_t end = object.find_first_of(",} \t\r\n", pos);
+    return object.substr(pos, end == string::npos ? string::npos : end - pos);
+}
+
+// The cache is a JSON array of flat objects, one per (machine, workload):
+// {"machine": ..., "workload": ..., "schedule": ..., "chunk_size": ..., "time_ms": ..., "trials": ...}
+vector<string> read_tune_cache(const string& path) {
+    vector<string> entries;
+    ifstream file(path);
+    if (!file.good()) {
+        return entries;
+    }
+    stringstream buffer;
+    buffer << file.rdbuf();
+    const string text = buffer.str();
+    size_t begin = text.find('{');
+    while (begin != string::npos) {
+        size_t end = text.find('}', begin);
+        if (end == string::npos) {
+            break;
+        }
+        entries.push_back(text.substr(begin, end - begin + 1));
+        begin = text.find('{', end);
+    }
+    return entries;
+}
+
+bool lookup_tune_choice(int num_iterations, int num_threads, TuneChoice* choice) {
+    const string machine = tune_machine_key();
+    const string workload = tune_workload_key(num_iterations, num_threads);
+    vector<string> entries = read_tune_cache(tune_cache_path());
+    for (size_t i = 0; i < entries.size(); ++i) {
+        if (json_field(entries[i], "machine") == machine &&
+            json_field(entries[i], "workload") == workload) {
+            choice->schedule = json_field(entries[i], "schedule");
+            choice->chunk_size = atoi(json_field(entries[i], "chunk_size").c_str());
+            choice->time_ms = atof(json_field(entries[i], "time_ms").c_str());
+            choice->trials = atoi(json_field(entries[i], "trials").c_str());
+            return !choice->schedule.empty();
+        }
+    }
+    return false;
+}
+
+bool store_tune_choice(int num_iterations, int num_threads, const TuneChoice& choice) {
+    const string path = tune_cache_path();
+    const string machine = tune_machine_key();
+    const string workload = tune_workload_key(num_iterations, num_threads);
+    
+    ostringstream entry;
+    entry << "{\"machine\": \"" << machine << "\", \"workload\": \"" << workload
+          << "\", \"schedule\": \"" << choice.schedule << "\", \"chunk_size\": " << choice.chunk_size
+          << ", \"time_ms\": " << fixed << setprecision(6) << choice.time_ms
+          << ", \"trials\": " << choice.trials << "}";
+    
+    vector<string> entries = read_tune_cache(path);
+    bool replaced = false;
+    for (size_t i = 0; i < entries.size(); ++i) {
+        if (json_field(entries[i], "machine") == machine &&
+            json_field(entries[i], "workload") == workload) {
+            entries[i] = entry.str();
+            replaced = true;
+        }
+    }
+    if (!replaced) {
+        entries.push_back(entry.str());
+    }
+    
+    ofstream file(path);
+    if (!file.good()) {
+        cerr << "Error: Cannot write tuning cache " << path << endl;
+        return false;
+    }
+    file << "[" << endl;
+    for (size_t i = 0; i < entries.size(); ++i) {
+        file << "  " << entries[i] << (i + 1 < entries.size() ? "," : "") << endl;
+    }
+    file << "]" << endl;
+    return true;
+}
+
+double median_of(vector<double> values) {
+    return run_median(values.data(), static_cast<int>(values.size()));
+}
+
+// Successive halving over schedule x chunk size. Round r gives every surviving
+// configuration 2^r timed runs in total (earlier runs are kept), ranks them by
+// median and keeps the faster half. A configuration stops being run as soon as
+// its median exceeds TUNE_DROP_RATIO times the best median of the round, and
+// is then dropped regardless of its rank.
+TuneChoice autotune_schedule(int num_iterations, int num_threads) {
+    struct Candidate {
+        string schedule;
+        int chunk_size;
+        vector<double> times;
+        double median;
+    };
+    
+    vector<Candidate> alive;
+    for (const char* schedule : TUNE_SCHEDULES) {
+        for (int chunk_size : TUNE_CHUNKS) {
+            Candidate candidate = {schedule, chunk_size, vector<double>(), 0.0};
+            alive.push_back(candidate);
+        }
+    }
+    
+    cout << "\n=== Autotuning (" << alive.size() << " configurations) ===" << endl;
+    cout << setw(8) << "Round" << setw(14) << "Configs" << setw(10) << "Runs"
+         << setw(16) << "Leader" << setw(14) << "Best (ms)" << setw(10) << "Dropped" << endl;
+    
+    int trials = 0;
+    size_t runs = 1;
+    for (int round = 0; alive.size() > 1; ++round, runs *= 2) {
+        double leader = 0.0;
+        for (size_t c = 0; c < alive.size(); ++c) {
+            Candidate& candidate = alive[c];
+            while (candidate.times.size() < runs) {
+                auto start = chrono::high_resolution_clock::now();
+                run_schedule(candidate.schedule, num_iterations, num_threads,
+                             candidate.chunk_size, NULL);
+                auto end = chrono::high_resolution_clock::now();
+                candidate.times.push_back(chrono::duration<double, milli>(end - start).count());
+                trials++;
+                candidate.median = median_of(candidate.times);
+                if (leader > 0.0 && candidate.median > TUNE_DROP_RATIO * leader) {
+                    break;
+                }
+            }
+            if (leader == 0.0 || candidate.median < leader) {
+                leader = candidate.median;
+            }
+        }
+        
+        sort(alive.begin(), alive.end(), [](const Candidate& a, const Candidate& b) {
+            return a.median < b.median;
+        });
+        size_t keep = (alive.size() + 1) / 2;
+        size_t survivors = 1;
+        while (survivors < keep && alive[survivors].median <= TUNE_DROP_RATIO * leader) {
+            survivors++;
+        }
+        
+        string label = alive[0].schedule + "," +
+                       (alive[0].chunk_size == 0 ? "default" : to_string(alive[0].chunk_size));
+        cout << setw(8) << round << setw(14) << alive.size() << setw(10) << runs
+             << setw(16) << label << setw(14) << fixed << setprecision(3) << alive[0].median
+             << setw(10) << alive.size() - survivors << endl;
+        alive.resize(survivors);
+    }
+    
+    TuneChoice choice = {alive[0].schedule, alive[0].chunk_size, alive[0].median, trials};
+    return choice;
+}
+
 bool verify_correctness(int num_iterations) {
     cout << "\n=== Correctness Verification ===" << endl;
     
@@ -222,23 +570,69 @@ bool verify_correctness(int num_iterations) {
         cout << "  ✓ PASSED" << endl;
     }
     
+    // Test steal: the sum must match and every iteration must run exactly once,
+    // also when the runtime gives a smaller team than requested (here a nested
+    // region with nesting disabled, which runs on a single thread)
+    StealStats stats;
+    StealStats small_stats;
+    double steal_result = uneven_workload_loop_steal(num_iterations, 4, 0, &stats);
+    double small_team_result = 0.0;
+    const int saved_levels = omp_get_max_active_levels();
+    omp_set_max_active_levels(1);
+    #pragma omp parallel num_threads(2)
+    {
+        #pragma omp single
+        small_team_result = uneven_workload_loop_steal(num_iterations, 4, 0, &small_stats);
+    }
+    omp_set_max_active_levels(saved_levels);
+    
+    struct { const char* label; double result; const StealStats* stats; } steal_cases[] = {
+        {"Steal result:      ", steal_result, &stats},
+        {"Steal (1 of 4 thr):", small_team_result, &small_stats},
+    };
+    for (const auto& c : steal_cases) {
+        double steal_error = abs(c.result - sequential_result);
+        long long steal_iterations = 0;
+        for (size_t t = 0; t < c.stats->iterations.size(); ++t) {
+            steal_iterations += c.stats->iterations[t];
+        }
+        cout << c.label << fixed << c.result << " (error: " << scientific << steal_error << ")" << endl;
+        if (steal_error > tolerance || steal_iterations != num_iterations) {
+            cout << "  ✗ FAILED (" << steal_iterations << " iterations executed)" << endl;
+            all_passed = false;
+        } else {
+            cout << "  ✓ PASSED" << endl;
+        }
+    }
+    
     cout << fixed;
     return all_passed;
 }
 
 void print_usage(const char* program_name) {
     cout << "Usage: " << program_name << " <num_iterations> <num_threads> <schedule> <chunk_size> <runs> [output_file]" << endl;
+    cout << "       " << program_name << " --tune <num_iterations> <num_threads>" << endl;
     cout << "\nParameters:" << endl;
     cout << "  num_iterations - Number of loop iterations (e.g., 1000, 5000, 10000)" << endl;
     cout << "  num_threads    - Number of OpenMP threads (1, 2, 4, 8, 16, 32, 64, 128)" << endl;
-    cout << "  schedule       - Scheduling strategy: sequential, static, dynamic, guided" << endl;
-    cout << "  chunk_size     - Chunk size for scheduling (0 = default)" << endl;
-    cout << "  runs           - Number of runs for averaging" << endl;
+    cout << "  schedule       - Scheduling strategy: sequential, static, dynamic, guided, steal," << endl;
+    cout << "                   or auto (the tuned schedule and chunk size, see --tune)" << endl;
+    cout << "  chunk_size     - Chunk size for scheduling (0 = default; for steal, iterations" << endl;
+    cout << "                   a thread takes from its own range at a time, default 1)" << endl;
+    cout << "  runs           - Number of runs, or auto[:min[:max[:width]]] to repeat until the" << endl;
+    cout << "                   median's 95% CI is within width (e.g. auto:5:100:0.02)" << endl;
     cout << "  output_file    - (Optional) CSV file to save results" << endl;
+    cout << "\nAutotuning:" << endl;
+    cout << "  --tune searches schedule x chunk size by successive halving and saves the" << endl;
+    cout << "  winner for this workload and machine to $BENCH_TUNE_CACHE (default" << endl;
+    cout << "  loop_scheduling_tune.json). 'auto' uses the saved choice, or tunes first" << endl;
+    cout << "  if there is none; its chunk_size argument is ignored." << endl;
     cout << "\nExamples:" << endl;
     cout << "  " << program_name << " 5000 4 static 0 10" << endl;
     cout << "  " << program_name << " 5000 8 dynamic 10 10 results.csv" << endl;
     cout << "  " << program_name << " 10000 16 guided 0 5" << endl;
+    cout << "  " << program_name << " 10000 64 steal 0 10 results.csv" << endl;
+    cout << "  " << program_name << " 10000 64 auto 0 10 results.csv" << endl;
 }
 
 int main(int argc, char* argv[]) {
@@ -254,6 +648,29 @@ int main(int argc, char* argv[]) {
         return passed ? 0 : 1;
     }
     
+    // Check for autotuning mode
+    if (argc == 4 && string(argv[1]) == "--tune") {
+        int num_iterations = atoi(argv[2]);
+        int num_threads = atoi(argv[3]);
+        if (num_iterations <= 0 || num_threads <= 0) {
+            cerr << "Error: Invalid arguments" << endl;
+            return 1;
+        }
+        if (numa_setup() != 0) {
+            return 1;
+        }
+        TuneChoice choice = autotune_schedule(num_iterations, num_threads);
+        cout << "\nBest: " << choice.schedule << ", chunk "
+             << (choice.chunk_size == 0 ? "default" : to_string(choice.chunk_size))
+             << " (" << fixed << setprecision(3) << choice.time_ms << " ms, "
+             << choice.trials << " timed runs)" << endl;
+        if (!store_tune_choice(num_iterations, num_threads, choice)) {
+            return 1;
+        }
+        cout << "Saved to: " << tune_cache_path() << endl;
+        return 0;
+    }
+    
     // Check arguments
     if (argc < 6) {
         cerr << "Error: Insufficient arguments" << endl;
@@ -266,28 +683,53 @@ int main(int argc, char* argv[]) {
     int num_threads = atoi(argv[2]);
     string schedule_type = argv[3];
     int chunk_size = atoi(argv[4]);
-    int runs = atoi(argv[5]);
     string output_file = (argc >= 7) ? argv[6] : "";
+    run_plan plan;
     
     // Validate arguments
-    if (num_iterations <= 0 || num_threads <= 0 || runs <= 0) {
+    if (num_iterations <= 0 || num_threads <= 0 || run_plan_parse(argv[5], &plan) != 0) {
         cerr << "Error: Invalid arguments" << endl;
         return 1;
     }
     
+    if (numa_setup() != 0) {
+        return 1;
+    }
+    
     if (schedule_type != "sequential" && schedule_type != "static" && 
-        schedule_type != "dynamic" && schedule_type != "guided") {
-        cerr << "Error: Invalid schedule type. Must be: sequential, static, dynamic, or guided" << endl;
+        schedule_type != "dynamic" && schedule_type != "guided" && schedule_type != "steal" &&
+        schedule_type != "auto") {
+        cerr << "Error: Invalid schedule type. Must be: sequential, static, dynamic, guided, steal, or auto" << endl;
         return 1;
     }
     
+    // Resolve auto to the cached choice, searching only when there is none
+    string tuned_from;
+    if (schedule_type == "auto") {
+        TuneChoice choice;
+        if (lookup_tune_choice(num_iterations, num_threads, &choice)) {
+            tuned_from = "cached in " + tune_cache_path();
+        } else {
+            choice = autotune_schedule(num_iterations, num_threads);
+            if (!store_tune_choice(num_iterations, num_threads, choice)) {
+                return 1;
+            }
+            tuned_from = "tuned, saved to " + tune_cache_path();
+        }
+        schedule_type = choice.schedule;
+        chunk_size = choice.chunk_size;
+    }
+    
     // Print configuration
     cout << "=== OpenMP Loop Scheduling Investigation ===" << endl;
     cout << "Iterations:     " << num_iterations << endl;
     cout << "Threads:        " << num_threads << endl;
     cout << "Schedule:       " << schedule_type << endl;
+    if (!tuned_from.empty()) {
+        cout << "                (auto: " << tuned_from << ")" << endl;
+    }
     cout << "Chunk size:     " << (chunk_size == 0 ? "default" : to_string(chunk_size)) << endl;
-    cout << "Runs:           " << runs << endl;
+    cout << "Runs:           " << argv[5] << endl;
     cout << "OpenMP threads: " << omp_get_max_threads() << " available" << endl;
     cout << "\nWorkload pattern:" << endl;
     cout << "  - Every 10th iteration: very heavy (10000 operations)" << endl;
@@ -296,14 +738,34 @@ int main(int argc, char* argv[]) {
     cout << "\n=== Running Benchmark ===" << endl;
     
     // Run benchmark
+    StealStats stats;
     BenchmarkResult result = run_benchmark(schedule_type, num_iterations, num_threads, 
-                                          chunk_size, runs);
+                                          chunk_size, plan, &stats);
     
     // Print results
     cout << "\n=== Results ===" << endl;
     cout << "Average execution time: " << fixed << setprecision(3) 
          << result.execution_time_ms << " ms" << endl;
     cout << "Result value: " << setprecision(6) << result.result << endl;
+    cout << "Runs used: " << result.runs_used << " (median 95% CI: " << setprecision(3)
+         << result.ci_low_ms << " - " << result.ci_high_ms << " ms)" << endl;
+    
+    long long total_steals = 0;
+    long long min_thread_iterations = 0;
+    long long max_thread_iterations = 0;
+    if (schedule_type == "steal") {
+        min_thread_iterations = *min_element(stats.iterations.begin(), stats.iterations.end());
+        max_thread_iterations = *max_element(stats.iterations.begin(), stats.iterations.end());
+        cout << "\nPer-thread work (last run):" << endl;
+        cout << "  " << setw(8) << "Thread" << setw(14) << "Iterations" << setw(10) << "Steals" << endl;
+        for (size_t t = 0; t < stats.iterations.size(); ++t) {
+            cout << "  " << setw(8) << t << setw(14) << stats.iterations[t]
+                 << setw(10) << stats.steals[t] << endl;
+            total_steals += stats.steals[t];
+        }
+        cout << "  Total steals: " << total_steals << ", iterations per thread: "
+             << min_thread_iterations << " - " << max_thread_iterations << endl;
+    }
     
     // Save to file if specified
     if (!output_file.empty()) {
@@ -313,7 +775,7 @@ int main(int argc, char* argv[]) {
         
         if (!file_exists) {
             // Write header
-            file << "num_iterations,num_threads,schedule,chunk_size,execution_time_ms,result" << endl;
+            file << "num_iterations,num_threads,schedule,chunk_size,execution_time_ms,result,runs_used,ci_low_ms,ci_high_ms,placement,steals,min_thread_iterations,max_thread_iterations" << endl;
         }
         
         file << num_iterations << ","
@@ -321,7 +783,13 @@ int main(int argc, char* argv[]) {
              << schedule_type << ","
              << chunk_size << ","
              << fixed << setprecision(6) << result.execution_time_ms << ","
-             << result.result << endl;
+             << result.result << ","
+             << result.runs_used << ","
+             << result.ci_low_ms << ","
+             << result.ci_high_ms << "," << numa_placement() << ","
+             << total_steals << ","
+             << min_thread_iterations << ","
+             << max_thread_iterations << endl;
         
         file.close();
         cout << "\nResults saved to: " << output_file << endl;
@@ -4,11 +4,59 @@ Analysis script for Task 7: Reduction with Different Synchronization Methods
 Processes benchmark results and calculates performance metrics
 """
 
-import pandas as pd
 import sys
 import os
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from benchkit import Schema, summarize
+from benchkit.lazy import lazy_import
+from benchkit.placement import print_placement_summary
+
+pd = lazy_import('pandas')
+
+METHODS = ['builtin', 'atomic', 'critical', 'lock', 'tree', 'relaxed']
+
+TASK_SCHEMA = Schema(
+    keys=['array_size', 'num_threads', 'method'],
+    baseline={'method': 'sequential'},
+    baseline_on=['array_size'],
+    names={'mean': 'execution_time_ms'},
+    # local-sum / combine split, recorded by tree and relaxed only (NaN otherwise)
+    extra={'local_ms': ('local_ms', 'mean'), 'combine_ms': ('combine_ms', 'mean')},
+)
+
+def read_results(csv_file):
+    """Read raw results; files from before the phase split get empty phase columns"""
+    df = pd.read_csv(csv_file)
+    for column in ['local_ms', 'combine_ms']:
+        if column not in df.columns:
+            df[column] = float('nan')
+    return df
+
+def print_phase_split(stats):
+    """Local-sum vs combine time for the methods that record both phases"""
+    phases = stats[stats['combine_ms'].notna() & (stats['method'] != 'sequential')]
+    if len(phases) == 0:
+        return
+    
+    print(f"\n\n{'='*80}")
+    print("PHASE SPLIT (local sums vs combine)")
+    print(f"{'='*80}")
+    
+    for size in sorted(phases['array_size'].unique()):
+        print(f"\nArray Size: {size:,}")
+        print(f"{'Method':<10} {'Threads':<10} {'Placement':<30} {'Local (ms)':<12} "
+              f"{'Combine (ms)':<14} {'Combine share':<14}")
+        print("-" * 93)
+        size_df = phases[phases['array_size'] == size].sort_values(['method', 'num_threads', 'placement'])
+        for _, row in size_df.iterrows():
+            total = row['local_ms'] + row['combine_ms']
+            share = row['combine_ms'] / total if total > 0 else 0.0
+            marker = "  <- combine dominates" if share > 0.5 else ""
+            print(f"{row['method']:<10} {int(row['num_threads']):<10} {row['placement']:<30} "
+                  f"{row['local_ms']:<12.3f} {row['combine_ms']:<14.3f} {share:<14.1%}{marker}")
+
 def analyze_results(csv_file):
     """Analyze benchmark results and calculate metrics"""
     
@@ -16,7 +64,7 @@ def analyze_results(csv_file):
     
     # Read CSV file
     try:
-        df = pd.read_csv(csv_file)
+        df = read_results(csv_file)
     except FileNotFoundError:
         print(f"Error: File not found: {csv_file}")
         return
@@ -26,6 +74,9 @@ def analyze_results(csv_file):
     
     print(f"Loaded {len(df)} benchmark results from {csv_file}\n")
     
+    # Per-configuration statistics with speedup against the sequential run
+    stats = summarize(df, TASK_SCHEMA)
+    
     # Get unique values
     array_sizes = sorted(df['array_size'].unique())
     methods = sorted(df['method'].unique())
@@ -41,7 +92,7 @@ def analyze_results(csv_file):
         print(f"Array Size: {size:,}")
         print(f"{'='*80}\n")
         
-        size_df = df[df['array_size'] == size]
+        size_df = stats[stats['array_size'] == size]
         
         # Get sequential baseline
         seq_df = size_df[size_df['method'] == 'sequential']
@@ -70,8 +121,8 @@ def analyze_results(csv_file):
             for _, row in method_df.iterrows():
                 thread_count = row['num_threads']
                 time_ms = row['execution_time_ms']
-                speedup = seq_time / time_ms
-                efficiency = speedup / thread_count
+                speedup = row['speedup']
+                efficiency = row['efficiency']
                 
                 print(f"{thread_count:<10} {time_ms:<15.3f} {speedup:<12.3f} {efficiency:<12.3f}")
         
@@ -93,13 +144,13 @@ def analyze_results(csv_file):
             if len(builtin_df) > 0:
                 builtin_time = builtin_df['execution_time_ms'].values[0]
             
-            for method in ['builtin', 'atomic', 'critical', 'lock']:
+            for method in METHODS:
                 method_row = thread_df[thread_df['method'] == method]
                 if len(method_row) == 0:
                     continue
                 
                 time_ms = method_row['execution_time_ms'].values[0]
-                speedup = seq_time / time_ms
+                speedup = method_row['speedup'].values[0]
                 
                 if builtin_time and method != 'builtin':
                     vs_builtin = f"{time_ms / builtin_time:.2f}x slower"
@@ -115,11 +166,12 @@ def analyze_results(csv_file):
     
     for size in array_sizes:
         print(f"\nArray Size: {size:,}")
-        size_df = df[df['array_size'] == size]
-        seq_time = size_df[size_df['method'] == 'sequential']['execution_time_ms'].values[0]
+        size_df = stats[stats['array_size'] == size]
+        if len(size_df) == 0:
+            continue
         
         # Find best configuration for each method
-        for method in ['builtin', 'atomic', 'critical', 'lock']:
+        for method in METHODS:
             method_df = size_df[size_df['method'] == method]
             if len(method_df) == 0:
                 continue
@@ -127,11 +179,14 @@ def analyze_results(csv_file):
             best_row = method_df.loc[method_df['execution_time_ms'].idxmin()]
             best_threads = int(best_row['num_threads'])
             best_time = best_row['execution_time_ms']
-            best_speedup = seq_time / best_time
+            best_speedup = best_row['speedup']
             
             print(f"  {method:<12} - Best: {best_threads:3d} threads, "
                   f"{best_time:8.3f} ms, speedup: {best_speedup:6.3f}x")
     
+    print_phase_split(stats)
+    print_placement_summary(stats, 'num_threads')
+    
     print("\n" + "="*80)
     print("Analysis complete!")
     print("="*80)
@@ -4,15 +4,25 @@ Graph generation script for Task 7: Reduction with Different Synchronization Met
 Creates visualizations of benchmark results
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
 import sys
 import os
 from pathlib import Path
 
-# Set style
-plt.style.use('seaborn-v0_8-darkgrid')
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from benchkit.lazy import lazy_import
+from benchkit.placement import plot_placement_speedup
+from benchkit.render import Job, combinations, parse_options, per_placement, render, select
+from analyze import read_results
+
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+
+def set_style(plt):
+    plt.style.use('seaborn-v0_8-darkgrid')
+
+plt = lazy_import('matplotlib.pyplot', setup=set_style)
+
+METHODS = ['builtin', 'atomic', 'critical', 'lock', 'tree', 'relaxed']
 
 def find_latest_results(results_dir):
     """Find the most recent benchmark results file"""
@@ -29,7 +39,7 @@ def find_latest_results(results_dir):
 def plot_execution_time(df, size, output_dir):
     """Plot execution time vs number of threads for each method"""
     size_df = df[df['array_size'] == size]
-    methods = ['builtin', 'atomic', 'critical', 'lock']
+    methods = METHODS
     
     plt.figure(figsize=(12, 8))
     
@@ -60,7 +70,7 @@ def plot_execution_time(df, size, output_dir):
 def plot_speedup(df, size, output_dir):
     """Plot speedup vs number of threads for each method"""
     size_df = df[df['array_size'] == size]
-    methods = ['builtin', 'atomic', 'critical', 'lock']
+    methods = METHODS
     
     # Get sequential baseline
     seq_time = size_df[size_df['method'] == 'sequential']['execution_time_ms'].values[0]
@@ -97,7 +107,7 @@ def plot_speedup(df, size, output_dir):
 def plot_efficiency(df, size, output_dir):
     """Plot efficiency vs number of threads for each method"""
     size_df = df[df['array_size'] == size]
-    methods = ['builtin', 'atomic', 'critical', 'lock']
+    methods = METHODS
     
     # Get sequential baseline
     seq_time = size_df[size_df['method'] == 'sequential']['execution_time_ms'].values[0]
@@ -134,7 +144,7 @@ def plot_efficiency(df, size, output_dir):
 
 def plot_method_comparison(df, output_dir):
     """Compare all methods across different array sizes and thread counts"""
-    methods = ['builtin', 'atomic', 'critical', 'lock']
+    methods = METHODS
     sizes = sorted(df['array_size'].unique())
     
     fig, axes = plt.subplots(1, len(sizes), figsize=(6*len(sizes), 6))
@@ -176,7 +186,7 @@ def plot_method_comparison(df, output_dir):
 def plot_overhead_analysis(df, output_dir):
     """Analyze synchronization overhead by comparing with builtin reduction"""
     sizes = sorted(df['array_size'].unique())
-    methods = ['atomic', 'critical', 'lock']
+    methods = [m for m in METHODS if m != 'builtin']
     
     fig, axes = plt.subplots(1, len(sizes), figsize=(6*len(sizes), 6))
     if len(sizes) == 1:
@@ -216,10 +226,46 @@ def plot_overhead_analysis(df, output_dir):
     print(f"Created: {output_file}")
     plt.close()
 
+def plot_phase_split(df, size, output_dir):
+    """Stacked local-sum and combine time per thread count for tree and relaxed"""
+    size_df = df[(df['array_size'] == size) & df['combine_ms'].notna()]
+    methods = [m for m in ['tree', 'relaxed'] if m in set(size_df['method'])]
+    if len(methods) == 0:
+        return
+    
+    fig, axes = plt.subplots(1, len(methods), figsize=(7 * len(methods), 6), squeeze=False)
+    
+    for ax, method in zip(axes[0], methods):
+        phases = (size_df[size_df['method'] == method]
+                  .groupby('num_threads')[['local_ms', 'combine_ms']].mean())
+        x = np.arange(len(phases))
+        ax.bar(x, phases['local_ms'], label='Local sums', color='steelblue')
+        ax.bar(x, phases['combine_ms'], bottom=phases['local_ms'], label='Combine', color='darkorange')
+        ax.set_xticks(x)
+        ax.set_xticklabels([str(t) for t in phases.index])
+        ax.set_xlabel('Number of Threads', fontsize=11)
+        ax.set_ylabel('Time (ms)', fontsize=11)
+        ax.set_title(method.capitalize(), fontsize=12, fontweight='bold')
+        ax.legend(fontsize=9)
+        ax.grid(True, alpha=0.3, axis='y')
+    
+    plt.suptitle(f'Local Sum vs Combine Time (Array Size: {size:,})', fontsize=14, fontweight='bold', y=1.02)
+    plt.tight_layout()
+    output_file = output_dir / f'phase_split_size_{size}.png'
+    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    print(f"Created: {output_file}")
+    plt.close()
+
+def plot_placement(df, output_dir):
+    """Speedup by placement policy; this script reads raw runs, so summarize first"""
+    from benchkit import summarize
+    from analyze import TASK_SCHEMA
+    plot_placement_speedup(summarize(df, TASK_SCHEMA), output_dir, 'num_threads')
+
 def generate_summary_table(df, output_dir):
     """Generate a summary table of results"""
     sizes = sorted(df['array_size'].unique())
-    methods = ['builtin', 'atomic', 'critical', 'lock']
+    methods = METHODS
     
     output_file = output_dir / 'summary_table.txt'
     
@@ -275,6 +321,8 @@ def generate_summary_table(df, output_dir):
     print(f"Created: {output_file}")
 
 def main():
+    options = parse_options()
+    
     # Determine project root
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
@@ -297,33 +345,43 @@ def main():
     
     # Read data
     try:
-        df = pd.read_csv(csv_file)
+        df = read_results(csv_file)
     except Exception as e:
         print(f"Error reading CSV file: {e}")
         sys.exit(1)
     
     print(f"Loaded {len(df)} benchmark results\n")
     
-    # Get unique array sizes
-    sizes = sorted(df['array_size'].unique())
-    
-    print("Generating graphs...\n")
-    
-    # Generate graphs for each array size
-    for size in sizes:
-        print(f"Processing array size: {size:,}")
-        plot_execution_time(df, size, graphs_dir)
-        plot_speedup(df, size, graphs_dir)
-        plot_efficiency(df, size, graphs_dir)
-    
-    # Generate comparison graphs
-    print("\nGenerating comparison graphs...")
-    plot_method_comparison(df, graphs_dir)
-    plot_overhead_analysis(df, graphs_dir)
-    
-    # Generate summary table
-    print("\nGenerating summary table...")
-    generate_summary_table(df, graphs_dir)
+    print(f"Generating graphs (jobs: {options.jobs})...\n")
+    
+    # Everything but the placement comparison is drawn once per placement policy
+    def policy_jobs(directory, where):
+        figures = []
+        # Graphs for each array size
+        for (size,) in combinations(select(df, where), ['array_size']):
+            size_where = {**where, 'array_size': size}
+            figures += [
+                Job(plot_execution_time, size, directory, where=size_where,
+                    title=f"Processing array size: {size:,}"),
+                Job(plot_speedup, size, directory, where=size_where),
+                Job(plot_efficiency, size, directory, where=size_where),
+                Job(plot_phase_split, size, directory, where=size_where),
+            ]
+        return figures + [
+            # Comparison graphs
+            Job(plot_method_comparison, directory, where=where,
+                title="\nGenerating comparison graphs..."),
+            Job(plot_overhead_analysis, directory, where=where),
+            
+            # Summary table
+            Job(generate_summary_table, directory, where=where,
+                title="\nGenerating summary table..."),
+        ]
+    
+    render([
+        *per_placement(df, graphs_dir, policy_jobs),
+        Job(plot_placement, graphs_dir),
+    ], df, options, graphs_dir)
     
     print("\n" + "="*80)
     print("Graph generation complete!")
@@ -1,13 +1,19 @@
 #include <iostream>
 #include <vector>
-#include <random>
+#include <algorithm>
 #include <chrono>
 #include <cmath>
 #include <iomanip>
 #include <fstream>
 #include <string>
+#include <atomic>
 #include <omp.h>
 
+#include "../../common/bench_numa.h"
+#include "../../common/bench_rng.h"
+#include "../../common/bench_runs.h"
+#include "../../common/bench_sweep.hpp"
+
 using namespace std;
 
 struct BenchmarkResult {
@@ -16,18 +22,46 @@ struct BenchmarkResult {
     int array_size;
     double execution_time_ms;
     double result;
+    int runs_used;
+    double ci_low_ms;
+    double ci_high_ms;
+    bool has_phases;        // tree and relaxed time their two phases
+    double local_ms;        // mean time until the last thread's local sum was done
+    double combine_ms;      // mean time from there until the total was ready
 };
 
-void initialize_array(vector<double>& arr, int seed = 42) {
-    mt19937 gen(seed);
-    uniform_real_distribution<double> dist(0.0, 100.0);
-    
-    for (size_t i = 0; i < arr.size(); ++i) {
-        arr[i] = dist(gen);
+// Phase split of one run: local sums, then combining the per-thread partials
+struct PhaseTimes {
+    double local_ms;
+    double combine_ms;
+};
+
+// One thread's partial sum and the time its local phase ended. Slots are 64
+// bytes apart, so no two threads' values share a cache line whatever the
+// alignment of the array.
+const int SLOT_BYTES = 64;
+
+struct PaddedSlot {
+    double value;
+    double local_end;
+    char pad[SLOT_BYTES - 2 * sizeof(double)];
+};
+
+void record_phases(const vector<PaddedSlot>& slots, int team, double start, double end,
+                   PhaseTimes* phases) {
+    double local_end = start;
+    for (int t = 0; t < team; ++t) {
+        local_end = max(local_end, slots[t].local_end);
     }
+    phases->local_ms = (local_end - start) * 1000.0;
+    phases->combine_ms = (end - local_end) * 1000.0;
+}
+
+void initialize_array(first_touch_vector<double>& arr, int num_threads, int seed = 42) {
+    rng_fill_uniform(arr.data(), arr.size(), seed, 0.0, 100.0, num_threads);
 }
 
-double reduction_sequential(const vector<double>& arr) {
+double reduction_sequential(const first_touch_vector<double>& arr) {
     double sum = 0.0;
     
     for (size_t i = 0; i < arr.size(); ++i) {
@@ -37,7 +71,7 @@ double reduction_sequential(const vector<double>& arr) {
     return sum;
 }
 
-double reduction_builtin(const vector<double>& arr, int num_threads) {
+double reduction_builtin(const first_touch_vector<double>& arr, int num_threads) {
     double sum = 0.0;
     
     omp_set_num_threads(num_threads);
@@ -50,7 +84,7 @@ double reduction_builtin(const vector<double>& arr, int num_threads) {
     return sum;
 }
 
-double reduction_atomic(const vector<double>& arr, int num_threads) {
+double reduction_atomic(const first_touch_vector<double>& arr, int num_threads) {
     double sum = 0.0;
     
     omp_set_num_threads(num_threads);
@@ -71,7 +105,7 @@ double reduction_atomic(const vector<double>& arr, int num_threads) {
     return sum;
 }
 
-double reduction_critical(const vector<double>& arr, int num_threads) {
+double reduction_critical(const first_touch_vector<double>& arr, int num_threads) {
     double sum = 0.0;
     
     omp_set_num_threads(num_threads);
@@ -94,7 +128,7 @@ double reduction_critical(const vector<double>& arr, int num_threads) {
     return sum;
 }
 
-double reduction_lock(const vector<double>& arr, int num_threads) {
+double reduction_lock(const first_touch_vector<double>& arr, int num_threads) {
     double sum = 0.0;
     omp_lock_t lock;
     omp_init_lock(&lock);
@@ -119,18 +153,99 @@ double reduction_lock(const vector<double>& arr, int num_threads) {
     return sum;
 }
 
+// Per-thread partials in padded slots, combined pairwise in log2(threads)
+// levels: at level k, thread t (a multiple of 2^(k+1)) adds slot t + 2^k
+double reduction_tree(const first_touch_vector<double>& arr, int num_threads, PhaseTimes* phases) {
+    vector<PaddedSlot> slots(num_threads);
+    int team = 1;
+    
+    omp_set_num_threads(num_threads);
+    
+    double start = omp_get_wtime();
+    #pragma omp parallel
+    {
+        const int tid = omp_get_thread_num();
+        double local_sum = 0.0;
+        
+        #pragma omp for nowait
+        for (size_t i = 0; i < arr.size(); ++i) {
+            local_sum += arr[i];
+        }
+        
+        slots[tid].value = local_sum;
+        slots[tid].local_end = omp_get_wtime();
+        
+        #pragma omp single
+        team = omp_get_num_threads();
+        
+        for (int stride = 1; stride < team; stride *= 2) {
+            if (tid % (2 * stride) == 0 && tid + stride < team) {
+                slots[tid].value += slots[tid + stride].value;
+            }
+            #pragma omp barrier
+        }
+    }
+    double end = omp_get_wtime();
+    
+    record_phases(slots, team, start, end, phases);
+    return slots[0].value;
+}
 
-BenchmarkResult run_benchmark(const string& method, const vector<double>& arr, 
-                              int num_threads, int runs) {
+// Per-thread partials added to one std::atomic<double> with a relaxed
+// compare-exchange loop, instead of an OpenMP atomic / critical / lock
+double reduction_relaxed(const first_touch_vector<double>& arr, int num_threads, PhaseTimes* phases) {
+    std::atomic<double> sum(0.0);
+    vector<PaddedSlot> slots(num_threads);
+    int team = 1;
+    
+    omp_set_num_threads(num_threads);
+    
+    double start = omp_get_wtime();
+    #pragma omp parallel
+    {
+        const int tid = omp_get_thread_num();
+        double local_sum = 0.0;
+        
+        #pragma omp for nowait
+        for (size_t i = 0; i < arr.size(); ++i) {
+            local_sum += arr[i];
+        }
+        
+        slots[tid].local_end = omp_get_wtime();
+        if (tid == 0) {
+            team = omp_get_num_threads();
+        }
+        
+        double expected = sum.load(std::memory_order_relaxed);
+        while (!sum.compare_exchange_weak(expected, expected + local_sum,
+                                          std::memory_order_relaxed,
+                                          std::memory_order_relaxed)) {
+        }
+    }
+    double end = omp_get_wtime();
+    
+    record_phases(slots, team, start, end, phases);
+    return sum.load(std::memory_order_relaxed);
+}
+
+BenchmarkResult run_benchmark(const string& method, const first_touch_vector<double>& arr, 
+                              int num_threads, const run_plan& plan) {
     BenchmarkResult result;
     result.method = method;
     result.num_threads = num_threads;
     result.array_size = arr.size();
+    result.has_phases = (method == "tree" || method == "relaxed");
     
     double total_time = 0.0;
     double final_result = 0.0;
+    double total_local_ms = 0.0;
+    double total_combine_ms = 0.0;
+    PhaseTimes phases = {0.0, 0.0};
+    
+    run_series series;
+    run_series_init(&series, &plan);
     
-    for (int run = 0; run < runs; ++run) {
+    while (!run_series_done(&series)) {
         auto start = chrono::high_resolution_clock::now();
         
         if (method == "sequential") {
@@ -143,15 +258,28 @@ BenchmarkResult run_benchmark(const string& method, const vector<double>& arr,
             final_result = reduction_critical(arr, num_threads);
         } else if (method == "lock") {
             final_result = reduction_lock(arr, num_threads);
+        } else if (method == "tree") {
+            final_result = reduction_tree(arr, num_threads, &phases);
+        } else if (method == "relaxed") {
+            final_result = reduction_relaxed(arr, num_threads, &phases);
         }
         
         auto end = chrono::high_resolution_clock::now();
         chrono::duration<double, milli> duration = end - start;
         total_time += duration.count();
+        total_local_ms += phases.local_ms;
+        total_combine_ms += phases.combine_ms;
+        run_series_add(&series, duration.count());
     }
     
-    result.execution_time_ms = total_time / runs;
+    result.execution_time_ms = total_time / series.count;
+    result.local_ms = total_local_ms / series.count;
+    result.combine_ms = total_combine_ms / series.count;
     result.result = final_result;
+    result.runs_used = series.count;
+    result.ci_low_ms = series.ci_low;
+    result.ci_high_ms = series.ci_high;
+    run_series_free(&series);
     
     return result;
 }
@@ -160,8 +288,8 @@ BenchmarkResult run_benchmark(const string& method, const vector<double>& arr,
 bool verify_correctness(int array_size) {
     cout << "\n=== Correctness Verification ===" << endl;
     
-    vector<double> arr(array_size);
-    initialize_array(arr);
+    first_touch_vector<double> arr(array_size);
+    initialize_array(arr, omp_get_max_threads());
     
     double sequential_result = reduction_sequential(arr);
     cout << "Sequential result: " << fixed << setprecision(6) << sequential_result << endl;
@@ -214,28 +342,90 @@ bool verify_correctness(int array_size) {
         cout << "  ✓ PASSED" << endl;
     }
     
+    // Test tree and relaxed, also with a thread count that is not a power of two
+    PhaseTimes phases;
+    for (int threads : {num_threads, 3}) {
+        double tree_result = reduction_tree(arr, threads, &phases);
+        double tree_error = abs(tree_result - sequential_result);
+        cout << "Tree result (" << threads << "): " << fixed << tree_result
+             << " (error: " << scientific << tree_error << ")" << endl;
+        if (tree_error > tolerance) {
+            cout << "  ✗ FAILED" << endl;
+            all_passed = false;
+        } else {
+            cout << "  ✓ PASSED" << endl;
+        }
+        
+        double relaxed_result = reduction_relaxed(arr, threads, &phases);
+        double relaxed_error = abs(relaxed_result - sequential_result);
+        cout << "Relaxed result (" << threads << "): " << fixed << relaxed_result
+             << " (error: " << scientific << relaxed_error << ")" << endl;
+        if (relaxed_error > tolerance) {
+            cout << "  ✗ FAILED" << endl;
+            all_passed = false;
+        } else {
+            cout << "  ✓ PASSED" << endl;
+        }
+    }
+    
     cout << fixed;
     return all_passed;
 }
 
+void save_result(const string& output_file, const BenchmarkResult& result) {
+    ofstream file;
+    bool file_exists = ifstream(output_file).good();
+    file.open(output_file, ios::app);
+    
+    if (!file_exists) {
+        // Write header
+        file << "array_size,num_threads,method,execution_time_ms,result,runs_used,ci_low_ms,ci_high_ms,placement,local_ms,combine_ms" << endl;
+    }
+    
+    file << result.array_size << ","
+         << result.num_threads << ","
+         << result.method << ","
+         << fixed << setprecision(6) << result.execution_time_ms << ","
+         << result.result << ","
+         << result.runs_used << ","
+         << result.ci_low_ms << ","
+         << result.ci_high_ms << "," << numa_placement() << ",";
+    if (result.has_phases) {
+        file << result.local_ms << "," << result.combine_ms;
+    } else {
+        file << ",";
+    }
+    file << endl;
+    
+    file.close();
+}
+
 void print_usage(const char* program_name) {
     cout << "Usage: " << program_name << " <array_size> <num_threads> <method> <runs> [output_file]" << endl;
     cout << "\nParameters:" << endl;
     cout << "  array_size   - Size of the array (e.g., 1000000, 10000000, 100000000)" << endl;
     cout << "  num_threads  - Number of OpenMP threads (1, 2, 4, 8, 16, 32, 64, 128)" << endl;
-    cout << "  method       - Synchronization method: sequential, builtin, atomic, critical, lock" << endl;
-    cout << "  runs         - Number of runs for averaging" << endl;
+    cout << "  method       - Synchronization method: sequential, builtin, atomic, critical, lock," << endl;
+    cout << "                 tree, relaxed" << endl;
+    cout << "  runs         - Number of runs, or auto[:min[:max[:width]]] to repeat until the" << endl;
+    cout << "                 median's 95% CI is within width (e.g. auto:5:100:0.02)" << endl;
     cout << "  output_file  - (Optional) CSV file to save results" << endl;
+    cout << "\nnum_threads and method may be comma-separated lists: the array is then" << endl;
+    cout << "initialized once and every (method, threads) pair runs in the same process." << endl;
     cout << "\nMethods:" << endl;
     cout << "  sequential - Sequential execution (baseline)" << endl;
     cout << "  builtin    - OpenMP reduction clause (recommended)" << endl;
     cout << "  atomic     - Atomic operations (#pragma omp atomic)" << endl;
     cout << "  critical   - Critical sections (#pragma omp critical)" << endl;
     cout << "  lock       - Manual locks (omp_lock_t)" << endl;
+    cout << "  tree       - Cache-line padded per-thread slots, combined in a log-depth tree" << endl;
+    cout << "  relaxed    - Lock-free std::atomic<double> combine (relaxed compare-exchange)" << endl;
+    cout << "  (tree and relaxed also record local_ms and combine_ms, the two phases of a run)" << endl;
     cout << "\nExamples:" << endl;
     cout << "  " << program_name << " 10000000 4 builtin 10" << endl;
     cout << "  " << program_name << " 10000000 8 atomic 10 results.csv" << endl;
     cout << "  " << program_name << " 100000000 16 critical 5" << endl;
+    cout << "  " << program_name << " 100000000 1,2,4,8 builtin,atomic,critical 10 results.csv" << endl;
 }
 
 int main(int argc, char* argv[]) {
@@ -260,67 +450,77 @@ int main(int argc, char* argv[]) {
     
     // Parse arguments
     int array_size = atoi(argv[1]);
-    int num_threads = atoi(argv[2]);
-    string method = argv[3];
-    int runs = atoi(argv[4]);
     string output_file = (argc >= 6) ? argv[5] : "";
+    vector<int> thread_counts;
+    vector<string> methods;
+    run_plan plan;
     
     // Validate arguments
-    if (array_size <= 0 || num_threads <= 0 || runs <= 0) {
+    try {
+        thread_counts = parse_int_list(argv[2]);
+        methods = parse_list(argv[3]);
+    } catch (const exception& e) {
+        cerr << "Error: Invalid arguments: " << e.what() << endl;
+        return 1;
+    }
+    if (array_size <= 0 || run_plan_parse(argv[4], &plan) != 0) {
         cerr << "Error: Invalid arguments" << endl;
         return 1;
     }
     
-    if (method != "sequential" && method != "builtin" && method != "atomic" && 
-        method != "critical" && method != "lock") {
-        cerr << "Error: Invalid method. Must be: sequential, builtin, atomic, critical, or lock" << endl;
+    if (numa_setup() != 0) {
         return 1;
     }
     
+    for (const auto& method : methods) {
+        if (method != "sequential" && method != "builtin" && method != "atomic" && 
+            method != "critical" && method != "lock" && method != "tree" && method != "relaxed") {
+            cerr << "Error: Invalid method. Must be: sequential, builtin, atomic, critical, lock, tree, or relaxed" << endl;
+            return 1;
+        }
+    }
+    
     // Print configuration
     cout << "=== Reduction Operations with Different Synchronization Methods ===" << endl;
     cout << "Array size:     " << array_size << endl;
-    cout << "Threads:        " << num_threads << endl;
-    cout << "Method:         " << method << endl;
-    cout << "Runs:           " << runs << endl;
+    cout << "Threads:        " << argv[2] << endl;
+    cout << "Method:         " << argv[3] << endl;
+    cout << "Runs:           " << argv[4] << endl;
     cout << "OpenMP threads: " << omp_get_max_threads() << " available" << endl;
     cout << "\n=== Initializing Array ===" << endl;
     
-    // Initialize array
-    vector<double> arr(array_size);
-    initialize_array(arr);
+    // Initialize array once for every (method, threads) pair, in parallel
+    // with the widest configuration's threads so its pages are first
+    // touched by the threads that reduce them
+    first_touch_vector<double> arr(array_size);
+    initialize_array(arr, *max_element(thread_counts.begin(), thread_counts.end()));
     cout << "Array initialized with " << array_size << " random values" << endl;
     
-    cout << "\n=== Running Benchmark ===" << endl;
-    
-    // Run benchmark
-    BenchmarkResult result = run_benchmark(method, arr, num_threads, runs);
-    
-    // Print results
-    cout << "\n=== Results ===" << endl;
-    cout << "Average execution time: " << fixed << setprecision(3) 
-         << result.execution_time_ms << " ms" << endl;
-    cout << "Result value: " << setprecision(6) << result.result << endl;
-    
-    // Save to file if specified
-    if (!output_file.empty()) {
-        ofstream file;
-        bool file_exists = ifstream(output_file).good();
-        file.open(output_file, ios::app);
-        
-        if (!file_exists) {
-            // Write header
-            file << "array_size,num_threads,method,execution_time_ms,result" << endl;
+    for (const auto& method : methods) {
+        for (int num_threads : thread_counts) {
+            cout << "\n=== Running Benchmark: " << method << ", " << num_threads << " threads ===" << endl;
+            
+            // Run benchmark
+            BenchmarkResult result = run_benchmark(method, arr, num_threads, plan);
+            
+            // Print results
+            cout << "\n=== Results ===" << endl;
+            cout << "Average execution time: " << fixed << setprecision(3) 
+                 << result.execution_time_ms << " ms" << endl;
+            cout << "Result value: " << setprecision(6) << result.result << endl;
+            cout << "Runs used: " << result.runs_used << " (median 95% CI: " << setprecision(3)
+                 << result.ci_low_ms << " - " << result.ci_high_ms << " ms)" << endl;
+            if (result.has_phases) {
+                cout << "Local sums: " << result.local_ms << " ms, combine: "
+                     << result.combine_ms << " ms" << endl;
+            }
+            
+            // Save to file if specified
+            if (!output_file.empty()) {
+                save_result(output_file, result);
+                cout << "\nResults saved to: " << output_file << endl;
+            }
         }
-        
-        file << array_size << ","
-             << num_threads << ","
-             << method << ","
-             << fixed << setprecision(6) << result.execution_time_ms << ","
-             << result.result << endl;
-        
-        file.close();
-        cout << "\nResults saved to: " << output_file << endl;
     }
     
     return 0;
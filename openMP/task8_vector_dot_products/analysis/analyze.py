@@ -3,9 +3,16 @@
 Анализ результатов бенчмарков для задачи 8: Vector Dot Products with Sections
 """
 
-import pandas as pd
 import sys
 import os
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from benchkit import Schema, summarize
+from benchkit.lazy import lazy_import
+from benchkit.placement import print_placement_summary
+
+pd = lazy_import('pandas')
 
 def load_data(csv_file):
     """Загрузка данных из CSV файла"""
@@ -17,43 +24,29 @@ def load_data(csv_file):
         print(f"✗ Error loading data: {e}")
         sys.exit(1)
 
+TASK_SCHEMA = Schema(
+    keys=['num_pairs', 'vector_size', 'num_threads', 'method'],
+    time='total_time_ms',
+    baseline={'method': 'sequential'},
+    baseline_on=['num_pairs', 'vector_size'],
+    names={'mean': 'total_time_ms', 'std': 'total_time_std', 'median': 'total_time_median',
+           'min': 'total_time_min', 'max': 'total_time_max', 'count': 'runs'},
+    extra={
+        'input_time_ms': ('input_time_ms', 'mean'),
+        'computation_time_ms': ('computation_time_ms', 'mean'),
+    },
+    efficiency_scale=100.0,
+)
+
 def calculate_metrics(df):
-    """Расчет метрик производительности"""
-    
-    # Получаем базовое время (sequential с 1 потоком)
-    baseline = df[df['method'] == 'sequential'].copy()
-    
-    results = []
-    
-    for (num_pairs, vector_size), group in df.groupby(['num_pairs', 'vector_size']):
-        # Базовое время для этой конфигурации
-        base_time = baseline[
-            (baseline['num_pairs'] == num_pairs) & 
-            (baseline['vector_size'] == vector_size)
-        ]['total_time_ms'].values
-        
-        if len(base_time) == 0:
-            continue
-            
-        base_time = base_time[0]
-        
-        for _, row in group.iterrows():
-            speedup = base_time / row['total_time_ms'] if row['total_time_ms'] > 0 else 0
-            efficiency = (speedup / row['num_threads']) * 100 if row['num_threads'] > 0 else 0
-            
-            results.append({
-                'num_pairs': num_pairs,
-                'vector_size': vector_size,
-                'num_threads': row['num_threads'],
-                'method': row['method'],
-                'total_time_ms': row['total_time_ms'],
-                'input_time_ms': row['input_time_ms'],
-                'computation_time_ms': row['computation_time_ms'],
-                'speedup': speedup,
-                'efficiency': efficiency
-            })
-    
-    return pd.DataFrame(results)
+    """Расчет метрик производительности относительно sequential
+
+    Одна строка на конфигурацию (num_pairs, vector_size, num_threads, method,
+    placement): total_time_ms и времена фаз - средние по запускам, плюс
+    total_time_std/median/min/max и runs. Раньше _processed.csv повторял
+    входные строки; при одном запуске на конфигурацию значения совпадают.
+    """
+    return summarize(df, TASK_SCHEMA)
 
 def print_summary(df):
     """Вывод сводной информации"""
@@ -146,6 +139,7 @@ def main():
     
     # Вывод результатов
     print_summary(df_processed)
+    print_placement_summary(df_processed, 'num_threads')
     
     # Сохранение обработанных данных
     output_file = save_processed_data(df_processed, csv_file)
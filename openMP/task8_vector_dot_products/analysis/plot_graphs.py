@@ -3,12 +3,19 @@
 Генерация графиков для задачи 8: Vector Dot Products with Sections
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
 import sys
 import os
 import glob
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from benchkit.lazy import lazy_import
+from benchkit.placement import plot_placement_speedup
+from benchkit.render import Job, parse_options, per_placement, render, split
+
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+plt = lazy_import('matplotlib.pyplot')
 
 def find_latest_processed_file():
     """Поиск последнего обработанного файла результатов"""
@@ -243,6 +250,8 @@ def create_summary_table(df, output_dir):
     print(f"  ✓ Created summary_table.txt")
 
 def main():
+    options = parse_options()
+    
     # Определяем директории
     script_dir = os.path.dirname(os.path.abspath(__file__))
     project_dir = os.path.dirname(script_dir)
@@ -264,13 +273,24 @@ def main():
     df = load_data(csv_file)
     
     # Генерируем графики
-    print("Generating graphs...")
-    plot_execution_time(df, graphs_dir)
-    plot_speedup(df, graphs_dir)
-    plot_efficiency(df, graphs_dir)
-    plot_time_breakdown(df, graphs_dir)
-    plot_sections_limitation(df, graphs_dir)
-    create_summary_table(df, graphs_dir)
+    print(f"Generating graphs (jobs: {options.jobs})...")
+    configs = ['num_pairs', 'vector_size']
+    
+    # Все графики, кроме сравнения размещений, строятся для каждой политики отдельно
+    def policy_jobs(directory, where):
+        return [
+            *split(df, plot_execution_time, configs, directory, where=where),
+            *split(df, plot_speedup, configs, directory, where=where),
+            *split(df, plot_efficiency, configs, directory, where=where),
+            Job(plot_time_breakdown, directory, where=where),
+            Job(plot_sections_limitation, directory, where=where),
+            Job(create_summary_table, directory, where=where),
+        ]
+    
+    render([
+        *per_placement(df, graphs_dir, policy_jobs),
+        Job(plot_placement_speedup, graphs_dir, 'num_threads'),
+    ], df, options, graphs_dir)
     
     print(f"\n✓ All graphs saved to: {graphs_dir}")
     print("\nGenerated files:")
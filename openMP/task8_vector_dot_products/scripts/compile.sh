@@ -44,7 +44,7 @@ case "$OS" in
         for version in 14 13 12 11; do
             if command -v g++-$version &> /dev/null; then
                 COMPILER="g++-$version"
-                CXXFLAGS="-std=c++11 -O3 -fopenmp -Wall -Wextra"
+                CXXFLAGS="-std=c++17 -O3 -fopenmp -Wall -Wextra"
                 if check_openmp "$COMPILER" "$CXXFLAGS"; then
                     break
                 fi
@@ -62,7 +62,7 @@ case "$OS" in
                 fi
                 
                 COMPILER="clang++"
-                CXXFLAGS="-std=c++11 -O3 -Xclang -fopenmp -Wall -Wextra -I${LIBOMP_PATH}/include -L${LIBOMP_PATH}/lib -lomp"
+                CXXFLAGS="-std=c++17 -O3 -Xclang -fopenmp -Wall -Wextra -I${LIBOMP_PATH}/include -L${LIBOMP_PATH}/lib -lomp"
                 
                 if ! check_openmp "$COMPILER" "$CXXFLAGS"; then
                     exit 1
@@ -76,7 +76,7 @@ case "$OS" in
     Linux*)
         if command -v g++ &> /dev/null; then
             COMPILER="g++"
-            CXXFLAGS="-std=c++11 -O3 -fopenmp -Wall -Wextra"
+            CXXFLAGS="-std=c++17 -O3 -fopenmp -Wall -Wextra"
             if ! check_openmp "$COMPILER" "$CXXFLAGS"; then
                 exit 1
             fi
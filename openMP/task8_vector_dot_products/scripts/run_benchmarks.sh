@@ -17,7 +17,13 @@ OUTPUT_FILE="results/benchmark_${TIMESTAMP}.csv"
 SIZES=(1000000 10000000 100000000)
 THREADS=(1 2 4 8 16 32 64 128)
 METHODS=("reduction" "no-reduction")
-RUNS=10
+# Fixed count, or adaptive: RUNS=auto[:min[:max[:width]]] ./run_benchmarks.sh
+RUNS=${RUNS:-10}
+# Placement, recorded in every row: BENCH_NUMA=first-touch|interleave,
+# threads pinned with OMP_PROC_BIND/OMP_PLACES (read once at program start)
+export BENCH_NUMA=${BENCH_NUMA:-first-touch}
+export OMP_PROC_BIND=${OMP_PROC_BIND:-spread}
+export OMP_PLACES=${OMP_PLACES:-cores}
 
 echo "vector_size,num_threads,method,iteration,execution_time_ms,result_value" > "$OUTPUT_FILE"
 
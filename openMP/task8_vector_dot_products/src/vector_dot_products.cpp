@@ -8,14 +8,36 @@
 #include <cmath>
 #include <queue>
 #include <atomic>
+#include <mutex>
+#include <condition_variable>
+#include <thread>
+#include <future>
+#if __has_include(<charconv>)
+#include <charconv>
+#endif
+#include <cstring>
+#include <climits>
+#include <cstdint>
+#include <fcntl.h>
+#include <unistd.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
 #include <omp.h>
 
+#include "../../common/bench_numa.h"
+#include "../../common/bench_runs.h"
+
 using namespace std;
 
+// Пара векторов: либо собственные данные (текстовый формат), либо
+// указатели в отображённый бинарный файл (span1/span2, без копирования)
 struct VectorPair {
     vector<double> vec1;
     vector<double> vec2;
     int id;
+    const double* span1 = nullptr;
+    const double* span2 = nullptr;
+    size_t span_size = 0;
 };
 
 struct DotProductResult {
@@ -32,6 +54,15 @@ struct BenchmarkResult {
     double total_time_ms;
     double input_time_ms;
     double computation_time_ms;
+    string input_format;
+    long long input_bytes;          // размер входного файла, для MB/s ввода
+    int queue_depth;                // pipeline: ёмкость очереди
+    double reader_utilization;      // pipeline: доля времени чтения без ожидания очереди
+    double worker_utilization;      // pipeline: доля времени вычислений у всех рабочих потоков
+    int num_workers;                // pipeline: рабочие потоки в выделенной команде (0 - считал читатель)
+    int runs_used;
+    double ci_low_ms;
+    double ci_high_ms;
     vector<DotProductResult> results;
 };
 
@@ -42,7 +73,9 @@ private:
     omp_lock_t lock;
     
 public:
-    ThreadSafeQueue() {
+    // Ёмкость не используется (очередь не ограничена); параметр нужен,
+    // чтобы очереди в sections создавались одинаково
+    explicit ThreadSafeQueue(size_t = 0) {
         omp_init_lock(&lock);
     }
     
@@ -83,6 +116,654 @@ public:
     }
 };
 
+// Кольцевой буфер без блокировок для одного производителя и одного
+// потребителя. Ёмкость округляется вверх до степени двойки; head и tail
+// разнесены по разным кэш-линиям. Элементы перемещаются, а не копируются.
+template<class T>
+class SpscRing {
+private:
+    vector<T> slots;
+    size_t mask;
+    char pad0[64];
+    atomic<size_t> head;    // следующий элемент для pop (пишет потребитель)
+    char pad1[64];
+    atomic<size_t> tail;    // следующий свободный слот (пишет производитель)
+    char pad2[64];
+    
+public:
+    explicit SpscRing(size_t capacity) : head(0), tail(0) {
+        size_t size = 2;
+        while (size < capacity) {
+            size *= 2;
+        }
+        slots.resize(size);
+        mask = size - 1;
+    }
+    
+    // item перемещается только при успехе
+    bool try_push(T&& item) {
+        size_t t = tail.load(memory_order_relaxed);
+        if (t - head.load(memory_order_acquire) == slots.size()) {
+            return false;
+        }
+        slots[t & mask] = std::move(item);
+        tail.store(t + 1, memory_order_release);
+        return true;
+    }
+    
+    bool try_pop(T& item) {
+        size_t h = head.load(memory_order_relaxed);
+        if (h == tail.load(memory_order_acquire)) {
+            return false;
+        }
+        item = std::move(slots[h & mask]);
+        head.store(h + 1, memory_order_release);
+        return true;
+    }
+    
+    bool empty() const {
+        return head.load(memory_order_acquire) == tail.load(memory_order_acquire);
+    }
+};
+
+// Ограниченная очередь без блокировок для многих производителей и
+// потребителей (схема Вьюкова): у каждой ячейки свой счётчик sequence,
+// позиции занимаются через compare_exchange.
+template<class T>
+class MpmcRing {
+private:
+    struct Cell {
+        atomic<size_t> sequence;
+        T data;
+    };
+    
+    vector<Cell> cells;
+    size_t mask;
+    char pad0[64];
+    atomic<size_t> enqueue_pos;
+    char pad1[64];
+    atomic<size_t> dequeue_pos;
+    char pad2[64];
+    
+public:
+    explicit MpmcRing(size_t capacity) : enqueue_pos(0), dequeue_pos(0) {
+        size_t size = 2;
+        while (size < capacity) {
+            size *= 2;
+        }
+        vector<Cell>(size).swap(cells);
+        mask = size - 1;
+        for (size_t i = 0; i < size; ++i) {
+            cells[i].sequence.store(i, memory_order_relaxed);
+        }
+    }
+    
+    bool try_push(T&& item) {
+        size_t pos = enqueue_pos.load(memory_order_relaxed);
+        Cell* cell;
+        while (true) {
+            cell = &cells[pos & mask];
+            size_t seq = cell->sequence.load(memory_order_acquire);
+            intptr_t diff = (intptr_t)seq - (intptr_t)pos;
+            if (diff == 0) {
+                if (enqueue_pos.compare_exchange_weak(pos, pos + 1, memory_order_relaxed)) {
+                    break;
+                }
+            } else if (diff < 0) {
+                return false;   // полна
+            } else {
+                pos = enqueue_pos.load(memory_order_relaxed);
+            }
+        }
+        cell->data = std::move(item);
+        cell->sequence.store(pos + 1, memory_order_release);
+        return true;
+    }
+    
+    bool try_pop(T& item) {
+        size_t pos = dequeue_pos.load(memory_order_relaxed);
+        Cell* cell;
+        while (true) {
+            cell = &cells[pos & mask];
+            size_t seq = cell->sequence.load(memory_order_acquire);
+            intptr_t diff = (intptr_t)seq - (intptr_t)(pos + 1);
+            if (diff == 0) {
+                if (dequeue_pos.compare_exchange_weak(pos, pos + 1, memory_order_relaxed)) {
+                    break;
+                }
+            } else if (diff < 0) {
+                return false;   // пуста
+            } else {
+                pos = dequeue_pos.load(memory_order_relaxed);
+            }
+        }
+        item = std::move(cell->data);
+        cell->sequence.store(pos + mask + 1, memory_order_release);
+        return true;
+    }
+    
+    bool empty() const {
+        return dequeue_pos.load(memory_order_acquire) >= enqueue_pos.load(memory_order_acquire);
+    }
+};
+
+// MpmcRing с интерфейсом BoundedQueue (push / pop / close) для конвейера:
+// вместо condition_variable ожидание с std::this_thread::yield
+class SpinningMpmcQueue {
+private:
+    MpmcRing<VectorPair> ring;
+    atomic<bool> closed;
+    
+public:
+    explicit SpinningMpmcQueue(size_t capacity) : ring(capacity), closed(false) {}
+    
+    void push(VectorPair&& item) {
+        while (!ring.try_push(std::move(item))) {
+            this_thread::yield();
+        }
+    }
+    
+    bool pop(VectorPair& item) {
+        while (!ring.try_pop(item)) {
+            if (closed.load(memory_order_acquire)) {
+                // Все push были до close: повторная попытка видит остаток
+                return ring.try_pop(item);
+            }
+            this_thread::yield();
+        }
+        return true;
+    }
+    
+    void close() {
+        closed.store(true, memory_order_release);
+    }
+};
+
+// Постановка пары в очередь секции ввода. ThreadSafeQueue копирует пару,
+// как и раньше; кольцо перемещает её, ожидая свободный слот
+inline void enqueue(ThreadSafeQueue& q, VectorPair& pair) {
+    q.push(pair);
+}
+
+inline void enqueue(SpscRing<VectorPair>& q, VectorPair& pair) {
+    while (!q.try_push(std::move(pair))) {
+        this_thread::yield();
+    }
+}
+
+// Ограниченная блокирующая очередь для конвейера: push ждёт, пока есть
+// место (backpressure на чтение), pop ждёт данных или закрытия очереди.
+// Ожидание на condition_variable, без активного опроса.
+class BoundedQueue {
+private:
+    queue<VectorPair> q;
+    size_t capacity;
+    bool closed;
+    mutex m;
+    condition_variable not_empty;
+    condition_variable not_full;
+    
+public:
+    explicit BoundedQueue(size_t capacity) : capacity(capacity > 0 ? capacity : 1), closed(false) {}
+    
+    void push(VectorPair&& item) {
+        unique_lock<mutex> guard(m);
+        not_full.wait(guard, [this] { return q.size() < capacity; });
+        q.push(std::move(item));
+        guard.unlock();
+        not_empty.notify_one();
+    }
+    
+    // false, если очередь закрыта и пуста
+    bool pop(VectorPair& item) {
+        unique_lock<mutex> guard(m);
+        not_empty.wait(guard, [this] { return !q.empty() || closed; });
+        if (q.empty()) {
+            return false;
+        }
+        item = std::move(q.front());
+        q.pop();
+        guard.unlock();
+        not_full.notify_one();
+        return true;
+    }
+    
+    void close() {
+        {
+            lock_guard<mutex> guard(m);
+            closed = true;
+        }
+        not_empty.notify_all();
+    }
+};
+
+const int DEFAULT_QUEUE_DEPTH = 8;
+
+// Бинарный формат: заголовок BinaryHeader, затем для каждой пары vec1 и vec2
+// подряд, little-endian double. Данные начинаются со смещения 24 (кратно 8),
+// поэтому отображённый файл читается напрямую как массив double.
+const char BINARY_MAGIC[8] = {'V', 'D', 'P', 'B', 'I', 'N', '0', '1'};
+
+struct BinaryHeader {
+    char magic[8];
+    int64_t num_pairs;
+    int64_t vector_size;
+};
+
+inline bool host_is_little_endian() {
+    const uint16_t probe = 1;
+    unsigned char first;
+    memcpy(&first, &probe, 1);
+    return first == 1;
+}
+
+bool is_binary_file(const string& filename) {
+    ifstream file(filename, ios::binary);
+    char magic[sizeof(BINARY_MAGIC)] = {0};
+    file.read(magic, sizeof(magic));
+    return file.gcount() == sizeof(magic) && memcmp(magic, BINARY_MAGIC, sizeof(magic)) == 0;
+}
+
+// Бинарный файл, отображённый в память только для чтения. vec1(p) / vec2(p)
+// указывают прямо в отображение; на Linux страницы подгружаются сразу
+// (MAP_POPULATE), чтобы стоимость чтения попадала во время ввода.
+class MappedPairs {
+private:
+    void* base;
+    size_t length;
+    int64_t pairs;
+    int64_t size;
+    const double* values;
+    
+public:
+    MappedPairs() : base(MAP_FAILED), length(0), pairs(0), size(0), values(nullptr) {}
+    
+    ~MappedPairs() {
+        if (base != MAP_FAILED) {
+            munmap(base, length);
+        }
+    }
+    
+    MappedPairs(const MappedPairs&) = delete;
+    MappedPairs& operator=(const MappedPairs&) = delete;
+    
+    bool open(const string& filename) {
+        if (!host_is_little_endian()) {
+            cerr << "Error: Binary input is little-endian; use the text format on this host" << endl;
+            return false;
+        }
+        int fd = ::open(filename.c_str(), O_RDONLY);
+        if (fd < 0) {
+            cerr << "Error: Cannot open file " << filename << endl;
+            return false;
+        }
+        struct stat st;
+        if (fstat(fd, &st) != 0 || st.st_size < (off_t)sizeof(BinaryHeader)) {
+            cerr << "Error: " << filename << " is too short for a binary header" << endl;
+            ::close(fd);
+            return false;
+        }
+        length = st.st_size;
+        int flags = MAP_PRIVATE;
+#ifdef MAP_POPULATE
+        flags |= MAP_POPULATE;
+#endif
+        base = mmap(nullptr, length, PROT_READ, flags, fd, 0);
+        ::close(fd);
+        if (base == MAP_FAILED) {
+            cerr << "Error: Cannot map file " << filename << endl;
+            return false;
+        }
+        
+        // Размеры ограничены INT_MAX (индексы и поля int), а вместимость
+        // проверяется делением, чтобы произведение не переполнялось
+        BinaryHeader header;
+        memcpy(&header, base, sizeof(header));
+        uint64_t capacity = (length - sizeof(header)) / sizeof(double) / 2;
+        if (memcmp(header.magic, BINARY_MAGIC, sizeof(BINARY_MAGIC)) != 0 ||
+            header.num_pairs < 0 || header.vector_size < 0 ||
+            header.num_pairs > INT_MAX || header.vector_size > INT_MAX ||
+            (header.num_pairs > 0 &&
+             (uint64_t)header.vector_size > capacity / (uint64_t)header.num_pairs)) {
+            cerr << "Error: " << filename << " is not a complete binary vector file" << endl;
+            return false;
+        }
+        pairs = header.num_pairs;
+        size = header.vector_size;
+        values = reinterpret_cast<const double*>(static_cast<const char*>(base) + sizeof(header));
+        return true;
+    }
+    
+    int num_pairs() const { return static_cast<int>(pairs); }
+    int vector_size() const { return static_cast<int>(size); }
+    const double* vec1(int p) const { return values + 2 * size * p; }
+    const double* vec2(int p) const { return values + 2 * size * p + size; }
+    
+    // Пара без копирования данных
+    VectorPair pair(int p) const {
+        VectorPair result;
+        result.id = p;
+        result.span1 = vec1(p);
+        result.span2 = vec2(p);
+        result.span_size = size;
+        return result;
+    }
+};
+
+// Те же значения, что и generate_test_data (тот же srand/rand), но в
+// бинарном формате, поэтому результаты совпадают для обоих форматов
+void generate_binary_data(const string& filename, int num_pairs, int vector_size) {
+    ofstream file(filename, ios::binary);
+    if (!file.is_open()) {
+        cerr << "Error: Cannot create file " << filename << endl;
+        return;
+    }
+    if (!host_is_little_endian()) {
+        cerr << "Error: Binary output is little-endian; use generate on this host" << endl;
+        return;
+    }
+    
+    BinaryHeader header;
+    memcpy(header.magic, BINARY_MAGIC, sizeof(BINARY_MAGIC));
+    header.num_pairs = num_pairs;
+    header.vector_size = vector_size;
+    file.write(reinterpret_cast<const char*>(&header), sizeof(header));
+    
+    srand(42);
+    vector<double> row(vector_size);
+    for (int p = 0; p < 2 * num_pairs; ++p) {
+        for (int i = 0; i < vector_size; ++i) {
+            row[i] = (rand() % 1000) / 10.0;
+        }
+        file.write(reinterpret_cast<const char*>(row.data()), row.size() * sizeof(double));
+    }
+    
+    file.close();
+    cout << "Generated binary test data: " << filename << endl;
+    cout << "  Pairs: " << num_pairs << ", Vector size: " << vector_size << endl;
+}
+
+// Чтение одной пары из текстового файла; false, если файл оборвался или
+// встретилось не число
+bool read_text_pair(istream& file, int id, int vector_size, VectorPair& pair) {
+    pair.id = id;
+    pair.vec1.resize(vector_size);
+    pair.vec2.resize(vector_size);
+    
+    for (int i = 0; i < vector_size; ++i) {
+        file >> pair.vec1[i];
+    }
+    for (int i = 0; i < vector_size; ++i) {
+        file >> pair.vec2[i];
+    }
+    return !file.fail();
+}
+
+// Бэкенд чтения текстового формата: operator>> у ifstream или блочный
+// разбор ChunkedTextReader (переменная окружения BENCH_TEXT_READER)
+enum class TextReader { STREAM, CHUNKED };
+
+const size_t TEXT_BLOCK_BYTES = 1 << 20;
+const size_t TEXT_CARRY_BYTES = 256;    // максимальная длина числа на границе блоков
+
+inline bool is_text_space(char c) {
+    return c == ' ' || c == '\n' || c == '\t' || c == '\r';
+}
+
+ssize_t pread_full(int fd, char* dst, size_t count, off_t offset) {
+    size_t done = 0;
+    while (done < count) {
+        ssize_t n = pread(fd, dst + done, count - done, offset + done);
+        if (n < 0) {
+            return -1;
+        }
+        if (n == 0) {
+            break;
+        }
+        done += n;
+    }
+    return done;
+}
+
+// Текстовый формат блоками по TEXT_BLOCK_BYTES в два чередующихся буфера:
+// пока разбирается один, следующий блок читается pread в фоне (std::async).
+// Числа разбираются std::from_chars (strtod, если стандартная библиотека не
+// поддерживает from_chars для double); число, разрезанное границей блока,
+// переносится в начало следующего буфера, перед прочитанными данными.
+class ChunkedTextReader {
+private:
+    int fd;
+    off_t offset;               // смещение следующего блока в файле
+    vector<char> buffers[2];    // TEXT_CARRY_BYTES + блок + завершающий '\0'
+    int current;
+    future<ssize_t> pending;    // загрузка другого буфера
+    const char* pos;
+    const char* end;
+    bool eof;
+    bool failed;
+    
+    char* block(int b) { return buffers[b].data() + TEXT_CARRY_BYTES; }
+    
+    void start_load(int b) {
+        char* dst = block(b);
+        int file = fd;
+        off_t at = offset;
+        offset += TEXT_BLOCK_BYTES;
+        pending = async(launch::async, [file, dst, at] {
+            return pread_full(file, dst, TEXT_BLOCK_BYTES, at);
+        });
+    }
+    
+    // Переход на другой буфер с переносом неразобранного хвоста [pos, end)
+    bool advance() {
+        size_t carry = end - pos;
+        ssize_t n = pending.get();
+        if (n < 0 || carry > TEXT_CARRY_BYTES) {
+            failed = true;
+            return false;
+        }
+        int next = 1 - current;
+        char* dst = block(next);
+        memcpy(dst - carry, pos, carry);
+        dst[n] = '\0';
+        eof = (size_t)n < TEXT_BLOCK_BYTES;
+        current = next;
+        pos = dst - carry;
+        end = dst + n;
+        if (!eof) {
+            start_load(1 - current);
+        }
+        return pos < end;
+    }
+    
+public:
+    ChunkedTextReader() : fd(-1), offset(0), current(0), pos(nullptr), end(nullptr),
+                          eof(true), failed(false) {}
+    
+    ~ChunkedTextReader() {
+        if (pending.valid()) {
+            pending.wait();
+        }
+        if (fd >= 0) {
+            ::close(fd);
+        }
+    }
+    
+    ChunkedTextReader(const ChunkedTextReader&) = delete;
+    ChunkedTextReader& operator=(const ChunkedTextReader&) = delete;
+    
+    bool open(const string& filename) {
+        fd = ::open(filename.c_str(), O_RDONLY);
+        if (fd < 0) {
+            return false;
+        }
+        for (int b = 0; b < 2; ++b) {
+            buffers[b].assign(TEXT_CARRY_BYTES + TEXT_BLOCK_BYTES + 1, '\0');
+        }
+        current = 0;
+        pos = end = block(0);
+        eof = false;
+        start_load(1);
+        return true;
+    }
+    
+    bool next_double(double& value) {
+        while (true) {
+            while (pos < end && is_text_space(*pos)) {
+                ++pos;
+            }
+            if (pos == end) {
+                if (eof || !advance()) {
+                    return false;
+                }
+                continue;
+            }
+            const char* token_end = pos;
+            while (token_end < end && !is_text_space(*token_end)) {
+                ++token_end;
+            }
+            if (token_end == end && !eof) {
+                if (!advance()) {
+                    return false;
+                }
+                continue;
+            }
+#if defined(__cpp_lib_to_chars) && __cpp_lib_to_chars >= 201611L
+            from_chars_result parsed = from_chars(pos, token_end, value);
+            if (parsed.ec != errc() || parsed.ptr != token_end) {
+                failed = true;
+                return false;
+            }
+#else
+            char* parsed_end;
+            value = strtod(pos, &parsed_end);
+            if (parsed_end != token_end) {
+                failed = true;
+                return false;
+            }
+#endif
+            pos = token_end;
+            return true;
+        }
+    }
+    
+    bool ok() const { return !failed; }
+};
+
+// Целое неотрицательное значение заголовка, разобранное как double
+bool header_count(double value, int& count) {
+    if (!(value >= 0.0 && value <= INT_MAX) || value != floor(value)) {
+        return false;
+    }
+    count = static_cast<int>(value);
+    return true;
+}
+
+// Текстовый вход через выбранный бэкенд. Ошибки open, read_header и read_pair
+// выводятся здесь же, как у MappedPairs::open
+class TextInput {
+private:
+    TextReader reader;
+    string name;
+    ifstream stream;
+    ChunkedTextReader chunked;
+    
+    bool fail(const string& what) {
+        bool malformed = (reader == TextReader::CHUNKED) ? !chunked.ok() : !stream.eof();
+        cerr << "Error: " << name << ": " << what
+             << (malformed ? " is malformed or unreadable" : " is truncated") << endl;
+        return false;
+    }
+    
+public:
+    bool open(const string& filename, TextReader text_reader) {
+        reader = text_reader;
+        name = filename;
+        bool opened;
+        if (reader == TextReader::CHUNKED) {
+            opened = chunked.open(filename);
+        } else {
+            stream.open(filename);
+            opened = stream.is_open();
+        }
+        if (!opened) {
+            cerr << "Error: Cannot open file " << filename << endl;
+        }
+        return opened;
+    }
+    
+    bool read_header(int& num_pairs, int& vector_size) {
+        if (reader == TextReader::STREAM) {
+            if (!(stream >> num_pairs >> vector_size) || num_pairs < 0 || vector_size < 0) {
+                return fail("header");
+            }
+            return true;
+        }
+        double np = 0.0, vs = 0.0;
+        if (!chunked.next_double(np) || !chunked.next_double(vs)) {
+            return fail("header");
+        }
+        if (!header_count(np, num_pairs) || !header_count(vs, vector_size)) {
+            cerr << "Error: " << name << ": header counts must be non-negative integers" << endl;
+            return false;
+        }
+        return true;
+    }
+    
+    bool read_pair(int id, int vector_size, VectorPair& pair) {
+        if (reader == TextReader::STREAM) {
+            return read_text_pair(stream, id, vector_size, pair)
+                || fail("pair " + to_string(id));
+        }
+        pair.id = id;
+        pair.vec1.resize(vector_size);
+        pair.vec2.resize(vector_size);
+        for (int i = 0; i < vector_size; ++i) {
+            if (!chunked.next_double(pair.vec1[i])) {
+                return fail("pair " + to_string(id));
+            }
+        }
+        for (int i = 0; i < vector_size; ++i) {
+            if (!chunked.next_double(pair.vec2[i])) {
+                return fail("pair " + to_string(id));
+            }
+        }
+        return true;
+    }
+};
+
+long long file_bytes(const string& filename) {
+    struct stat st;
+    return stat(filename.c_str(), &st) == 0 ? (long long)st.st_size : 0;
+}
+
+string input_format_name(bool binary, TextReader text_reader) {
+    if (binary) {
+        return "binary";
+    }
+    return text_reader == TextReader::CHUNKED ? "text-chunked" : "text";
+}
+
+// Бэкенд текстового ввода из BENCH_TEXT_READER (stream по умолчанию)
+int text_reader_setup(TextReader* reader) {
+    const char* value = getenv("BENCH_TEXT_READER");
+    *reader = TextReader::STREAM;
+    if (value == nullptr || strcmp(value, "") == 0 || strcmp(value, "stream") == 0) {
+        return 0;
+    }
+    if (strcmp(value, "chunked") == 0) {
+        *reader = TextReader::CHUNKED;
+        return 0;
+    }
+    cerr << "Error: Invalid BENCH_TEXT_READER '" << value << "' (stream or chunked)" << endl;
+    return -1;
+}
+
+// Скорость ввода, MB/s (размер файла на время ввода)
+double input_rate(const BenchmarkResult& result) {
+    return result.input_time_ms > 0.0 ? result.input_bytes / 1e3 / result.input_time_ms : 0.0;
+}
+
 void generate_test_data(const string& filename, int num_pairs, int vector_size) {
     ofstream file(filename);
     if (!file.is_open()) {
@@ -113,13 +794,13 @@ void generate_test_data(const string& filename, int num_pairs, int vector_size)
 }
 
 // Вычисление скалярного произведения с утяжелением для демонстрации
-double compute_dot_product(const vector<double>& vec1, const vector<double>& vec2) {
+double compute_dot_product(const double* vec1, const double* vec2, size_t size) {
     double result = 0.0;
     
     // Утяжеление вычислений для демонстрации эффекта параллелизма
     for (int repeat = 0; repeat < 100; ++repeat) {
         double temp = 0.0;
-        for (size_t i = 0; i < vec1.size(); ++i) {
+        for (size_t i = 0; i < size; ++i) {
             temp += vec1[i] * vec2[i];
         }
         result = temp;
@@ -128,43 +809,68 @@ double compute_dot_product(const vector<double>& vec1, const vector<double>& vec
     return result;
 }
 
+double compute_dot_product(const vector<double>& vec1, const vector<double>& vec2) {
+    return compute_dot_product(vec1.data(), vec2.data(), vec1.size());
+}
+
+double compute_dot_product(const VectorPair& pair) {
+    if (pair.span1) {
+        return compute_dot_product(pair.span1, pair.span2, pair.span_size);
+    }
+    return compute_dot_product(pair.vec1, pair.vec2);
+}
+
 // Последовательный метод для сравнения
-BenchmarkResult sequential_method(const string& filename, int runs) {
-    BenchmarkResult bench_result;
+BenchmarkResult sequential_method(const string& filename, const run_plan& plan,
+                                  TextReader text_reader = TextReader::STREAM) {
+    BenchmarkResult bench_result = BenchmarkResult();
     bench_result.method = "sequential";
     bench_result.num_threads = 1;
+    const bool binary = is_binary_file(filename);
+    bench_result.input_format = input_format_name(binary, text_reader);
+    bench_result.input_bytes = file_bytes(filename);
     
     double total_input_time = 0.0;
     double total_computation_time = 0.0;
     vector<DotProductResult> final_results;
     
-    for (int run = 0; run < runs; ++run) {
+    run_series series;
+    run_series_init(&series, &plan);
+    
+    while (!run_series_done(&series)) {
         // Фаза 1: Чтение всех данных
         auto input_start = chrono::high_resolution_clock::now();
         
-        ifstream file(filename);
-        if (!file.is_open()) {
-            cerr << "Error: Cannot open file " << filename << endl;
-            return bench_result;
-        }
-        
-        int num_pairs, vector_size;
-        file >> num_pairs >> vector_size;
+        int num_pairs = 0, vector_size = 0;
+        vector<VectorPair> pairs;
+        MappedPairs mapped;
         
-        vector<VectorPair> pairs(num_pairs);
-        for (int p = 0; p < num_pairs; ++p) {
-            pairs[p].id = p;
-            pairs[p].vec1.resize(vector_size);
-            pairs[p].vec2.resize(vector_size);
-            
-            for (int i = 0; i < vector_size; ++i) {
-                file >> pairs[p].vec1[i];
+        if (binary) {
+            if (!mapped.open(filename)) {
+                run_series_free(&series);
+                return bench_result;
             }
-            for (int i = 0; i < vector_size; ++i) {
-                file >> pairs[p].vec2[i];
+            num_pairs = mapped.num_pairs();
+            vector_size = mapped.vector_size();
+            pairs.reserve(num_pairs);
+            for (int p = 0; p < num_pairs; ++p) {
+                pairs.push_back(mapped.pair(p));
+            }
+        } else {
+            TextInput file;
+            if (!file.open(filename, text_reader) || !file.read_header(num_pairs, vector_size)) {
+                run_series_free(&series);
+                return bench_result;
+            }
+            
+            pairs.resize(num_pairs);
+            for (int p = 0; p < num_pairs; ++p) {
+                if (!file.read_pair(p, vector_size, pairs[p])) {
+                    run_series_free(&series);
+                    return bench_result;
+                }
             }
         }
-        file.close();
         
         auto input_end = chrono::high_resolution_clock::now();
         chrono::duration<double, milli> input_duration = input_end - input_start;
@@ -176,7 +882,7 @@ BenchmarkResult sequential_method(const string& filename, int runs) {
         vector<DotProductResult> results(num_pairs);
         for (int p = 0; p < num_pairs; ++p) {
             auto dot_start = chrono::high_resolution_clock::now();
-            double dot_product = compute_dot_product(pairs[p].vec1, pairs[p].vec2);
+            double dot_product = compute_dot_product(pairs[p]);
             auto dot_end = chrono::high_resolution_clock::now();
             
             results[p].pair_id = p;
@@ -188,27 +894,40 @@ BenchmarkResult sequential_method(const string& filename, int runs) {
         auto comp_end = chrono::high_resolution_clock::now();
         chrono::duration<double, milli> comp_duration = comp_end - comp_start;
         total_computation_time += comp_duration.count();
+        run_series_add(&series, input_duration.count() + comp_duration.count());
         
-        if (run == runs - 1) {
+        {
             final_results = results;
             bench_result.num_pairs = num_pairs;
             bench_result.vector_size = vector_size;
         }
     }
     
-    bench_result.input_time_ms = total_input_time / runs;
-    bench_result.computation_time_ms = total_computation_time / runs;
+    bench_result.input_time_ms = total_input_time / series.count;
+    bench_result.computation_time_ms = total_computation_time / series.count;
     bench_result.total_time_ms = bench_result.input_time_ms + bench_result.computation_time_ms;
+    bench_result.runs_used = series.count;
+    bench_result.ci_low_ms = series.ci_low;
+    bench_result.ci_high_ms = series.ci_high;
     bench_result.results = final_results;
+    run_series_free(&series);
     
     return bench_result;
 }
 
 // Параллельный метод с использованием sections
-BenchmarkResult sections_method(const string& filename, int num_threads, int runs) {
-    BenchmarkResult bench_result;
-    bench_result.method = "sections";
+// Queue: ThreadSafeQueue (sections) или SpscRing<VectorPair> (sections-spsc);
+// кольцо создаётся на num_pairs слотов, поэтому ввод не ждёт, как и с
+// неограниченной ThreadSafeQueue
+template<class Queue>
+BenchmarkResult run_sections(const string& filename, int num_threads, const run_plan& plan,
+                             const string& method, TextReader text_reader) {
+    BenchmarkResult bench_result = BenchmarkResult();
+    bench_result.method = method;
     bench_result.num_threads = num_threads;
+    const bool binary = is_binary_file(filename);
+    bench_result.input_format = input_format_name(binary, text_reader);
+    bench_result.input_bytes = file_bytes(filename);
     
     omp_set_num_threads(num_threads);
     
@@ -217,20 +936,40 @@ BenchmarkResult sections_method(const string& filename, int num_threads, int run
     double total_computation_time = 0.0;
     vector<DotProductResult> final_results;
     
-    for (int run = 0; run < runs; ++run) {
+    run_series series;
+    run_series_init(&series, &plan);
+    
+    while (!run_series_done(&series)) {
         auto total_start = chrono::high_resolution_clock::now();
+        double map_time = 0.0;
         
         // Читаем метаданные
         int num_pairs = 0;
         int vector_size = 0;
-        {
-            ifstream meta_file(filename);
-            meta_file >> num_pairs >> vector_size;
-            meta_file.close();
+        MappedPairs mapped;
+        if (binary) {
+            // Отображение открывается здесь, а секция ввода только раздаёт
+            // указатели на пары; время отображения входит во время ввода
+            auto map_start = chrono::high_resolution_clock::now();
+            if (!mapped.open(filename)) {
+                run_series_free(&series);
+                return bench_result;
+            }
+            map_time = chrono::duration<double, milli>(
+                chrono::high_resolution_clock::now() - map_start).count();
+            num_pairs = mapped.num_pairs();
+            vector_size = mapped.vector_size();
+        } else {
+            TextInput meta_file;
+            if (!meta_file.open(filename, TextReader::STREAM) ||
+                !meta_file.read_header(num_pairs, vector_size)) {
+                run_series_free(&series);
+                return bench_result;
+            }
         }
         
         // Потокобезопасная очередь для передачи данных между секциями
-        ThreadSafeQueue work_queue;
+        Queue work_queue(num_pairs);
         
         // Результаты вычислений
         vector<DotProductResult> results(num_pairs);
@@ -238,12 +977,13 @@ BenchmarkResult sections_method(const string& filename, int num_threads, int run
         // Атомарные флаги для синхронизации
         atomic<bool> input_done(false);
         atomic<int> processed_count(0);
+        bool input_failed = false;
         
         // Время выполнения секций
         double input_time = 0.0;
         double computation_time = 0.0;
         
-        #pragma omp parallel sections shared(work_queue, results, input_done, processed_count, input_time, computation_time)
+        #pragma omp parallel sections shared(work_queue, results, input_done, processed_count, input_failed, input_time, computation_time)
         {
             // ============================================
             // СЕКЦИЯ 1: ЗАДАЧА ВВОДА - чтение векторов из файла
@@ -252,36 +992,37 @@ BenchmarkResult sections_method(const string& filename, int num_threads, int run
             {
                 auto section_start = chrono::high_resolution_clock::now();
                 
-                ifstream file(filename);
-                int np, vs;
-                file >> np >> vs;
+                if (binary) {
+                    for (int p = 0; p < num_pairs; ++p) {
+                        VectorPair pair = mapped.pair(p);
+                        enqueue(work_queue, pair);
+                    }
+                }
+                
+                TextInput file;
+                int np = 0, vs = 0;
+                if (!binary && !(file.open(filename, text_reader) && file.read_header(np, vs))) {
+                    input_failed = true;
+                }
                 
                 for (int p = 0; p < np; ++p) {
                     VectorPair pair;
-                    pair.id = p;
-                    pair.vec1.resize(vs);
-                    pair.vec2.resize(vs);
-                    
-                    // Чтение первого вектора
-                    for (int i = 0; i < vs; ++i) {
-                        file >> pair.vec1[i];
-                    }
-                    // Чтение второго вектора
-                    for (int i = 0; i < vs; ++i) {
-                        file >> pair.vec2[i];
+                    if (!file.read_pair(p, vs, pair)) {
+                        // Вычисляющая секция выйдет, разобрав уже прочитанное
+                        input_failed = true;
+                        break;
                     }
                     
                     // Добавляем пару в очередь для обработки
-                    work_queue.push(pair);
+                    enqueue(work_queue, pair);
                 }
-                file.close();
                 
                 // Сигнализируем, что чтение завершено
                 input_done.store(true);
                 
                 auto section_end = chrono::high_resolution_clock::now();
                 chrono::duration<double, milli> duration = section_end - section_start;
-                input_time = duration.count();
+                input_time = map_time + duration.count();
             }
             
             // ============================================
@@ -298,7 +1039,7 @@ BenchmarkResult sections_method(const string& filename, int num_threads, int run
                     if (work_queue.try_pop(pair)) {
                         // Вычисляем скалярное произведение
                         auto dot_start = chrono::high_resolution_clock::now();
-                        double dot_product = compute_dot_product(pair.vec1, pair.vec2);
+                        double dot_product = compute_dot_product(pair);
                         auto dot_end = chrono::high_resolution_clock::now();
                         
                         // Сохраняем результат
@@ -326,33 +1067,333 @@ BenchmarkResult sections_method(const string& filename, int num_threads, int run
             }
         }
         
+        if (input_failed) {
+            run_series_free(&series);
+            return bench_result;
+        }
+        
         auto total_end = chrono::high_resolution_clock::now();
         chrono::duration<double, milli> total_duration = total_end - total_start;
         total_time += total_duration.count();
         total_input_time += input_time;
         total_computation_time += computation_time;
+        run_series_add(&series, total_duration.count());
         
-        if (run == runs - 1) {
+        {
             final_results = results;
             bench_result.num_pairs = num_pairs;
             bench_result.vector_size = vector_size;
         }
     }
     
-    bench_result.total_time_ms = total_time / runs;
-    bench_result.input_time_ms = total_input_time / runs;
-    bench_result.computation_time_ms = total_computation_time / runs;
+    bench_result.total_time_ms = total_time / series.count;
+    bench_result.input_time_ms = total_input_time / series.count;
+    bench_result.computation_time_ms = total_computation_time / series.count;
+    bench_result.runs_used = series.count;
+    bench_result.ci_low_ms = series.ci_low;
+    bench_result.ci_high_ms = series.ci_high;
     bench_result.results = final_results;
+    run_series_free(&series);
     
     return bench_result;
 }
 
+// Конвейер: поток 0 читает пары и кладёт их в ограниченную очередь,
+// остальные num_threads - 1 потоков вычисляют. Рабочие потоки спят на
+// condition_variable, пока очередь пуста; читатель спит, пока она полна.
+// С одним потоком рабочих нет, и читатель считает пары сам.
+// Queue: BoundedQueue (pipeline) или SpinningMpmcQueue (pipeline-mpmc)
+template<class Queue>
+BenchmarkResult run_pipeline(const string& filename, int num_threads, int queue_depth,
+                             const run_plan& plan, const string& method, TextReader text_reader) {
+    BenchmarkResult bench_result = BenchmarkResult();
+    bench_result.method = method;
+    bench_result.num_threads = max(1, num_threads);
+    bench_result.queue_depth = queue_depth;
+    const bool binary = is_binary_file(filename);
+    bench_result.input_format = input_format_name(binary, text_reader);
+    bench_result.input_bytes = file_bytes(filename);
+    
+    double total_time = 0.0;
+    double total_input_time = 0.0;
+    double total_computation_time = 0.0;
+    double total_reader_utilization = 0.0;
+    double total_worker_utilization = 0.0;
+    vector<DotProductResult> final_results;
+    
+    run_series series;
+    run_series_init(&series, &plan);
+    
+    while (!run_series_done(&series)) {
+        auto total_start = chrono::high_resolution_clock::now();
+        
+        int num_pairs = 0;
+        int vector_size = 0;
+        MappedPairs mapped;
+        TextInput file;
+        if (binary) {
+            // Время отображения файла относится к стадии чтения
+            if (!mapped.open(filename)) {
+                run_series_free(&series);
+                return bench_result;
+            }
+            num_pairs = mapped.num_pairs();
+            vector_size = mapped.vector_size();
+        } else {
+            if (!file.open(filename, text_reader) || !file.read_header(num_pairs, vector_size)) {
+                run_series_free(&series);
+                return bench_result;
+            }
+        }
+        
+        Queue work_queue(queue_depth);
+        vector<DotProductResult> results(num_pairs);
+        
+        const double open_time = chrono::duration<double, milli>(
+            chrono::high_resolution_clock::now() - total_start).count();
+        double input_time = 0.0;        // стадия чтения, от открытия файла до закрытия очереди
+        double read_busy = open_time;   // из неё: чтение без ожидания места в очереди
+        double compute_time = 0.0;      // стадия вычислений, до выхода последнего рабочего
+        double compute_busy = 0.0;      // сумма времени вычислений всех рабочих
+        int workers = 0;
+        bool input_failed = false;
+        
+        #pragma omp parallel num_threads(bench_result.num_threads) reduction(+:compute_busy) reduction(max:compute_time)
+        {
+            const int tid = omp_get_thread_num();
+            const int team = omp_get_num_threads();
+            auto stage_start = chrono::high_resolution_clock::now();
+            
+            if (tid == 0) {
+                workers = team - 1;
+                for (int p = 0; p < num_pairs; ++p) {
+                    auto read_start = chrono::high_resolution_clock::now();
+                    VectorPair pair;
+                    if (binary) {
+                        pair = mapped.pair(p);
+                    } else if (!file.read_pair(p, vector_size, pair)) {
+                        // Закрытие очереди ниже отпускает рабочих
+                        input_failed = true;
+                        break;
+                    }
+                    read_busy += chrono::duration<double, milli>(
+                        chrono::high_resolution_clock::now() - read_start).count();
+                    
+                    if (team == 1) {
+                        // Без рабочих потоков читатель считает сам
+                        auto dot_start = chrono::high_resolution_clock::now();
+                        results[p].pair_id = p;
+                        results[p].result = compute_dot_product(pair);
+                        results[p].computation_time_ms = chrono::duration<double, milli>(
+                            chrono::high_resolution_clock::now() - dot_start).count();
+                        compute_busy += results[p].computation_time_ms;
+                    } else {
+                        work_queue.push(std::move(pair));
+                    }
+                }
+                work_queue.close();
+                input_time = open_time + chrono::duration<double, milli>(
+                    chrono::high_resolution_clock::now() - stage_start).count();
+            }
+            
+            if (tid != 0 || team == 1) {
+                VectorPair pair;
+                while (work_queue.pop(pair)) {
+                    auto dot_start = chrono::high_resolution_clock::now();
+                    double dot_product = compute_dot_product(pair);
+                    auto dot_end = chrono::high_resolution_clock::now();
+                    
+                    results[pair.id].pair_id = pair.id;
+                    results[pair.id].result = dot_product;
+                    chrono::duration<double, milli> dot_duration = dot_end - dot_start;
+                    results[pair.id].computation_time_ms = dot_duration.count();
+                    compute_busy += dot_duration.count();
+                }
+                compute_time = chrono::duration<double, milli>(
+                    chrono::high_resolution_clock::now() - stage_start).count();
+            }
+        }
+        
+        if (input_failed) {
+            run_series_free(&series);
+            return bench_result;
+        }
+        
+        auto total_end = chrono::high_resolution_clock::now();
+        chrono::duration<double, milli> total_duration = total_end - total_start;
+        total_time += total_duration.count();
+        total_input_time += input_time;
+        total_computation_time += compute_time;
+        total_reader_utilization += input_time > 0.0 ? read_busy / input_time : 0.0;
+        total_worker_utilization += compute_time > 0.0 ? compute_busy / (max(1, workers) * compute_time) : 0.0;
+        run_series_add(&series, total_duration.count());
+        
+        {
+            final_results = results;
+            bench_result.num_pairs = num_pairs;
+            bench_result.vector_size = vector_size;
+            bench_result.num_workers = workers;
+        }
+    }
+    
+    bench_result.total_time_ms = total_time / series.count;
+    bench_result.input_time_ms = total_input_time / series.count;
+    bench_result.computation_time_ms = total_computation_time / series.count;
+    bench_result.reader_utilization = total_reader_utilization / series.count;
+    bench_result.worker_utilization = total_worker_utilization / series.count;
+    bench_result.runs_used = series.count;
+    bench_result.ci_low_ms = series.ci_low;
+    bench_result.ci_high_ms = series.ci_high;
+    bench_result.results = final_results;
+    run_series_free(&series);
+    
+    return bench_result;
+}
+
+BenchmarkResult sections_method(const string& filename, int num_threads, const run_plan& plan,
+                                TextReader text_reader = TextReader::STREAM) {
+    return run_sections<ThreadSafeQueue>(filename, num_threads, plan, "sections", text_reader);
+}
+
+BenchmarkResult sections_spsc_method(const string& filename, int num_threads, const run_plan& plan,
+                                     TextReader text_reader = TextReader::STREAM) {
+    return run_sections<SpscRing<VectorPair>>(filename, num_threads, plan, "sections-spsc", text_reader);
+}
+
+BenchmarkResult pipeline_method(const string& filename, int num_threads, int queue_depth,
+                                const run_plan& plan, TextReader text_reader = TextReader::STREAM) {
+    return run_pipeline<BoundedQueue>(filename, num_threads, queue_depth, plan, "pipeline",
+                                      text_reader);
+}
+
+BenchmarkResult pipeline_mpmc_method(const string& filename, int num_threads, int queue_depth,
+                                     const run_plan& plan, TextReader text_reader = TextReader::STREAM) {
+    return run_pipeline<SpinningMpmcQueue>(filename, num_threads, queue_depth, plan, "pipeline-mpmc",
+                                           text_reader);
+}
+
+// ---- Микробенчмарк очередей ----------------------------------------------
+
+struct QueueBenchResult {
+    string queue;
+    int consumers;
+    double time_ms;
+    bool valid;
+};
+
+// Один производитель кладёт ops пар с векторами по vector_size элементов,
+// consumers потребителей забирают их; push/pop - операции над конкретной
+// очередью. Проверяется, что каждая пара получена ровно один раз (сумма id).
+template<class Push, class Pop, class Close>
+QueueBenchResult time_queue(const string& name, int consumers, int ops, int vector_size,
+                            Push push, Pop pop, Close close) {
+    atomic<long long> consumed(0);
+    long long id_sum = 0;
+    
+    auto start = chrono::high_resolution_clock::now();
+    #pragma omp parallel num_threads(consumers + 1) reduction(+:id_sum)
+    {
+        if (omp_get_thread_num() == 0) {
+            for (int p = 0; p < ops; ++p) {
+                VectorPair pair;
+                pair.id = p;
+                pair.vec1.assign(vector_size, 1.0);
+                pair.vec2.assign(vector_size, 2.0);
+                push(pair);
+            }
+            close();
+        } else {
+            VectorPair pair;
+            while (consumed.load(memory_order_relaxed) < ops) {
+                if (pop(pair)) {
+                    id_sum += pair.id;
+                    consumed.fetch_add(1, memory_order_relaxed);
+                } else {
+                    this_thread::yield();
+                }
+            }
+        }
+    }
+    auto end = chrono::high_resolution_clock::now();
+    
+    QueueBenchResult result;
+    result.queue = name;
+    result.consumers = consumers;
+    result.time_ms = chrono::duration<double, milli>(end - start).count();
+    result.valid = (id_sum == (long long)ops * (ops - 1) / 2);
+    return result;
+}
+
+void queue_benchmark(int ops, int vector_size, int consumers, int depth) {
+    cout << "=== Queue Microbenchmark ===" << endl;
+    cout << "Operations:  " << ops << " pairs (push + pop each)" << endl;
+    cout << "Vector size: " << vector_size << " (payload " << fixed << setprecision(1)
+         << 2.0 * vector_size * sizeof(double) / 1024.0 << " KiB per pair)" << endl;
+    cout << "Ring depth:  " << depth << endl;
+    
+    vector<QueueBenchResult> results;
+    vector<int> consumer_counts(1, 1);
+    if (consumers > 1) {
+        consumer_counts.push_back(consumers);
+    }
+    for (int c : consumer_counts) {
+        {
+            ThreadSafeQueue q;
+            results.push_back(time_queue("lock", c, ops, vector_size,
+                [&](VectorPair& pair) { q.push(pair); },
+                [&](VectorPair& pair) { return q.try_pop(pair); },
+                [] {}));
+        }
+        {
+            BoundedQueue q(depth);
+            results.push_back(time_queue("condvar", c, ops, vector_size,
+                [&](VectorPair& pair) { q.push(std::move(pair)); },
+                [&](VectorPair& pair) { return q.pop(pair); },
+                [&] { q.close(); }));
+        }
+        if (c == 1) {
+            SpscRing<VectorPair> q(depth);
+            results.push_back(time_queue("spsc", c, ops, vector_size,
+                [&](VectorPair& pair) { enqueue(q, pair); },
+                [&](VectorPair& pair) { return q.try_pop(pair); },
+                [] {}));
+        }
+        {
+            MpmcRing<VectorPair> q(depth);
+            results.push_back(time_queue("mpmc", c, ops, vector_size,
+                [&](VectorPair& pair) {
+                    while (!q.try_push(std::move(pair))) {
+                        this_thread::yield();
+                    }
+                },
+                [&](VectorPair& pair) { return q.try_pop(pair); },
+                [] {}));
+        }
+    }
+    
+    cout << "\n" << left << setw(12) << "Queue" << setw(12) << "Consumers"
+         << setw(14) << "Time (ms)" << setw(14) << "Mops/s" << setw(10) << "Check" << endl;
+    cout << string(62, '-') << endl;
+    for (const QueueBenchResult& r : results) {
+        cout << left << setw(12) << r.queue << setw(12) << r.consumers
+             << setw(14) << fixed << setprecision(2) << r.time_ms
+             << setw(14) << setprecision(3) << ops / r.time_ms / 1000.0
+             << setw(10) << (r.valid ? "✓" : "✗ LOST") << endl;
+    }
+}
+
 // Проверка корректности результатов
 bool verify_correctness(const string& filename) {
     cout << "\n=== Correctness Verification ===" << endl;
     
-    BenchmarkResult seq_result = sequential_method(filename, 1);
-    BenchmarkResult par_result = sections_method(filename, 2, 1);
+    run_plan single_run;
+    run_plan_parse("1", &single_run);
+    BenchmarkResult seq_result = sequential_method(filename, single_run);
+    BenchmarkResult par_result = sections_method(filename, 2, single_run);
+    if (seq_result.runs_used == 0 || par_result.runs_used == 0) {
+        cout << "\n✗ FAILED: cannot read " << filename << endl;
+        return false;
+    }
     
     cout << "Sequential results (first 5):" << endl;
     for (size_t i = 0; i < min(size_t(5), seq_result.results.size()); ++i) {
@@ -377,6 +1418,31 @@ bool verify_correctness(const string& filename) {
         }
     }
     
+    // Конвейеры с тремя рабочими и очередью на две пары (читатель упирается в неё),
+    // sections на кольце SPSC и блочный разбор текста
+    BenchmarkResult others[] = {
+        pipeline_method(filename, 4, 2, single_run),
+        pipeline_mpmc_method(filename, 4, 2, single_run),
+        sections_spsc_method(filename, 2, single_run),
+        sequential_method(filename, single_run, TextReader::CHUNKED),
+        sections_method(filename, 2, single_run, TextReader::CHUNKED),
+    };
+    for (const BenchmarkResult& other : others) {
+        if (other.runs_used == 0 || other.results.size() != seq_result.results.size()) {
+            cout << "\n✗ FAILED: " << other.method << " (" << other.input_format << ") returned " << other.results.size()
+                 << " results" << endl;
+            all_passed = false;
+        }
+        for (size_t i = 0; i < other.results.size() && i < seq_result.results.size(); ++i) {
+            double error = abs(seq_result.results[i].result - other.results[i].result);
+            if (error > tolerance) {
+                cout << "\n✗ FAILED: " << other.method << " (" << other.input_format << ") pair " << i
+                     << " mismatch (error: " << error << ")" << endl;
+                all_passed = false;
+            }
+        }
+    }
+    
     if (all_passed) {
         cout << "\n✓ PASSED: All results match!" << endl;
     }
@@ -384,42 +1450,70 @@ bool verify_correctness(const string& filename) {
     return all_passed;
 }
 
-// Полный бенчмарк с сравнением методов
-void full_benchmark(const string& filename, int runs) {
+// Полный бенчмарк с сравнением методов; false, если файл не удалось прочитать
+bool full_benchmark(const string& filename, const run_plan& plan, const string& other_file,
+                    TextReader text_reader) {
     cout << "\n" << string(60, '=') << endl;
     cout << "FULL BENCHMARK COMPARISON" << endl;
     cout << string(60, '=') << endl;
     
+    // Конвейер занимает все доступные потоки (до omp_set_num_threads в sections)
+    const int pipeline_threads = max(2, omp_get_max_threads());
+    
     // Последовательный метод
     cout << "\nRunning sequential method..." << endl;
-    BenchmarkResult seq = sequential_method(filename, runs);
+    BenchmarkResult seq = sequential_method(filename, plan, text_reader);
+    if (seq.runs_used == 0) {
+        return false;
+    }
     
     // Параллельный метод с 2 потоками (оптимально для 2 секций)
     cout << "Running parallel sections method (2 threads)..." << endl;
-    BenchmarkResult par = sections_method(filename, 2, runs);
+    BenchmarkResult par = sections_method(filename, 2, plan, text_reader);
+    
+    // Конвейер: один поток читает, остальные вычисляют
+    cout << "Running pipeline method (" << pipeline_threads << " threads)..." << endl;
+    BenchmarkResult pipe = pipeline_method(filename, pipeline_threads, DEFAULT_QUEUE_DEPTH, plan,
+                                           text_reader);
+    if (par.runs_used == 0 || pipe.runs_used == 0) {
+        return false;
+    }
     
     // Вывод результатов
     cout << "\n" << string(60, '-') << endl;
-    cout << "RESULTS (averaged over " << runs << " runs)" << endl;
+    cout << "RESULTS (averaged over " << seq.runs_used << " / " << par.runs_used << " runs)" << endl;
     cout << string(60, '-') << endl;
     
-    cout << "\nDataset: " << seq.num_pairs << " pairs, vector size " << seq.vector_size << endl;
+    cout << "\nDataset: " << seq.num_pairs << " pairs, vector size " << seq.vector_size
+         << " (" << seq.input_format << ")" << endl;
     
     cout << "\n" << left << setw(20) << "Method" 
          << setw(15) << "Total (ms)" 
          << setw(15) << "Input (ms)" 
-         << setw(15) << "Compute (ms)" << endl;
-    cout << string(60, '-') << endl;
+         << setw(15) << "Compute (ms)"
+         << setw(12) << "Input MB/s" << endl;
+    cout << string(77, '-') << endl;
     
     cout << left << setw(20) << "Sequential"
          << setw(15) << fixed << setprecision(2) << seq.total_time_ms
          << setw(15) << seq.input_time_ms
-         << setw(15) << seq.computation_time_ms << endl;
+         << setw(15) << seq.computation_time_ms
+         << setw(12) << input_rate(seq) << endl;
     
     cout << left << setw(20) << "Sections (2 thr)"
          << setw(15) << fixed << setprecision(2) << par.total_time_ms
          << setw(15) << par.input_time_ms
-         << setw(15) << par.computation_time_ms << endl;
+         << setw(15) << par.computation_time_ms
+         << setw(12) << input_rate(par) << endl;
+    
+    cout << left << setw(20) << ("Pipeline (" + to_string(pipe.num_threads) + " thr)")
+         << setw(15) << fixed << setprecision(2) << pipe.total_time_ms
+         << setw(15) << pipe.input_time_ms
+         << setw(15) << pipe.computation_time_ms
+         << setw(12) << input_rate(pipe) << endl;
+    cout << "\nPipeline utilization (queue depth " << pipe.queue_depth << "): reader "
+         << setprecision(1) << pipe.reader_utilization * 100.0 << "%, "
+         << "workers (" << pipe.num_workers << ") " << pipe.worker_utilization * 100.0 << "%" << endl;
     
     // Расчёт ускорения
     double speedup = seq.total_time_ms / par.total_time_ms;
@@ -431,6 +1525,10 @@ void full_benchmark(const string& filename, int runs) {
     cout << "Speedup:    " << fixed << setprecision(2) << speedup << "x" << endl;
     cout << "Efficiency: " << fixed << setprecision(1) << efficiency << "%" << endl;
     
+    double pipeline_speedup = seq.total_time_ms / pipe.total_time_ms;
+    cout << "Pipeline:   " << fixed << setprecision(2) << pipeline_speedup << "x ("
+         << setprecision(1) << pipeline_speedup / pipe.num_threads * 100.0 << "% efficiency)" << endl;
+    
     // Теоретическое ускорение
     double t_input = seq.input_time_ms;
     double t_compute = seq.computation_time_ms;
@@ -450,7 +1548,8 @@ void full_benchmark(const string& filename, int runs) {
     bool correct = true;
     const double tolerance = 1e-6;
     for (size_t i = 0; i < seq.results.size() && correct; ++i) {
-        double error = abs(seq.results[i].result - par.results[i].result);
+        double error = max(abs(seq.results[i].result - par.results[i].result),
+                           abs(seq.results[i].result - pipe.results[i].result));
         if (error > tolerance) {
             correct = false;
             cout << "✗ MISMATCH at pair " << i << endl;
@@ -460,6 +1559,75 @@ void full_benchmark(const string& filename, int runs) {
     if (correct) {
         cout << "✓ All " << seq.results.size() << " results match!" << endl;
     }
+    
+    // Текстовый файл: тот же последовательный метод с другим бэкендом чтения
+    if (seq.input_format != "binary") {
+        TextReader other_reader = (text_reader == TextReader::CHUNKED) ? TextReader::STREAM
+                                                                       : TextReader::CHUNKED;
+        cout << "\nRunning sequential method with the "
+             << input_format_name(false, other_reader) << " reader..." << endl;
+        BenchmarkResult alt = sequential_method(filename, plan, other_reader);
+        if (alt.runs_used == 0) {
+            return false;
+        }
+        
+        cout << "\n" << string(60, '-') << endl;
+        cout << "TEXT READER COMPARISON (sequential)" << endl;
+        cout << string(60, '-') << endl;
+        cout << left << setw(20) << "Reader"
+             << setw(15) << "Input (ms)"
+             << setw(15) << "Input MB/s" << endl;
+        for (const BenchmarkResult* r : {&seq, &alt}) {
+            cout << left << setw(20) << r->input_format
+                 << setw(15) << fixed << setprecision(2) << r->input_time_ms
+                 << setw(15) << input_rate(*r) << endl;
+        }
+        
+        bool same = alt.results.size() == seq.results.size();
+        for (size_t i = 0; i < seq.results.size() && same; ++i) {
+            same = abs(seq.results[i].result - alt.results[i].result) <= tolerance;
+        }
+        cout << (same ? "✓ Both readers give the same results" : "✗ MISMATCH between readers") << endl;
+    }
+    
+    // Тот же набор данных в другом формате: сравнение времени ввода
+    if (!other_file.empty()) {
+        cout << "\nRunning sequential method on " << other_file << "..." << endl;
+        BenchmarkResult other = sequential_method(other_file, plan, text_reader);
+        if (other.runs_used == 0) {
+            return false;
+        }
+        
+        cout << "\n" << string(60, '-') << endl;
+        cout << "INPUT FORMAT COMPARISON (sequential)" << endl;
+        cout << string(60, '-') << endl;
+        cout << left << setw(20) << "Format"
+             << setw(15) << "Input (ms)"
+             << setw(15) << "Compute (ms)"
+             << setw(15) << "Input MB/s"
+             << setw(15) << "Input share" << endl;
+        for (const BenchmarkResult* r : {&seq, &other}) {
+            cout << left << setw(20) << r->input_format
+                 << setw(15) << fixed << setprecision(2) << r->input_time_ms
+                 << setw(15) << r->computation_time_ms
+                 << setw(15) << input_rate(*r)
+                 << setprecision(1) << r->input_time_ms / r->total_time_ms * 100.0 << "%" << endl;
+        }
+        if (other.input_time_ms > 0.0 && seq.input_time_ms > 0.0) {
+            const BenchmarkResult& text = (seq.input_format != "binary") ? seq : other;
+            const BenchmarkResult& binary = (seq.input_format != "binary") ? other : seq;
+            cout << "Binary input is " << fixed << setprecision(1)
+                 << text.input_time_ms / binary.input_time_ms << "x faster than text" << endl;
+        }
+        
+        bool same = other.results.size() == seq.results.size();
+        for (size_t i = 0; i < seq.results.size() && same; ++i) {
+            same = abs(seq.results[i].result - other.results[i].result) <= tolerance;
+        }
+        cout << (same ? "✓ Both formats give the same results" : "✗ MISMATCH between formats") << endl;
+    }
+    
+    return true;
 }
 
 void print_usage(const char* program_name) {
@@ -467,17 +1635,41 @@ void print_usage(const char* program_name) {
     cout << "\nCommands:" << endl;
     cout << "  generate <num_pairs> <vector_size> <output_file>" << endl;
     cout << "    Generate test data file with vector pairs" << endl;
-    cout << "\n  benchmark <data_file> <num_threads> <method> <runs>" << endl;
+    cout << "\n  generate-binary <num_pairs> <vector_size> <output_file>" << endl;
+    cout << "    Same data as generate, as a header plus little-endian doubles;" << endl;
+    cout << "    binary files are detected by their header and memory-mapped" << endl;
+    cout << "\n  benchmark <data_file> <num_threads> <method> <runs> [queue_depth]" << endl;
     cout << "    Run benchmark on existing data file" << endl;
-    cout << "    method: sequential, sections" << endl;
-    cout << "\n  full <data_file> <runs>" << endl;
-    cout << "    Run full benchmark comparing all methods" << endl;
+    cout << "    method: sequential, sections, sections-spsc, pipeline, pipeline-mpmc" << endl;
+    cout << "    sections-spsc: sections with a lock-free SPSC ring instead of the locked queue" << endl;
+    cout << "    pipeline: 1 reader and num_threads - 1 compute workers sharing a" << endl;
+    cout << "            bounded queue of queue_depth pairs (default " << DEFAULT_QUEUE_DEPTH << ");" << endl;
+    cout << "            with 1 thread the reader computes every pair itself" << endl;
+    cout << "    pipeline-mpmc: pipeline with a lock-free MPMC ring (threads yield, not sleep)" << endl;
+    cout << "    runs:   N, or auto[:min[:max[:width]]] to repeat until the median's" << endl;
+    cout << "            95% CI is within width (e.g. auto:5:100:0.02)" << endl;
+    cout << "\n  queue-bench <ops> <vector_size> [consumers] [depth]" << endl;
+    cout << "    Queue ops/sec: locked queue vs condvar queue vs SPSC / MPMC rings" << endl;
+    cout << "    (1 producer; 1 and `consumers` consumers, default 4; ring depth default 64)" << endl;
+    cout << "\n  full <data_file> <runs> [other_format_file]" << endl;
+    cout << "    Run full benchmark comparing all methods; with the same data in the" << endl;
+    cout << "    other format, also compare text and binary input time" << endl;
+    cout << "    runs: as for benchmark" << endl;
     cout << "\n  verify <data_file>" << endl;
     cout << "    Verify correctness of parallel implementation" << endl;
+    cout << "\nEnvironment:" << endl;
+    cout << "  BENCH_TEXT_READER=stream|chunked" << endl;
+    cout << "    Text input backend for benchmark and full: ifstream >> (default) or" << endl;
+    cout << "    " << (TEXT_BLOCK_BYTES >> 20) << " MiB blocks read in the background into two alternating buffers" << endl;
     cout << "\nExamples:" << endl;
     cout << "  " << program_name << " generate 50 10000 vectors.txt" << endl;
+    cout << "  " << program_name << " generate-binary 50 10000 vectors.bin" << endl;
     cout << "  " << program_name << " full vectors.txt 5" << endl;
+    cout << "  " << program_name << " full vectors.txt 5 vectors.bin" << endl;
     cout << "  " << program_name << " benchmark vectors.txt 2 sections 10" << endl;
+    cout << "  " << program_name << " benchmark vectors.txt 8 pipeline 10 4" << endl;
+    cout << "  " << program_name << " queue-bench 100000 1000 4" << endl;
+    cout << "  BENCH_TEXT_READER=chunked " << program_name << " full vectors.txt 5" << endl;
     cout << "  " << program_name << " verify vectors.txt" << endl;
 }
 
@@ -502,6 +1694,19 @@ int main(int argc, char* argv[]) {
         
         generate_test_data(output_file, num_pairs, vector_size);
         
+    } else if (command == "generate-binary") {
+        if (argc < 5) {
+            cerr << "Error: Insufficient arguments for generate-binary" << endl;
+            print_usage(argv[0]);
+            return 1;
+        }
+        
+        int num_pairs = atoi(argv[2]);
+        int vector_size = atoi(argv[3]);
+        string output_file = argv[4];
+        
+        generate_binary_data(output_file, num_pairs, vector_size);
+        
     } else if (command == "benchmark") {
         if (argc < 6) {
             cerr << "Error: Insufficient arguments for benchmark" << endl;
@@ -512,28 +1717,89 @@ int main(int argc, char* argv[]) {
         string data_file = argv[2];
         int num_threads = atoi(argv[3]);
         string method = argv[4];
-        int runs = atoi(argv[5]);
+        run_plan plan;
+        if (run_plan_parse(argv[5], &plan) != 0) {
+            cerr << "Error: Invalid runs '" << argv[5] << "'" << endl;
+            return 1;
+        }
+        
+        TextReader text_reader;
+        if (numa_setup() != 0 || text_reader_setup(&text_reader) != 0) {
+            return 1;
+        }
         
         cout << "=== Vector Dot Products Benchmark ===" << endl;
         cout << "Data file: " << data_file << endl;
         cout << "Threads:   " << num_threads << endl;
         cout << "Method:    " << method << endl;
-        cout << "Runs:      " << runs << endl;
+        cout << "Runs:      " << argv[5] << endl;
+        cout << "Placement: " << numa_placement() << endl;
         
         BenchmarkResult result;
         if (method == "sequential") {
-            result = sequential_method(data_file, runs);
+            result = sequential_method(data_file, plan, text_reader);
         } else if (method == "sections") {
-            result = sections_method(data_file, num_threads, runs);
+            result = sections_method(data_file, num_threads, plan, text_reader);
+        } else if (method == "sections-spsc") {
+            result = sections_spsc_method(data_file, num_threads, plan, text_reader);
+        } else if (method == "pipeline" || method == "pipeline-mpmc") {
+            int queue_depth = (argc >= 7) ? atoi(argv[6]) : DEFAULT_QUEUE_DEPTH;
+            if (queue_depth <= 0) {
+                cerr << "Error: Invalid queue depth '" << argv[6] << "'" << endl;
+                return 1;
+            }
+            result = (method == "pipeline")
+                ? pipeline_method(data_file, num_threads, queue_depth, plan, text_reader)
+                : pipeline_mpmc_method(data_file, num_threads, queue_depth, plan, text_reader);
         } else {
             cerr << "Error: Invalid method" << endl;
             return 1;
         }
+        if (result.runs_used == 0) {
+            return 1;   // ошибка ввода уже выведена
+        }
         
         cout << "\nResults:" << endl;
+        cout << "  Input format: " << result.input_format << endl;
         cout << "  Total time:   " << fixed << setprecision(2) << result.total_time_ms << " ms" << endl;
-        cout << "  Input time:   " << result.input_time_ms << " ms" << endl;
+        cout << "  Input time:   " << result.input_time_ms << " ms ("
+             << input_rate(result) << " MB/s)" << endl;
         cout << "  Compute time: " << result.computation_time_ms << " ms" << endl;
+        cout << "  Runs used:    " << result.runs_used << " (median 95% CI: "
+             << result.ci_low_ms << " - " << result.ci_high_ms << " ms)" << endl;
+        if (method == "pipeline" || method == "pipeline-mpmc") {
+            cout << "  Queue depth:  " << result.queue_depth << endl;
+            cout << "  Reader utilization:  " << setprecision(1)
+                 << result.reader_utilization * 100.0 << "% (1 thread)" << endl;
+            cout << "  Worker utilization:  " << result.worker_utilization * 100.0 << "% (";
+            if (result.num_workers > 0) {
+                cout << result.num_workers << (result.num_workers == 1 ? " thread)" : " threads)") << endl;
+            } else {
+                cout << "no workers granted, the reader computed every pair)" << endl;
+            }
+        }
+        
+    } else if (command == "queue-bench") {
+        if (argc < 4) {
+            cerr << "Error: Insufficient arguments for queue-bench" << endl;
+            print_usage(argv[0]);
+            return 1;
+        }
+        
+        int ops = atoi(argv[2]);
+        int vector_size = atoi(argv[3]);
+        int consumers = (argc >= 5) ? atoi(argv[4]) : 4;
+        int depth = (argc >= 6) ? atoi(argv[5]) : 64;
+        if (ops <= 0 || vector_size < 0 || consumers <= 0 || depth <= 0) {
+            cerr << "Error: Invalid arguments for queue-bench" << endl;
+            return 1;
+        }
+        
+        if (numa_setup() != 0) {
+            return 1;
+        }
+        
+        queue_benchmark(ops, vector_size, consumers, depth);
         
     } else if (command == "full") {
         if (argc < 4) {
@@ -543,9 +1809,21 @@ int main(int argc, char* argv[]) {
         }
         
         string data_file = argv[2];
-        int runs = atoi(argv[3]);
+        run_plan plan;
+        if (run_plan_parse(argv[3], &plan) != 0) {
+            cerr << "Error: Invalid runs '" << argv[3] << "'" << endl;
+            return 1;
+        }
+        
+        TextReader text_reader;
+        if (numa_setup() != 0 || text_reader_setup(&text_reader) != 0) {
+            return 1;
+        }
         
-        full_benchmark(data_file, runs);
+        cout << "Placement: " << numa_placement() << endl;
+        if (!full_benchmark(data_file, plan, argc >= 5 ? argv[4] : "", text_reader)) {
+            return 1;
+        }
         
     } else if (command == "verify") {
         if (argc < 3) {
@@ -4,11 +4,25 @@ Analysis script for Task 9: Nested Parallelism benchmarks
 Processes CSV results and generates summary statistics
 """
 
-import pandas as pd
 import sys
 import os
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from benchkit import Schema, summarize
+from benchkit.lazy import lazy_import
+from benchkit.placement import print_placement_summary
+
+pd = lazy_import('pandas')
+
+TASK_SCHEMA = Schema(
+    keys=['N', 'num_threads', 'outer_threads', 'inner_threads', 'method'],
+    baseline={'method': 'sequential'},
+    baseline_on=['N'],
+    names={'mean': 'mean_time', 'median': 'median_time', 'std': 'std_time',
+           'min': 'min_time', 'max': 'max_time', 'count': 'runs'},
+)
+
 def analyze_results(csv_file):
     """Analyze benchmark results from CSV file"""
     
@@ -25,45 +39,11 @@ def analyze_results(csv_file):
     print(f"Methods: {df['method'].unique()}")
     print(f"Thread counts: {sorted(df['num_threads'].unique())}")
     
-    # Group by configuration and calculate statistics
-    grouped = df.groupby(['N', 'num_threads', 'outer_threads', 'inner_threads', 'method'])
+    # Per-configuration statistics with speedup relative to sequential
+    results_df = summarize(df, TASK_SCHEMA)
     
-    stats = grouped['execution_time_ms'].agg(['mean', 'std', 'min', 'max', 'count']).reset_index()
-    stats.columns = ['N', 'num_threads', 'outer_threads', 'inner_threads', 'method', 
-                     'mean_time', 'std_time', 'min_time', 'max_time', 'runs']
-    
-    # Calculate speedup relative to sequential
-    results = []
-    
-    for size in stats['N'].unique():
-        size_data = stats[stats['N'] == size].copy()
-        
-        # Get sequential baseline
-        seq_time = size_data[size_data['method'] == 'sequential']['mean_time'].values
-        if len(seq_time) == 0:
-            print(f"Warning: No sequential baseline for size {size}")
-            continue
-        seq_time = seq_time[0]
-        
-        # Calculate speedup and efficiency for each configuration
-        for idx, row in size_data.iterrows():
-            speedup = seq_time / row['mean_time']
-            efficiency = speedup / row['num_threads'] if row['num_threads'] > 0 else 0
-            
-            results.append({
-                'N': row['N'],
-                'num_threads': row['num_threads'],
-                'outer_threads': row['outer_threads'],
-                'inner_threads': row['inner_threads'],
-                'method': row['method'],
-                'mean_time': row['mean_time'],
-                'std_time': row['std_time'],
-                'speedup': speedup,
-                'efficiency': efficiency,
-                'runs': row['runs']
-            })
-    
-    results_df = pd.DataFrame(results)
+    for size in sorted(set(df['N']) - set(results_df['N'])):
+        print(f"Warning: No sequential baseline for size {size}")
     
     # Save processed results
     output_file = csv_file.replace('.csv', '_processed.csv')
@@ -171,6 +151,8 @@ def analyze_results(csv_file):
             print(f"  Speedup: {row['speedup']:.2f}x")
             print(f"  Efficiency: {row['efficiency']:.2%}")
     
+    print_placement_summary(results_df, 'num_threads')
+    
     print("\n" + "=" * 60)
     print("Analysis Complete!")
     print("=" * 60)
@@ -4,13 +4,25 @@ Graph generation script for Task 9: Nested Parallelism
 Creates visualization of flat vs nested parallelism performance
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
 import sys
 import os
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from benchkit.lazy import lazy_import
+from benchkit.placement import plot_placement_speedup
+from benchkit.render import Job, parse_options, per_placement, render, split
+
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+
+def set_style(plt):
+    plt.style.use('seaborn-v0_8-darkgrid')
+
+plt = lazy_import('matplotlib.pyplot', setup=set_style)
+
+COLORS = {'sequential': 'gray', 'flat': 'blue', 'nested': 'red'}
+
 def find_latest_processed_csv(results_dir):
     """Find the most recent processed CSV file"""
     csv_files = list(Path(results_dir).glob("*_processed.csv"))
@@ -18,26 +30,10 @@ def find_latest_processed_csv(results_dir):
         return None
     return max(csv_files, key=os.path.getctime)
 
-def plot_graphs(csv_file, output_dir):
-    """Generate all graphs from processed results"""
-    
-    print("=" * 60)
-    print("Task 9: Nested Parallelism - Graph Generation")
-    print("=" * 60)
-    print(f"\nReading data from: {csv_file}")
-    
-    df = pd.read_csv(csv_file)
-    
-    # Create output directory
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Set style
-    plt.style.use('seaborn-v0_8-darkgrid')
-    colors = {'sequential': 'gray', 'flat': 'blue', 'nested': 'red'}
-    
+def plot_execution_time(df, output_dir):
+    """Execution time comparison for each size"""
     sizes = sorted(df['N'].unique())
     
-    # 1. Execution time comparison for each size
     for size in sizes:
         size_data = df[df['N'] == size]
         
@@ -47,7 +43,7 @@ def plot_graphs(csv_file, output_dir):
             method_data = size_data[size_data['method'] == method].sort_values('num_threads')
             if not method_data.empty:
                 ax.plot(method_data['num_threads'], method_data['mean_time'],
-                       marker='o', label=method.capitalize(), color=colors[method],
+                       marker='o', label=method.capitalize(), color=COLORS[method],
                        linewidth=2, markersize=8)
         
         ax.set_xlabel('Number of Threads', fontsize=12)
@@ -62,8 +58,11 @@ def plot_graphs(csv_file, output_dir):
         plt.savefig(filename, dpi=300, bbox_inches='tight')
         plt.close()
         print(f"✓ Created: {filename}")
+
+def plot_speedup(df, output_dir):
+    """Speedup comparison for each size"""
+    sizes = sorted(df['N'].unique())
     
-    # 2. Speedup comparison for each size
     for size in sizes:
         size_data = df[df['N'] == size]
         
@@ -79,7 +78,7 @@ def plot_graphs(csv_file, output_dir):
             method_data = size_data[size_data['method'] == method].sort_values('num_threads')
             if not method_data.empty:
                 ax.plot(method_data['num_threads'], method_data['speedup'],
-                       marker='o', label=method.capitalize(), color=colors[method],
+                       marker='o', label=method.capitalize(), color=COLORS[method],
                        linewidth=2, markersize=8)
         
         ax.set_xlabel('Number of Threads', fontsize=12)
@@ -93,8 +92,11 @@ def plot_graphs(csv_file, output_dir):
         plt.savefig(filename, dpi=300, bbox_inches='tight')
         plt.close()
         print(f"✓ Created: {filename}")
+
+def plot_efficiency(df, output_dir):
+    """Efficiency comparison for each size"""
+    sizes = sorted(df['N'].unique())
     
-    # 3. Efficiency comparison for each size
     for size in sizes:
         size_data = df[df['N'] == size]
         
@@ -108,7 +110,7 @@ def plot_graphs(csv_file, output_dir):
             method_data = size_data[size_data['method'] == method].sort_values('num_threads')
             if not method_data.empty:
                 ax.plot(method_data['num_threads'], method_data['efficiency'],
-                       marker='o', label=method.capitalize(), color=colors[method],
+                       marker='o', label=method.capitalize(), color=COLORS[method],
                        linewidth=2, markersize=8)
         
         ax.set_xlabel('Number of Threads', fontsize=12)
@@ -123,8 +125,11 @@ def plot_graphs(csv_file, output_dir):
         plt.savefig(filename, dpi=300, bbox_inches='tight')
         plt.close()
         print(f"✓ Created: {filename}")
+
+def plot_flat_vs_nested(df, output_dir):
+    """Comparison: Flat vs Nested (all sizes)"""
+    sizes = sorted(df['N'].unique())
     
-    # 4. Comparison: Flat vs Nested (all sizes)
     fig, axes = plt.subplots(1, 3, figsize=(18, 6))
     
     for idx, size in enumerate(sizes):
@@ -150,8 +155,8 @@ def plot_graphs(csv_file, output_dir):
         x = np.arange(len(threads))
         width = 0.35
         
-        ax.bar(x - width/2, flat_times, width, label='Flat', color=colors['flat'], alpha=0.8)
-        ax.bar(x + width/2, nested_times, width, label='Nested', color=colors['nested'], alpha=0.8)
+        ax.bar(x - width/2, flat_times, width, label='Flat', color=COLORS['flat'], alpha=0.8)
+        ax.bar(x + width/2, nested_times, width, label='Nested', color=COLORS['nested'], alpha=0.8)
         
         ax.set_xlabel('Number of Threads', fontsize=11)
         ax.set_ylabel('Execution Time (ms)', fontsize=11)
@@ -168,8 +173,11 @@ def plot_graphs(csv_file, output_dir):
     plt.savefig(filename, dpi=300, bbox_inches='tight')
     plt.close()
     print(f"✓ Created: {filename}")
+
+def plot_speedup_comparison_all(df, output_dir):
+    """Speedup comparison across sizes"""
+    sizes = sorted(df['N'].unique())
     
-    # 5. Speedup comparison across sizes
     fig, ax = plt.subplots(figsize=(14, 8))
     
     markers = ['o', 's', '^']
@@ -202,8 +210,11 @@ def plot_graphs(csv_file, output_dir):
     plt.savefig(filename, dpi=300, bbox_inches='tight')
     plt.close()
     print(f"✓ Created: {filename}")
+
+def create_summary_table(df, output_dir):
+    """Summary table"""
+    sizes = sorted(df['N'].unique())
     
-    # 6. Create summary table
     summary_file = f"{output_dir}/summary_table.txt"
     with open(summary_file, 'w') as f:
         f.write("=" * 80 + "\n")
@@ -232,6 +243,35 @@ def plot_graphs(csv_file, output_dir):
             f.write("\n")
     
     print(f"✓ Created: {summary_file}")
+
+def plot_graphs(csv_file, output_dir, options=None):
+    """Generate all graphs from processed results"""
+    
+    print("=" * 60)
+    print("Task 9: Nested Parallelism - Graph Generation")
+    print("=" * 60)
+    print(f"\nReading data from: {csv_file}")
+    
+    df = pd.read_csv(csv_file)
+    
+    # Create output directory
+    os.makedirs(output_dir, exist_ok=True)
+    
+    # Everything but the placement comparison is drawn once per placement policy
+    def policy_jobs(directory, where):
+        return [
+            *split(df, plot_execution_time, 'N', directory, where=where),
+            *split(df, plot_speedup, 'N', directory, where=where),
+            *split(df, plot_efficiency, 'N', directory, where=where),
+            Job(plot_flat_vs_nested, directory, where=where),
+            Job(plot_speedup_comparison_all, directory, where=where),
+            Job(create_summary_table, directory, where=where),
+        ]
+    
+    render([
+        *per_placement(df, output_dir, policy_jobs),
+        Job(plot_placement_speedup, output_dir, 'num_threads'),
+    ], df, options, output_dir)
     
     print("\n" + "=" * 60)
     print("Graph Generation Complete!")
@@ -246,6 +286,7 @@ def plot_graphs(csv_file, output_dir):
     print("  - summary_table.txt")
 
 if __name__ == "__main__":
+    options = parse_options()
     script_dir = Path(__file__).parent
     results_dir = script_dir.parent / "results"
     graphs_dir = script_dir.parent / "graphs"
@@ -264,4 +305,4 @@ if __name__ == "__main__":
         print(f"Error: File not found: {csv_file}")
         sys.exit(1)
     
-    plot_graphs(csv_file, str(graphs_dir))
+    plot_graphs(csv_file, str(graphs_dir), options)
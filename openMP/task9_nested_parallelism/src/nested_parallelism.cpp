@@ -7,19 +7,24 @@
 #include <omp.h>
 #include <cmath>
 #include <string>
-#include <random>
 #include <limits>
 
+#include "../../common/bench_numa.h"
+#include "../../common/bench_rng.h"
+#include "../../common/bench_runs.h"
+
 using Matrix = std::vector<std::vector<double>>;
 
-Matrix generate_matrix(int N, int seed = 42) {
-    Matrix matrix(N, std::vector<double>(N));
-    std::mt19937 gen(seed);
-    std::uniform_real_distribution<> dis(-100.0, 100.0);
+// Rows are allocated and filled by the thread that owns them under a
+// static row partition; values depend only on (seed, i, j)
+Matrix generate_matrix(int N, int seed = 42, int num_threads = 1) {
+    Matrix matrix(N);
     
+    #pragma omp parallel for schedule(static) num_threads(num_threads)
     for (int i = 0; i < N; ++i) {
+        matrix[i].resize(N);
         for (int j = 0; j < N; ++j) {
-            matrix[i][j] = dis(gen);
+            matrix[i][j] = rng_uniform(seed, (unsigned long long)i * N + j, -100.0, 100.0);
         }
     }
     
@@ -92,12 +97,15 @@ struct BenchmarkResult {
     double execution_time;
     double result_value;
     int iteration;
+    int runs_used;
+    double ci_low_ms;
+    double ci_high_ms;
 };
 
 std::vector<BenchmarkResult> run_benchmark(const Matrix& matrix,
                                            int num_threads,
                                            const std::string& method,
-                                           int iterations,
+                                           const run_plan& plan,
                                            int outer_threads = 0,
                                            int inner_threads = 0) {
     std::vector<BenchmarkResult> results;
@@ -110,7 +118,10 @@ std::vector<BenchmarkResult> run_benchmark(const Matrix& matrix,
         maximin_nested(matrix, outer_threads, inner_threads);
     }
     
-    for (int iter = 0; iter < iterations; ++iter) {
+    run_series series;
+    run_series_init(&series, &plan);
+    
+    for (int iter = 0; !run_series_done(&series); ++iter) {
         double result = 0.0;
         double execution_time = 0.0;
         
@@ -126,6 +137,7 @@ std::vector<BenchmarkResult> run_benchmark(const Matrix& matrix,
         
         auto end = std::chrono::high_resolution_clock::now();
         execution_time = std::chrono::duration<double, std::milli>(end - start).count();
+        run_series_add(&series, execution_time);
         
         BenchmarkResult bench_result;
         bench_result.N = N;
@@ -140,6 +152,13 @@ std::vector<BenchmarkResult> run_benchmark(const Matrix& matrix,
         results.push_back(bench_result);
     }
     
+    for (auto& result : results) {
+        result.runs_used = series.count;
+        result.ci_low_ms = series.ci_low;
+        result.ci_high_ms = series.ci_high;
+    }
+    run_series_free(&series);
+    
     return results;
 }
 
@@ -244,7 +263,8 @@ int main(int argc, char* argv[]) {
         std::cerr << "  N           - matrix size (NxN)" << std::endl;
         std::cerr << "  num_threads - total number of threads (for flat) or outer_threads:inner_threads (for nested)" << std::endl;
         std::cerr << "  method      - sequential, flat, nested" << std::endl;
-        std::cerr << "  iterations  - number of runs for averaging" << std::endl;
+        std::cerr << "  iterations  - number of runs, or auto[:min[:max[:width]]] to repeat until" << std::endl;
+        std::cerr << "                the median's 95% CI is within width (e.g. auto:5:100:0.02)" << std::endl;
         std::cerr << "\nExamples:" << std::endl;
         std::cerr << "  " << argv[0] << " 1000 4 flat 10" << std::endl;
         std::cerr << "  " << argv[0] << " 1000 2:2 nested 10" << std::endl;
@@ -255,9 +275,18 @@ int main(int argc, char* argv[]) {
     int N = std::stoi(argv[1]);
     std::string threads_str = argv[2];
     std::string method = argv[3];
-    int iterations = std::stoi(argv[4]);
     std::string output_file = (argc > 5) ? argv[5] : "";
     
+    run_plan plan;
+    if (run_plan_parse(argv[4], &plan) != 0) {
+        std::cerr << "Error: Invalid iterations '" << argv[4] << "'" << std::endl;
+        return 1;
+    }
+    
+    if (numa_setup() != 0) {
+        return 1;
+    }
+    
     if (method != "sequential" && method != "flat" && method != "nested") {
         std::cerr << "Error: Invalid method '" << method << "'" << std::endl;
         return 1;
@@ -288,7 +317,8 @@ int main(int argc, char* argv[]) {
     }
     
     std::cout << "\nGenerating " << N << "x" << N << " matrix..." << std::endl;
-    Matrix matrix = generate_matrix(N);
+    // Rows are split across the outer team in the nested method
+    Matrix matrix = generate_matrix(N, 42, method == "nested" ? outer_threads : num_threads);
     std::cout << "Matrix generated." << std::endl;
     
     std::cout << "\nRunning benchmark..." << std::endl;
@@ -299,7 +329,7 @@ int main(int argc, char* argv[]) {
         std::cout << "Method: " << method << " (threads=" << num_threads << ")" << std::endl;
     }
     
-    auto results = run_benchmark(matrix, num_threads, method, iterations, outer_threads, inner_threads);
+    auto results = run_benchmark(matrix, num_threads, method, plan, outer_threads, inner_threads);
     
     double sum_time = 0.0;
     double min_time = results[0].execution_time;
@@ -324,7 +354,7 @@ int main(int argc, char* argv[]) {
         if (out.is_open()) {
             out.seekp(0, std::ios::end);
             if (out.tellp() == 0) {
-                out << "N,num_threads,outer_threads,inner_threads,method,iteration,execution_time_ms,result_value" << std::endl;
+                out << "N,num_threads,outer_threads,inner_threads,method,iteration,execution_time_ms,result_value,runs_used,ci_low_ms,ci_high_ms,placement" << std::endl;
             }
             
             for (const auto& result : results) {
@@ -335,7 +365,10 @@ int main(int argc, char* argv[]) {
                     << result.method << ","
                     << result.iteration << ","
                     << std::fixed << std::setprecision(6) << result.execution_time << ","
-                    << std::scientific << std::setprecision(15) << result.result_value << std::endl;
+                    << std::scientific << std::setprecision(15) << result.result_value << ","
+                    << result.runs_used << ","
+                    << std::fixed << std::setprecision(6) << result.ci_low_ms << ","
+                    << result.ci_high_ms << "," << numa_placement() << std::endl;
             }
             out.close();
         }